@@ -0,0 +1 @@
+"""Performance benchmarks for the LIFX Ceiling integration hot paths."""
@@ -0,0 +1,97 @@
+"""
+Run the LIFX Ceiling benchmarks.
+
+Usage: python -m benchmarks [--filter TEXT] [--save] [--compare [FILE]]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from .cases import all_cases
+from .runner import (
+    RESULTS_DIR,
+    compare,
+    integration_version,
+    latest_results_file,
+    load_results,
+    measure,
+    save_results,
+)
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def main() -> int:
+    """Run the benchmarks and return the process exit code."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store results as benchmarks/results/<version>.json",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const="latest",
+        help="compare medians with a results file (default: latest stored)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown treated as a regression (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for name, func in all_cases(loop):
+            if args.filter not in name:
+                continue
+            results[name] = result = measure(func)
+            print(  # noqa: T201
+                f"{name:<48} {result['median']:>10.2f} us"
+                f"  (min {result['min']:.2f}, {result['loops']} loops)"
+            )
+    finally:
+        loop.close()
+
+    output = RESULTS_DIR / f"{integration_version()}.json"
+    if args.save:
+        save_results(results, output)
+        print(f"Saved results to {output}")  # noqa: T201
+
+    if args.compare is None:
+        return 0
+
+    baseline_file = (
+        latest_results_file(exclude=output if args.save else None)
+        if args.compare == "latest"
+        else Path(args.compare)
+    )
+    if baseline_file is None:
+        print("No stored results to compare against")  # noqa: T201
+        return 0
+
+    print(f"\nCompared with {baseline_file.name}:")  # noqa: T201
+    regressed = False
+    for name, before, after, change, slower in compare(
+        load_results(baseline_file), results, args.threshold
+    ):
+        regressed |= slower
+        print(  # noqa: T201
+            f"{name:<48} {before:>10.2f} -> {after:>10.2f} us"
+            f" {change:>+8.1%}{'  REGRESSION' if slower else ''}"
+        )
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+"""Benchmark cases for the LIFX Ceiling hot paths."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from contextlib import suppress
+from functools import partial
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_HS_COLOR
+from homeassistant.const import ATTR_DEVICE_ID
+
+from benchmarks.emulator import LIFXCeilingEmulator
+from custom_components.lifx_ceiling import api
+from custom_components.lifx_ceiling.api import LIFXCeiling
+from custom_components.lifx_ceiling.const import (
+    ATTR_DOWNLIGHT,
+    ATTR_DOWNLIGHT_BRIGHTNESS,
+    ATTR_DOWNLIGHT_HUE,
+    ATTR_DOWNLIGHT_SATURATION,
+    ATTR_UPLIGHT,
+    ATTR_UPLIGHT_BRIGHTNESS,
+    GRADIENT_TYPES,
+)
+from custom_components.lifx_ceiling.coordinator import (
+    LIFXCeilingStateDispatcher,
+    LIFXCeilingUpdateCoordinator,
+)
+from custom_components.lifx_ceiling.effects import EFFECTS, LIFXCeilingEffectEngine
+from custom_components.lifx_ceiling.gradient import (
+    gradient_positions,
+    render_gradient,
+)
+from custom_components.lifx_ceiling.util import async_execute_lifx, hsbk_for_turn_on
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from aiolifx.message import Message
+
+CEILING_64_PRODUCT = 176
+CEILING_128_PRODUCT = 201
+DOWNLIGHT_COLOR = (1000, 2000, 30000, 3500)
+UPLIGHT_COLOR = (4000, 5000, 6000, 6500)
+ACKNOWLEDGEMENT = object()
+
+Case = tuple[str, "Callable[[], object]"]
+
+
+class FakeTransport:
+    """
+    Acknowledge LIFX requests on the next event loop iteration.
+
+    A seeded random generator drops the configured share of requests so lossy
+    runs exercise the retry path while staying reproducible.
+    """
+
+    def __init__(self, loss: float = 0.0, seed: int = 0) -> None:
+        """Initialise the transport."""
+        self.loss = loss
+        self.sent = 0
+        self._random = random.Random(seed)  # noqa: S311
+
+    def send(
+        self,
+        *_args: Any,
+        callb: Callable[[object, Message | None], None] | None = None,
+        **_kwargs: Any,
+    ) -> None:
+        """Record a request and schedule its ack unless it is dropped."""
+        self.sent += 1
+        if callb is None or self._random.random() < self.loss:
+            return
+        asyncio.get_running_loop().call_soon(callb, self, ACKNOWLEDGEMENT)
+
+
+def make_ceiling(
+    product: int, transport: FakeTransport | None = None, mac_addr: str = ""
+) -> LIFXCeiling:
+    """Create a ceiling with cached zones, acknowledged by a fake transport."""
+    transport = transport or FakeTransport()
+    ceiling = object.__new__(LIFXCeiling)
+    ceiling.mac_addr = mac_addr or f"d0:73:d5:00:{product >> 8:02x}:{product & 255:02x}"
+    ceiling.product = product
+    ceiling.power_level = 65535
+    ceiling.tile_device_width = 8 if product == CEILING_64_PRODUCT else 16
+    ceiling.set64 = transport.send
+    ceiling.copy_frame_buffer = transport.send
+    ceiling.set_power = transport.send
+    ceiling.chain = {0: [DOWNLIGHT_COLOR] * (ceiling.total_zones - 1) + [UPLIGHT_COLOR]}
+    return ceiling
+
+
+def hsbk_cases() -> Iterator[Case]:
+    """Benchmark turn_on argument conversion."""
+    current = (1000, 2000, 3000, 3500)
+    yield (
+        "hsbk_for_turn_on[hs_brightness]",
+        lambda: hsbk_for_turn_on(
+            current, **{ATTR_HS_COLOR: (120.0, 50.0), ATTR_BRIGHTNESS: 128}
+        ),
+    )
+    yield (
+        "hsbk_for_turn_on[kelvin]",
+        lambda: hsbk_for_turn_on(current, color_temp_kelvin=2700),
+    )
+
+
+def gradient_cases() -> Iterator[Case]:
+    """Benchmark rendering set_zones gradients across a 128-zone layout."""
+    stops = [
+        (0.0, (0, 65535, 65535, 3500)),
+        (0.5, (21845, 65535, 40000, 3500)),
+        (1.0, (43690, 65535, 65535, 3500)),
+    ]
+    for gradient in GRADIENT_TYPES:
+        positions = gradient_positions(gradient, 16, 128, 45.0)
+        yield (
+            f"render_gradient[{gradient}-128]",
+            partial(render_gradient, stops, positions),
+        )
+
+
+def effect_cases() -> Iterator[Case]:
+    """Benchmark rendering and streaming one effect frame on a 128-zone ceiling."""
+    ceiling = _unpaced(make_ceiling(CEILING_128_PRODUCT))
+    ceiling.source_id = 0
+    ceiling.transport = SimpleNamespace(sendto=_noop)
+    for name, effect_class in EFFECTS.items():
+        effect = effect_class(ceiling, ceiling.zone_buffer(), 0.0)
+        elapsed = iter(range(1_000_000_000))
+
+        def _frame(effect: Any = effect, elapsed: Iterator[int] = elapsed) -> None:
+            frame = ceiling.zone_buffer()
+            effect.render(frame, next(elapsed) / 6)
+            ceiling.stream_frame(frame, 1 / 6)
+
+        yield f"effect_frame[{name}-128]", _frame
+
+
+def _read_entity_properties(ceiling: LIFXCeiling) -> tuple[object, ...]:
+    """Read every property the light entities use on a coordinator update."""
+    return (
+        ceiling.uplight_is_on,
+        ceiling.uplight_brightness,
+        ceiling.uplight_hs_color,
+        ceiling.uplight_kelvin,
+        ceiling.downlight_is_on,
+        ceiling.downlight_brightness,
+        ceiling.downlight_hs_color,
+        ceiling.downlight_kelvin,
+    )
+
+
+def property_cases() -> Iterator[Case]:
+    """Benchmark the derived uplight and downlight properties."""
+    for product, zones in ((CEILING_64_PRODUCT, 64), (CEILING_128_PRODUCT, 128)):
+        ceiling = make_ceiling(product)
+
+        def _cold(ceiling: LIFXCeiling = ceiling) -> tuple[object, ...]:
+            ceiling.invalidate_zone_summary()
+            return _read_entity_properties(ceiling)
+
+        yield f"entity_properties[{zones}-cold]", _cold
+        yield (
+            f"entity_properties[{zones}-warm]",
+            partial(_read_entity_properties, ceiling),
+        )
+
+
+def dispatch_cases() -> Iterator[Case]:
+    """Benchmark a core coordinator update reaching both lights of a ceiling."""
+    for product, zones in ((CEILING_64_PRODUCT, 64), (CEILING_128_PRODUCT, 128)):
+        ceiling = make_ceiling(product)
+        dispatcher = LIFXCeilingStateDispatcher(
+            ceiling, LIFXCeilingEffectEngine(MagicMock())
+        )
+        dispatcher.add(ATTR_DOWNLIGHT, _noop)
+        dispatcher.add(ATTR_UPLIGHT, _noop)
+        frames = [
+            [*ceiling.chain[0][:-1], UPLIGHT_COLOR],
+            [*ceiling.chain[0][:-1], DOWNLIGHT_COLOR],
+        ]
+
+        def _unchanged(
+            ceiling: LIFXCeiling = ceiling,
+            dispatcher: LIFXCeilingStateDispatcher = dispatcher,
+        ) -> None:
+            # A poll replaces the cached zones with an equal but new list.
+            ceiling.chain[0] = list(ceiling.chain[0])
+            ceiling.invalidate_zone_summary()
+            dispatcher.async_dispatch()
+
+        def _changed(
+            ceiling: LIFXCeiling = ceiling,
+            dispatcher: LIFXCeilingStateDispatcher = dispatcher,
+            frames: list = frames,
+        ) -> None:
+            frames.reverse()
+            ceiling.chain[0] = list(frames[0])
+            ceiling.invalidate_zone_summary()
+            dispatcher.async_dispatch()
+
+        yield f"core_update[{zones}-unchanged]", _unchanged
+        yield f"core_update[{zones}-uplight-changed]", _changed
+
+
+def set64_cases(loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """Benchmark set64 frame construction with the transport stubbed out."""
+
+    async def _no_transport(*_args: Any, **_kwargs: Any) -> list[Message]:
+        return []
+
+    for product, zones in ((CEILING_64_PRODUCT, 64), (CEILING_128_PRODUCT, 128)):
+        ceiling = make_ceiling(product)
+        colors = [(20000, 65535, 40000, 3500)] * zones
+        single = list(ceiling.chain[0])
+        single[5] = (20000, 65535, 40000, 3500)
+
+        def _full(ceiling: LIFXCeiling = ceiling, colors: list = colors) -> None:
+            ceiling.chain[0] = [DOWNLIGHT_COLOR] * len(colors)
+            with patch.object(api, "async_execute_lifx", _no_transport):
+                loop.run_until_complete(ceiling.async_set64(colors, power_on=True))
+
+        def _single(ceiling: LIFXCeiling = ceiling, colors: list = single) -> None:
+            ceiling.chain[0] = [DOWNLIGHT_COLOR] * len(colors)
+            with patch.object(api, "async_execute_lifx", _no_transport):
+                loop.run_until_complete(ceiling.async_set64(colors))
+
+        def _unchanged(ceiling: LIFXCeiling = ceiling, colors: list = colors) -> None:
+            ceiling.chain[0] = list(colors)
+            with patch.object(api, "async_execute_lifx", _no_transport):
+                loop.run_until_complete(ceiling.async_set64(colors))
+
+        yield f"async_set64[{zones}-full-frame]", _full
+        yield f"async_set64[{zones}-single-zone]", _single
+        yield f"async_set64[{zones}-unchanged]", _unchanged
+
+    ceiling = make_ceiling(CEILING_128_PRODUCT)
+    del ceiling.set64
+    ceiling.set64_packed = _noop
+    request = {"fb_index": 1, "colors": [(20000, 65535, 40000, 3500)] * 64}
+
+    def _pack_cold(ceiling: LIFXCeiling = ceiling) -> None:
+        api.packed_set64_payload.cache_clear()
+        ceiling.set64(**request)
+
+    yield "set64_payload[cold]", _pack_cold
+    yield "set64_payload[cached]", partial(ceiling.set64, **request)
+
+
+def execute_cases(loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """Benchmark the retrying send path against a fake transport."""
+    for loss in (0.0, 0.1):
+        transport = FakeTransport(loss=loss)
+
+        def _execute(transport: FakeTransport = transport) -> None:
+            methods = [partial(transport.send, fb_index=1) for _ in range(3)]
+            methods.append(partial(transport.send, fb_index=0))
+            # A packet lost on every attempt surfaces as a timeout, as it would
+            # on a real network.
+            with suppress(TimeoutError):
+                loop.run_until_complete(
+                    async_execute_lifx(methods, attempts=3, overall_timeout=0.03)
+                )
+
+        yield f"async_execute_lifx[4-packets-{loss:.0%}-loss]", _execute
+
+
+def set_state_cases(loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """Benchmark the set_state service across several ceilings."""
+    for count in (1, 12, 48):
+        devices = {
+            f"device-{index}": make_ceiling(
+                CEILING_128_PRODUCT if index % 2 else CEILING_64_PRODUCT,
+                mac_addr=f"d0:73:d5:00:00:{index:02x}",
+            )
+            for index in range(count)
+        }
+        coordinator = LIFXCeilingUpdateCoordinator(
+            MagicMock(), SimpleNamespace(entry_id="bench", async_on_unload=MagicMock())
+        )
+        # Service calls resolve targets from the device ID cache once warm.
+        coordinator._device_ceilings.update(devices)  # noqa: SLF001
+        call = SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: list(devices),
+                ATTR_DOWNLIGHT_HUE: 120,
+                ATTR_DOWNLIGHT_SATURATION: 50,
+                ATTR_DOWNLIGHT_BRIGHTNESS: 80,
+                ATTR_UPLIGHT_BRIGHTNESS: 40,
+            }
+        )
+
+        def _set_state(
+            coordinator: LIFXCeilingUpdateCoordinator = coordinator,
+            devices: dict[str, LIFXCeiling] = devices,
+            call: SimpleNamespace = call,
+        ) -> None:
+            for device in devices.values():
+                device.chain[0] = [DOWNLIGHT_COLOR] * device.total_zones
+            with patch.object(coordinator, "_async_state_written", _noop):
+                loop.run_until_complete(coordinator.async_set_state(call))
+
+        yield f"async_set_state[{count}-devices]", _set_state
+
+
+def emulator_cases(loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """Benchmark async_set64 end to end against the UDP ceiling emulator."""
+    for product, zones in ((CEILING_64_PRODUCT, 64), (CEILING_128_PRODUCT, 128)):
+        emulator = LIFXCeilingEmulator(product)
+        ceiling = _unpaced(loop.run_until_complete(emulator.async_connect()))
+        frames = [[(hue, 65535, 40000, 3500)] * zones for hue in (0, 21845, 43690)]
+
+        def _set64(ceiling: LIFXCeiling = ceiling, frames: list = frames) -> None:
+            frames.append(frames.pop(0))
+            loop.run_until_complete(ceiling.async_set64(frames[0]))
+
+        yield f"emulator_set64[{zones}-full-frame]", _set64
+
+    emulator = LIFXCeilingEmulator(CEILING_128_PRODUCT)
+    ceiling = _unpaced(loop.run_until_complete(emulator.async_connect()))
+    scenes = [
+        (colors, ceiling.pack_frame(colors))
+        for colors in ([(hue, 65535, 40000, 3500)] * 128 for hue in (0, 21845))
+    ]
+
+    def _scene(scenes: list = scenes) -> None:
+        scenes.append(scenes.pop(0))
+        loop.run_until_complete(ceiling.async_show_packed(*scenes[0]))
+
+    def _preloaded(scene: tuple = scenes[0]) -> None:
+        loop.run_until_complete(ceiling.async_show_packed(*scene))
+
+    yield "emulator_scene[128-packed]", _scene
+    yield "emulator_scene[128-preloaded]", _preloaded
+
+
+def _unpaced(ceiling: LIFXCeiling) -> LIFXCeiling:
+    """Lift a ceiling's send rate limit so back to back runs measure the host."""
+    ceiling.limiter.rate = 1e6
+    ceiling.limiter.burst = 1000
+    return ceiling
+
+
+def _noop(*_args: Any, **_kwargs: Any) -> None:
+    """Ignore the call."""
+
+
+def all_cases(loop: asyncio.AbstractEventLoop) -> Iterator[Case]:
+    """Yield every benchmark case."""
+    yield from hsbk_cases()
+    yield from gradient_cases()
+    yield from effect_cases()
+    yield from property_cases()
+    yield from dispatch_cases()
+    yield from set64_cases(loop)
+    yield from execute_cases(loop)
+    yield from set_state_cases(loop)
+    yield from emulator_cases(loop)
@@ -0,0 +1,260 @@
+"""In-process LIFX Ceiling emulator speaking the LAN protocol over UDP."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import struct
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from custom_components.lifx_ceiling.api import LIFXCeiling
+from custom_components.lifx_ceiling.const import (
+    LIFX_CEILING_64ZONES_PRODUCT_IDS,
+    LIFX_CEILING_128ZONES_PRODUCT_IDS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+HEADER = struct.Struct("<HHI6s2x6xBBQHH")
+HEADER_SIZE = HEADER.size
+PROTOCOL_FLAGS = 0x1400  # protocol 1024, addressable
+HSBK = struct.Struct("<4H")
+
+SET_POWER = 21
+ACKNOWLEDGEMENT = 45
+LIGHT_GET_POWER = 116
+LIGHT_SET_POWER = 117
+LIGHT_STATE_POWER = 118
+TILE_GET64 = 707
+TILE_STATE64 = 711
+TILE_SET64 = 715
+TILE_COPY_FRAME_BUFFER = 716
+
+TILE_HEIGHT = 8
+FRAME_BUFFERS = 2
+BLACK = (0, 0, 0, 3500)
+
+Color = tuple[int, int, int, int]
+
+
+class LIFXCeilingEmulator(asyncio.DatagramProtocol):
+    """
+    Emulate a LIFX Ceiling on a localhost UDP socket.
+
+    The emulator keeps the visible and off-screen framebuffers and the power
+    level, acknowledges set64, copy_frame_buffer and set power requests, and
+    answers get64 and get power. Each request is delayed by latency plus a
+    uniformly distributed jitter, and dropped with the given loss probability,
+    so retries and timeouts can be exercised without hardware.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        product: int = 176,
+        *,
+        mac_addr: str = "d0:73:d5:00:00:01",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialise the emulated ceiling."""
+        if product in LIFX_CEILING_64ZONES_PRODUCT_IDS:
+            self.width = 8
+        elif product in LIFX_CEILING_128ZONES_PRODUCT_IDS:
+            self.width = 16
+        else:
+            msg = f"Product {product} is not a LIFX Ceiling"
+            raise ValueError(msg)
+
+        self.product = product
+        self.mac_addr = mac_addr
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.power_level = 0
+        self.framebuffers: list[list[Color]] = [
+            [BLACK] * self.total_zones for _ in range(FRAME_BUFFERS)
+        ]
+        self.received: Counter[int] = Counter()
+        self.dropped = 0
+        self.address: tuple[str, int] | None = None
+        self._target = bytes.fromhex(mac_addr.replace(":", ""))
+        self._random = random.Random(seed)  # noqa: S311
+        self._transport: asyncio.DatagramTransport | None = None
+        self._handlers: dict[int, Callable[[bytes], tuple[int, bytes] | None]] = {
+            SET_POWER: self._handle_set_power,
+            LIGHT_SET_POWER: self._handle_set_power,
+            LIGHT_GET_POWER: self._handle_get_power,
+            TILE_GET64: self._handle_get64,
+            TILE_SET64: self._handle_set64,
+            TILE_COPY_FRAME_BUFFER: self._handle_copy_frame_buffer,
+        }
+
+    @property
+    def total_zones(self) -> int:
+        """Return the number of zones on the ceiling."""
+        return self.width * TILE_HEIGHT
+
+    @property
+    def zones(self) -> list[Color]:
+        """Return the visible framebuffer."""
+        return self.framebuffers[0]
+
+    async def async_start(self, host: str = "127.0.0.1") -> tuple[str, int]:
+        """Bind to an ephemeral port on host and return the address."""
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(lambda: self, local_addr=(host, 0))
+        return self.address  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Close the socket."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def async_connect(self, *, refresh: bool = True) -> LIFXCeiling:
+        """Return a LIFXCeiling talking to the emulator, with its zones read."""
+        if self.address is None:
+            await self.async_start()
+        host, port = self.address  # type: ignore[misc]
+        loop = asyncio.get_running_loop()
+        ceiling = LIFXCeiling(loop, self.mac_addr, host, port)
+        ceiling.product = self.product
+        ceiling.tile_device_width = self.width
+        ceiling.power_level = self.power_level
+        await loop.create_datagram_endpoint(lambda: ceiling, remote_addr=(host, port))
+        if refresh:
+            await self.async_refresh(ceiling)
+        return ceiling
+
+    async def async_refresh(self, ceiling: LIFXCeiling) -> None:
+        """Read every zone into the ceiling's chain with get64 requests."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for y in range(0, TILE_HEIGHT, 64 // self.width):
+            future: asyncio.Future[Any] = loop.create_future()
+            futures.append(future)
+            ceiling.get64(
+                y=y,
+                callb=lambda _bulb, response, future=future: (
+                    future.done() or future.set_result(response)
+                ),
+            )
+        await asyncio.gather(*futures)
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport once the socket is bound."""
+        self._transport = transport  # type: ignore[assignment]
+        self.address = transport.get_extra_info("sockname")[:2]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Schedule a request after the configured latency, unless it is lost."""
+        if self._random.random() < self.loss:
+            self.dropped += 1
+            return
+
+        delay = max(0.0, self.latency + self._random.uniform(-1, 1) * self.jitter)
+        if delay:
+            asyncio.get_running_loop().call_later(delay, self._handle, data, addr)
+        else:
+            self._handle(data, addr)
+
+    def _handle(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Apply a request and send the ack and response it asks for."""
+        (_, _, source, _, flags, sequence, _, message_type, _) = HEADER.unpack_from(
+            data
+        )
+        self.received[message_type] += 1
+        handler = self._handlers.get(message_type)
+        if handler is None:
+            return
+
+        response = handler(data[HEADER_SIZE:])
+        if flags & 0b10:
+            self._send(addr, source, sequence, ACKNOWLEDGEMENT, b"")
+        if response is not None:
+            self._send(addr, source, sequence, *response)
+
+    def _send(
+        self,
+        addr: tuple[str, int],
+        source: int,
+        sequence: int,
+        message_type: int,
+        payload: bytes,
+    ) -> None:
+        """Send a message back to the client."""
+        if self._transport is None:
+            return
+        header = HEADER.pack(
+            HEADER_SIZE + len(payload),
+            PROTOCOL_FLAGS,
+            source,
+            self._target,
+            0,
+            sequence,
+            0,
+            message_type,
+            0,
+        )
+        self._transport.sendto(header + payload, addr)
+
+    def _handle_set_power(self, payload: bytes) -> None:
+        """Handle SetPower and LightSetPower."""
+        (self.power_level,) = struct.unpack_from("<H", payload)
+
+    def _handle_get_power(self, _payload: bytes) -> tuple[int, bytes]:
+        """Handle LightGetPower."""
+        return LIGHT_STATE_POWER, struct.pack("<H", self.power_level)
+
+    def _handle_get64(self, payload: bytes) -> tuple[int, bytes]:
+        """Handle TileGet64 by returning 64 zones of the visible framebuffer."""
+        tile_index, _, _, x, y, width = struct.unpack_from("<6B", payload)
+        colors = [
+            self._zone(self.zones, x + index % width, y + index // width) or BLACK
+            for index in range(64)
+        ]
+        return TILE_STATE64, struct.pack("<5B", tile_index, 0, x, y, width) + b"".join(
+            HSBK.pack(*color) for color in colors
+        )
+
+    def _handle_set64(self, payload: bytes) -> None:
+        """Handle TileSet64, applying colors row by row from (x, y)."""
+        _, _, fb_index, x, y, width, _ = struct.unpack_from("<6BI", payload)
+        if fb_index >= FRAME_BUFFERS or not width:
+            return
+        framebuffer = self.framebuffers[fb_index]
+        for index, color in enumerate(HSBK.iter_unpack(payload[10 : 10 + 64 * 8])):
+            column, row = x + index % width, y + index // width
+            if column < self.width and row < TILE_HEIGHT:
+                framebuffer[row * self.width + column] = color
+
+    def _handle_copy_frame_buffer(self, payload: bytes) -> None:
+        """Handle TileCopyFrameBuffer for the given rectangle."""
+        (_, _, src, dst, src_x, src_y, dst_x, dst_y, width, height, _) = (
+            struct.unpack_from("<10BI", payload)
+        )
+        if max(src, dst) >= FRAME_BUFFERS:
+            return
+        source = list(self.framebuffers[src])
+        for row in range(height):
+            for column in range(width):
+                color = self._zone(source, src_x + column, src_y + row)
+                target_column, target_row = dst_x + column, dst_y + row
+                if (
+                    color is not None
+                    and target_column < self.width
+                    and target_row < TILE_HEIGHT
+                ):
+                    self.framebuffers[dst][target_row * self.width + target_column] = (
+                        color
+                    )
+
+    def _zone(self, framebuffer: list[Color], column: int, row: int) -> Color | None:
+        """Return the color at a position, or None outside the tile."""
+        if column >= self.width or row >= TILE_HEIGHT:
+            return None
+        return framebuffer[row * self.width + column]
@@ -0,0 +1,111 @@
+"""Timing, storage and comparison of benchmark results."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RESULTS_DIR = Path(__file__).parent / "results"
+MANIFEST = (
+    Path(__file__).parent.parent
+    / "custom_components"
+    / "lifx_ceiling"
+    / "manifest.json"
+)
+
+MIN_ROUND_TIME = 0.05
+ROUNDS = 7
+
+
+def measure(func: Callable[[], object], rounds: int = ROUNDS) -> dict[str, float]:
+    """
+    Time a callable and return per-call statistics in microseconds.
+
+    The number of calls per round is calibrated so each round takes at least
+    MIN_ROUND_TIME seconds, then the best, median and mean rounds are kept.
+    """
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= MIN_ROUND_TIME:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(MIN_ROUND_TIME / elapsed) + 1)
+
+    samples = [_time_loops(func, loops) / loops * 1e6 for _ in range(rounds)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "loops": loops,
+        "rounds": rounds,
+    }
+
+
+def _time_loops(func: Callable[[], object], loops: int) -> float:
+    """Return the wall time taken by calling func loops times."""
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start
+
+
+def integration_version() -> str:
+    """Return the integration version from the manifest."""
+    return json.loads(MANIFEST.read_text())["version"]
+
+
+def save_results(results: dict[str, dict[str, float]], path: Path) -> None:
+    """Store results together with the environment they were measured in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload: dict[str, Any] = {
+        "version": integration_version(),
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: Path) -> dict[str, dict[str, float]]:
+    """Load the results stored in a file."""
+    return json.loads(path.read_text())["results"]
+
+
+def latest_results_file(exclude: Path | None = None) -> Path | None:
+    """Return the most recently stored results file, if any."""
+    files = sorted(
+        (path for path in RESULTS_DIR.glob("*.json") if path != exclude),
+        key=lambda path: path.stat().st_mtime,
+    )
+    return files[-1] if files else None
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[tuple[str, float, float, float, bool]]:
+    """
+    Compare median timings against a baseline.
+
+    Returns (name, baseline median, current median, relative change,
+    regressed) for every benchmark present in both result sets.
+    """
+    rows: list[tuple[str, float, float, float, bool]] = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median"]
+        after = result["median"]
+        change = (after - before) / before if before else 0.0
+        rows.append((name, before, after, change, change > threshold))
+    return rows
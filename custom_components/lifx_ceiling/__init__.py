@@ -4,15 +4,43 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.const import Platform
+import voluptuous as vol
+from homeassistant.components.light import ATTR_TRANSITION
+from homeassistant.const import ATTR_DEVICE_ID, Platform
+from homeassistant.core import SupportsResponse
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     _LOGGER,
+    ATTR_ANGLE,
+    ATTR_BRIGHTNESS,
+    ATTR_CENTER_X,
+    ATTR_CENTER_Y,
+    ATTR_FORCE,
+    ATTR_GRADIENT,
+    ATTR_HUE,
+    ATTR_KELVIN,
+    ATTR_KEYFRAMES,
+    ATTR_POSITION,
+    ATTR_PRELOAD,
+    ATTR_REPEAT,
+    ATTR_SATURATION,
+    ATTR_SCENE,
+    ATTR_STOPS,
+    ATTR_SYNC,
+    ATTR_ZONES,
     DISCOVERY_INTERVAL,
     DOMAIN,
+    GRADIENT_LINEAR,
+    GRADIENT_TYPES,
     NAME,
+    SERVICE_LIFX_CEILING_ACTIVATE_SCENE,
+    SERVICE_LIFX_CEILING_PLAY_KEYFRAMES,
+    SERVICE_LIFX_CEILING_REMOVE_SCENE,
     SERVICE_LIFX_CEILING_SET_STATE,
+    SERVICE_LIFX_CEILING_SET_ZONES,
+    SERVICE_LIFX_CEILING_STORE_SCENE,
 )
 from .coordinator import LIFXCeilingConfigEntry, LIFXCeilingUpdateCoordinator
 from .util import async_get_legacy_entries, has_single_config_entry
@@ -20,11 +48,98 @@ from .util import async_get_legacy_entries, has_single_config_entry
 if TYPE_CHECKING:
     from datetime import datetime
 
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
     from homeassistant.helpers.typing import ConfigType
 
 
-PLATFORMS: list[Platform] = [Platform.LIGHT]
+PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SENSOR]
+
+HUE = vol.All(vol.Coerce(float), vol.Range(min=0, max=360))
+PERCENT = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+KELVIN = vol.All(vol.Coerce(int), vol.Range(min=1500, max=9000))
+
+GRADIENT_STOP_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_POSITION): PERCENT,
+        vol.Optional(ATTR_HUE, default=0): HUE,
+        vol.Optional(ATTR_SATURATION, default=0): PERCENT,
+        vol.Optional(ATTR_BRIGHTNESS, default=100): PERCENT,
+        vol.Optional(ATTR_KELVIN, default=3500): KELVIN,
+    }
+)
+
+ZONES_PATTERN = {
+    vol.Exclusive(ATTR_STOPS, "pattern"): vol.All(
+        cv.ensure_list, [GRADIENT_STOP_SCHEMA], vol.Length(min=1)
+    ),
+    vol.Exclusive(ATTR_ZONES, "pattern"): vol.All(
+        cv.ensure_list,
+        [vol.ExactSequence([HUE, PERCENT, PERCENT, KELVIN])],
+        vol.Length(min=1),
+    ),
+    vol.Optional(ATTR_GRADIENT, default=GRADIENT_LINEAR): vol.In(GRADIENT_TYPES),
+    vol.Optional(ATTR_ANGLE, default=0): vol.Coerce(float),
+    vol.Optional(ATTR_CENTER_X, default=50): PERCENT,
+    vol.Optional(ATTR_CENTER_Y, default=50): PERCENT,
+}
+
+SET_ZONES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **ZONES_PATTERN,
+            vol.Optional(ATTR_TRANSITION, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=3600)
+            ),
+            vol.Optional(ATTR_SYNC, default=False): cv.boolean,
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_STOPS, ATTR_ZONES),
+)
+
+KEYFRAME_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **ZONES_PATTERN,
+            vol.Optional(ATTR_TRANSITION, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=86400)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_STOPS, ATTR_ZONES),
+)
+
+PLAY_KEYFRAMES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_KEYFRAMES): vol.All(
+            cv.ensure_list, [KEYFRAME_SCHEMA], vol.Length(min=1)
+        ),
+        vol.Optional(ATTR_REPEAT, default=False): cv.boolean,
+    }
+)
+
+STORE_SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_SCENE): cv.string,
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        **ZONES_PATTERN,
+        vol.Optional(ATTR_PRELOAD, default=True): cv.boolean,
+    }
+)
+
+ACTIVATE_SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_SCENE): cv.string,
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TRANSITION, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=3600)
+        ),
+    }
+)
+
+REMOVE_SCENE_SCHEMA = vol.Schema({vol.Required(ATTR_SCENE): cv.string})
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -63,17 +178,75 @@ async def async_setup_entry(
 ) -> bool:
     """Set up LIFX Ceiling."""
     coordinator = LIFXCeilingUpdateCoordinator(hass, config_entry)
+    config_entry.async_on_unload(coordinator.async_track_lifx_entries())
+    config_entry.async_on_unload(coordinator.async_track_device_registry())
     await coordinator.async_update()
 
     config_entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    async def handle_set_state(call: ServiceCall) -> None:
+    async def handle_set_state(call: ServiceCall) -> ServiceResponse:
         """Handle the set_state service call."""
-        await coordinator.async_set_state(call)
+        return await coordinator.async_set_state(call) or {}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_SET_STATE,
+        handle_set_state,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_zones(call: ServiceCall) -> ServiceResponse:
+        """Handle the set_zones service call."""
+        return await coordinator.async_set_zones(call) or {}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_SET_ZONES,
+        handle_set_zones,
+        SET_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_play_keyframes(call: ServiceCall) -> None:
+        """Handle the play_keyframes service call."""
+        await coordinator.async_play_keyframes(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_PLAY_KEYFRAMES,
+        handle_play_keyframes,
+        PLAY_KEYFRAMES_SCHEMA,
+    )
+
+    async def handle_store_scene(call: ServiceCall) -> None:
+        """Handle the store_scene service call."""
+        await coordinator.async_store_scene(call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_LIFX_CEILING_STORE_SCENE, handle_store_scene, STORE_SCENE_SCHEMA
+    )
+
+    async def handle_activate_scene(call: ServiceCall) -> None:
+        """Handle the activate_scene service call."""
+        await coordinator.async_activate_scene(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_ACTIVATE_SCENE,
+        handle_activate_scene,
+        ACTIVATE_SCENE_SCHEMA,
+    )
+
+    async def handle_remove_scene(call: ServiceCall) -> None:
+        """Handle the remove_scene service call."""
+        coordinator.async_remove_scene(call)
 
     hass.services.async_register(
-        DOMAIN, SERVICE_LIFX_CEILING_SET_STATE, handle_set_state
+        DOMAIN,
+        SERVICE_LIFX_CEILING_REMOVE_SCENE,
+        handle_remove_scene,
+        REMOVE_SCENE_SCHEMA,
     )
 
     async def _periodic_update(now: datetime) -> None:
@@ -3,33 +3,175 @@
 from __future__ import annotations
 
 import asyncio
-from functools import partial
+import struct
+import time
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from aiolifx.aiolifx import UDP_BROADCAST_PORT, Light
+from aiolifx.message import Message
+from aiolifx.msgtypes import MSG_IDS, Acknowledgement, TileCopyFrameBuffer, TileSet64
 from aiolifx.products import products_dict
 
 from .const import (
+    HSBK_BRIGHTNESS,
+    HSBK_KELVIN,
     LIFX_CEILING_128ZONES_PRODUCT_IDS,
 )
-from .util import async_execute_lifx
+from .metrics import LIFXCeilingMetrics
+from .ratelimit import (
+    PRIORITY_COMMAND,
+    PRIORITY_CONTROL,
+    PRIORITY_POLL,
+    PRIORITY_STREAM,
+    LIFXCeilingRateLimiter,
+)
+from .rtt import LIFXCeilingRTTEstimator
+from .util import (
+    LIFXCeilingCommandGenerations,
+    async_execute_lifx,
+    set64_rectangles,
+)
+from .zones import LIFXCeilingZoneBuffer
 
 if TYPE_CHECKING:
-    import asyncio
+    from collections.abc import Callable, Sequence
 
 MESSAGE_TIMEOUT = 3
 
+# Wire formats of the streamed tile messages. aiolifx packs every field with
+# bitstring, which costs about a millisecond per set64, far too slow to stream
+# frames to many ceilings at once.
+LIFX_HEADER = struct.Struct("<HHI8s6xBBQHH")
+LIFX_PROTOCOL = 0x1400  # protocol 1024, addressable
+SET64_PAYLOAD = struct.Struct("<6BI256H")
+COPY_FRAME_BUFFER_PAYLOAD = struct.Struct("<10BIx")
+
+# Encoded set64 payloads kept for reuse, shared by every ceiling: 64 full
+# 128-zone frames, about 1.2MB with their keys when every zone differs.
+SET64_PAYLOAD_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=SET64_PAYLOAD_CACHE_SIZE)
+def packed_set64_payload(  # noqa: PLR0913
+    tile_index: int,
+    length: int,
+    fb_index: int,
+    x: int,
+    y: int,
+    width: int,
+    duration: int,
+    colors: tuple[tuple[int, int, int, int], ...],
+) -> bytes:
+    """
+    Pack a set64 payload, padding it to 64 colors; duration is in milliseconds.
+
+    The payload does not depend on the ceiling it is sent to, so ceilings set
+    to the same colors, and scenes or effects that repeat a frame, share the
+    encoded bytes and only a new header is built for each send.
+    """
+    padding = (0, 0, 0, 3500) * (64 - len(colors))
+    return SET64_PAYLOAD.pack(
+        tile_index,
+        length,
+        fb_index,
+        x,
+        y,
+        width,
+        duration,
+        *chain.from_iterable(colors),
+        *padding,
+    )
+
 
 class LIFXCeilingError(Exception):
     """LIFX Ceiling specific exception."""
 
 
+class LIFXCeilingPackedMessage(Message):
+    """
+    A message whose payload was serialised ahead of time.
+
+    Lets aiolifx send, ack and retry a payload packed with struct, so only
+    the header is built when the message is sent.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        target_addr: str,
+        source_id: int,
+        seq_num: int,
+        payload: dict[str, Any],
+        ack_requested: bool = False,
+        response_requested: bool = False,
+    ) -> None:
+        """Initialise the message from a message type ID and packed payload."""
+        self.packed_payload: bytes = payload["packed"]
+        super().__init__(
+            payload["msg_type"],
+            target_addr,
+            source_id,
+            seq_num,
+            ack_requested,
+            response_requested,
+        )
+
+    def get_payload(self) -> bytes:
+        """Return the packed payload."""
+        return self.packed_payload
+
+
+class LIFXCeilingZoneSummary:
+    """Derived uplight and downlight state computed in one pass over the zones."""
+
+    __slots__ = (
+        "downlight_brightness",
+        "downlight_color",
+        "downlight_hs_color",
+        "downlight_is_on",
+        "uplight_brightness",
+        "uplight_color",
+        "uplight_hs_color",
+        "uplight_is_on",
+    )
+
+    def __init__(
+        self,
+        zones: list[tuple[int, int, int, int]],
+        uplight_zone: int,
+        power_level: int,
+    ) -> None:
+        """Summarise the zones of a ceiling."""
+        hue, saturation, _, kelvin = zones[0]
+        brightness = max(map(itemgetter(HSBK_BRIGHTNESS), zones[:uplight_zone]))
+        self.downlight_color = (hue, saturation, brightness, kelvin)
+        self.downlight_brightness = brightness >> 8
+        self.downlight_hs_color = (hue / 65535 * 360, saturation / 65535 * 100)
+        self.downlight_is_on = bool(power_level > 0 and self.downlight_brightness > 0)
+
+        hue, saturation, brightness, kelvin = zones[uplight_zone]
+        self.uplight_color = (hue, saturation, brightness, kelvin)
+        self.uplight_brightness = brightness >> 8
+        self.uplight_hs_color = (hue / 65535 * 360, saturation / 65535 * 100)
+        self.uplight_is_on = bool(power_level > 0 and self.uplight_brightness > 0)
+
+
 class LIFXCeiling(Light):
     """Represents a LIFX Ceiling."""
 
     uplight_zone: int
     downlight_zones: slice
     total_zones: int
+    _zone_summary: LIFXCeilingZoneSummary | None = None
+    _rtt: LIFXCeilingRTTEstimator | None = None
+    _metrics: LIFXCeilingMetrics | None = None
+    _limiter: LIFXCeilingRateLimiter | None = None
+    _generations: LIFXCeilingCommandGenerations | None = None
+    _staged_frames: dict[int, list[tuple[int, int, int, int]]] | None = None
+    # Monotonic send and ack times of the last copy_frame_buffer_now.
+    show_timing: tuple[float, float | None] | None = None
 
     def __init__(
         self,
@@ -86,204 +228,598 @@ class LIFXCeiling(Light):
         """Return a friendly model name."""
         return products_dict[self.product].name
 
+    @property
+    def rtt(self) -> LIFXCeilingRTTEstimator:
+        """Return the round-trip time estimator used to time out requests."""
+        if self._rtt is None:
+            self._rtt = LIFXCeilingRTTEstimator()
+        return self._rtt
+
+    @property
+    def metrics(self) -> LIFXCeilingMetrics:
+        """Return the command metrics for this ceiling."""
+        if self._metrics is None:
+            self._metrics = LIFXCeilingMetrics()
+        return self._metrics
+
+    @property
+    def limiter(self) -> LIFXCeilingRateLimiter:
+        """Return the rate limiter every packet to this ceiling goes through."""
+        if self._limiter is None:
+            self._limiter = LIFXCeilingRateLimiter()
+        return self._limiter
+
+    @property
+    def generations(self) -> LIFXCeilingCommandGenerations:
+        """Return the command generations that let newer commands win."""
+        if self._generations is None:
+            self._generations = LIFXCeilingCommandGenerations()
+        return self._generations
+
+    @property
+    def staged_frames(self) -> dict[int, list[tuple[int, int, int, int]]]:
+        """Return the frames known to be held by the off-screen framebuffers."""
+        if self._staged_frames is None:
+            self._staged_frames = {}
+        return self._staged_frames
+
+    def forget_staged_frames(self) -> None:
+        """
+        Stop trusting what the off-screen framebuffers are known to hold.
+
+        Called when the ceiling may have lost them, such as after it stopped
+        answering or showed something other than the frame written to it, so
+        the next staged frame is uploaded again.
+        """
+        self.staged_frames.clear()
+
+    @property
+    def zone_summary(self) -> LIFXCeilingZoneSummary:
+        """Return the derived zone state, computed once per change of the zones."""
+        if self._zone_summary is None:
+            self._zone_summary = LIFXCeilingZoneSummary(
+                self.chain[0], self.uplight_zone, self.power_level
+            )
+        return self._zone_summary
+
+    def invalidate_zone_summary(self) -> None:
+        """Recompute the zone summary on next read, after chain[0] or power changed."""
+        self._zone_summary = None
+
     @property
     def uplight_color(self) -> tuple[int, int, int, int]:
         """Return the HSBK values for the last zone."""
-        hue, saturation, brightness, kelvin = self.chain[0][self.uplight_zone]
-        return hue, saturation, brightness, kelvin
+        return self.zone_summary.uplight_color
 
     @property
     def uplight_hs_color(self) -> tuple[float, float]:
         """Return hue, saturation as a tuple."""
-        hue, saturation, _, _ = self.chain[0][self.uplight_zone]
-        hue = hue / 65535 * 360
-        saturation = saturation / 65535 * 100
-        return hue, saturation
+        return self.zone_summary.uplight_hs_color
 
     @property
     def uplight_brightness(self) -> int:
         """Return uplight brightness."""
-        _, _, brightness, _ = self.chain[0][self.uplight_zone]
-        return brightness >> 8
+        return self.zone_summary.uplight_brightness
 
     @property
     def uplight_kelvin(self) -> int:
         """Return uplight kelvin."""
-        _, _, _, kelvin = self.chain[0][self.uplight_zone]
-        return kelvin
+        return self.zone_summary.uplight_color[HSBK_KELVIN]
 
     @property
     def downlight_hs_color(self) -> tuple[float, float]:
         """Return the hue, saturation from zone 0."""
-        hue, saturation, _, _ = self.chain[0][0]
-        hue = hue / 65535 * 360
-        saturation = saturation / 65535 * 100
-        return hue, saturation
+        return self.zone_summary.downlight_hs_color
 
     @property
     def downlight_brightness(self) -> int:
         """Return max brightness value for all downlight zones."""
-        unscaled = max(
-            brightness for _, _, brightness, _ in self.chain[0][self.downlight_zones]
-        )
-        return unscaled >> 8
+        return self.zone_summary.downlight_brightness
 
     @property
     def downlight_kelvin(self) -> int:
         """Return kelvin from zone 0."""
-        _, _, _, kelvin = self.chain[0][0]
-        return kelvin
+        return self.zone_summary.downlight_color[HSBK_KELVIN]
 
     @property
     def downlight_color(self) -> tuple[int, int, int, int]:
         """Return zone 0 hue, saturation, kelvin with max brightness."""
-        brightness = max(
-            brightness for _, _, brightness, _ in self.chain[0][self.downlight_zones]
-        )
-        hue, saturation, _, kelvin = self.chain[0][0]
-        return hue, saturation, brightness, kelvin
+        return self.zone_summary.downlight_color
 
     @property
     def uplight_is_on(self) -> bool:
         """Return true if power > 0 and uplight brightess > 0."""
-        return bool(self.power_level > 0 and self.uplight_brightness > 0)
+        return self.zone_summary.uplight_is_on
 
     @property
     def downlight_is_on(self) -> bool:
         """Return true if power > 0 and downlight zones max brightness > 0."""
-        return bool(self.power_level > 0 and self.downlight_brightness > 0)
+        return self.zone_summary.downlight_is_on
 
     async def turn_uplight_on(
-        self, color: tuple[int, int, int, int], duration: int = 0
-    ) -> None:
+        self,
+        color: tuple[int, int, int, int],
+        duration: int = 0,
+        *,
+        force: bool = False,
+    ) -> bool:
         """
         Turn the uplight on.
 
         Color is a tuple of hue, saturation, brightness and kelvin values (0-65535).
         Duration is time in milliseconds to transition from current state to color.
+        Returns whether anything was sent; see async_set64 for force.
         """
-        colors = self.chain[0][self.downlight_zones]
+        frame = self.zone_buffer()
         if self.power_level == 0:
             # The device is off, so set the downlight zones brightess to 0 first.
-            colors = [
-                (h, s, 0, k) for h, s, _, k in self.chain[0][self.downlight_zones]
-            ]
+            frame.zero_brightness(stop=self.uplight_zone)
 
-        colors.append(color)
-        await self.async_set64(
-            colors=colors, duration=duration, power_on=bool(self.power_level == 0)
+        frame[self.uplight_zone] = color
+        return await self.async_set64(
+            colors=frame,
+            duration=duration,
+            power_on=bool(self.power_level == 0),
+            force=force,
         )
 
-    async def turn_uplight_off(self, duration: int = 0) -> None:
+    async def turn_uplight_off(self, duration: int = 0, *, force: bool = False) -> bool:
         """
         Turn the uplight off.
 
         If the downlight is on, lower the brightness of the uplight to zero.
         If the downlight is off, turn off the entire light.
+        Returns whether anything was sent; see async_set64 for force.
         """
         if self.downlight_is_on is True:
-            colors = self.chain[0][self.downlight_zones]
-            hue, saturation, _, kelvin = self.chain[0][self.uplight_zone]
-            colors.append((hue, saturation, 0, kelvin))
-            await self.async_set64(colors=colors, duration=duration)
-        else:
-            await async_execute_lifx(
-                partial(self.set_power, value="off", duration=duration * 1000)
-            )
+            frame = self.zone_buffer()
+            frame.zero_brightness(start=self.uplight_zone)
+            return await self.async_set64(colors=frame, duration=duration, force=force)
+        return await self.async_power_off(duration, force=force)
 
     async def turn_downlight_on(
-        self, color: tuple[int, int, int, int], duration: int = 0
-    ) -> None:
+        self,
+        color: tuple[int, int, int, int],
+        duration: int = 0,
+        *,
+        force: bool = False,
+    ) -> bool:
         """
         Turn the downlight on.
 
         Color is a tuple of hue, saturation, brightness and kelvin values (0-65535).
         Duration is the time in milliseconds to transition from current state to color.
+        Returns whether anything was sent; see async_set64 for force.
         """
-        colors = [color] * (self.total_zones - 1)
-        if self.power_level > 0:
-            colors.append(self.chain[0][self.uplight_zone])
-        else:
-            hue, saturation, _, kelvin = self.chain[0][self.uplight_zone]
-            colors.append((hue, saturation, 0, kelvin))
+        frame = LIFXCeilingZoneBuffer.filled(color, self.total_zones)
+        frame[self.uplight_zone] = self.chain[0][self.uplight_zone]
+        if self.power_level == 0:
+            frame.zero_brightness(start=self.uplight_zone)
 
-        await self.async_set64(
-            colors=colors, duration=duration, power_on=bool(self.power_level == 0)
+        return await self.async_set64(
+            colors=frame,
+            duration=duration,
+            power_on=bool(self.power_level == 0),
+            force=force,
         )
 
-    async def turn_downlight_off(self, duration: int = 0) -> None:
+    async def turn_downlight_off(
+        self, duration: int = 0, *, force: bool = False
+    ) -> bool:
         """
         Turn the downlight off.
 
         If the uplight is on, lower the downlight brightness to zero.
         If the uplight is off, turn off the entire device.
+        Returns whether anything was sent; see async_set64 for force.
         """
-        colors = [(h, s, 0, k) for h, s, _, k in self.chain[0][self.downlight_zones]]
         if self.uplight_is_on:
-            colors.append(self.chain[0][self.uplight_zone])
-            await self.async_set64(colors=colors, duration=duration)
-        else:
-            await async_execute_lifx(
-                partial(self.set_power, value="off", duration=duration * 1000)
-            )
+            frame = self.zone_buffer()
+            frame.zero_brightness(stop=self.uplight_zone)
+            return await self.async_set64(colors=frame, duration=duration, force=force)
+        return await self.async_power_off(duration, force=force)
+
+    async def async_power_off(
+        self, duration: float = 0, *, force: bool = False
+    ) -> bool:
+        """
+        Turn the whole ceiling off over duration seconds.
+
+        Nothing is sent if the ceiling is already known to be off, unless
+        force is set. Returns whether the set_power was sent.
+        """
+        if self.power_level == 0 and self.generations.settled and not force:
+            self.metrics.record_skip()
+            return False
+
+        await async_execute_lifx(
+            partial(self.set_power, value="off", duration=round(duration * 1000)),
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+        self.power_level = 0
+        self.invalidate_zone_summary()
+        return True
 
     async def async_set64(
         self,
-        colors: list[tuple[int, int, int, int]],
+        colors: Sequence[tuple[int, int, int, int]] | LIFXCeilingZoneBuffer,
         duration: int = 0,
         power_on: bool = False,
-    ) -> None:
-        """Set the colors for the ceiling light."""
+        *,
+        full_frame: bool = False,
+        force: bool = False,
+    ) -> bool:
+        """
+        Set the colors for the ceiling light.
+
+        When the cached zone state is known and every changed zone fits into a
+        single set64 rectangle, only that rectangle is written straight to the
+        visible framebuffer. Anything larger is uploaded to the off-screen
+        framebuffer and copied across so the whole frame changes at once.
+        With full_frame, every zone is sent whatever the cached state says,
+        which resynchronises a ceiling that may have missed unacked frames.
+
+        Nothing is sent if the cached zones and power already match the
+        target, so re-asserting the current state costs no packets; full_frame
+        or force sends the frame anyway. Returns whether anything was sent.
+        """
         if len(colors) != self.total_zones:
             msg = f"Expected {self.total_zones} colors, got {len(colors)}"
             raise LIFXCeilingError(msg)
 
-        if self.product in LIFX_CEILING_128ZONES_PRODUCT_IDS:
-            await async_execute_lifx(
-                [
-                    partial(
-                        self.set64,
-                        tile_index=0,
-                        length=1,
-                        fb_index=1,
-                        x=0,
-                        y=0,
-                        width=self.tile_device_width,
-                        colors=colors[: self.total_zones // 2],
-                    ),
-                    partial(
-                        self.set64,
-                        tile_index=0,
-                        length=1,
-                        fb_index=1,
-                        x=0,
-                        y=4,
-                        width=self.tile_device_width,
-                        colors=colors[self.total_zones // 2 :],
-                    ),
-                ]
-            )
+        frame = LIFXCeilingZoneBuffer.from_colors(colors)
+        target = frame.colors()
+        if not (full_frame or force) and self.is_showing(target, power_on=power_on):
+            self.metrics.record_skip()
+            return False
 
-        else:
-            await async_execute_lifx(
-                partial(
-                    self.set64,
-                    tile_index=0,
-                    length=1,
-                    fb_index=1,
-                    x=0,
-                    y=0,
-                    width=self.tile_device_width,
-                    colors=colors,
-                )
+        rectangles = None if full_frame else self._changed_rectangles(target)
+        methods = self._frame_methods(
+            frame,
+            rectangles,
+            duration if power_on is False else 0,
+            set64=self.set64,
+            copy_frame_buffer=self.copy_frame_buffer,
+        )
+        offscreen = rectangles is None or len(rectangles) != 1
+        if offscreen:
+            self.staged_frames.pop(1, None)
+
+        if power_on:
+            methods.append(
+                partial(self.set_power, value="on", duration=duration * 1000)
             )
 
+        # Pipeline the whole frame: every packet leaves back-to-back and the
+        # acks are awaited together, resending in order on loss.
+        await async_execute_lifx(
+            methods,
+            ordered=True,
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+
+        # The device acked the frame, so reflect it locally until the next poll.
+        self.chain[0] = target
+        if offscreen:
+            self.staged_frames[1] = target
+        if power_on:
+            self.power_level = 65535
+        self.invalidate_zone_summary()
+        return True
+
+    def is_showing(
+        self, colors: list[tuple[int, int, int, int]], *, power_on: bool = False
+    ) -> bool:
+        """
+        Return whether the cached state already shows the given zone colors.
+
+        With power_on, the ceiling must also be known to be on. An unknown
+        cached frame never matches, nor does any while a command is in flight
+        or after one was cut short, as the ceiling may then show neither.
+        """
+        if (power_on and self.power_level == 0) or not self.generations.settled:
+            return False
+        try:
+            return self.chain[0] == colors
+        except (KeyError, IndexError):
+            return False
+
+    async def async_stage_frame(
+        self,
+        colors: Sequence[tuple[int, int, int, int]] | LIFXCeilingZoneBuffer,
+        fb_index: int = 1,
+    ) -> None:
+        """
+        Upload a full frame into an off-screen framebuffer without showing it.
+
+        The frame can then be shown with async_show_frame, which is a single
+        copy_frame_buffer packet. Nothing is sent if the framebuffer is already
+        known to hold the frame.
+        """
+        if len(colors) != self.total_zones:
+            msg = f"Expected {self.total_zones} colors, got {len(colors)}"
+            raise LIFXCeilingError(msg)
+
+        frame = LIFXCeilingZoneBuffer.from_colors(colors)
+        target = frame.colors()
+        if self.staged_frames.get(fb_index) == target:
+            return
+
+        self.staged_frames.pop(fb_index, None)
+        await async_execute_lifx(
+            self._upload_methods(frame, fb_index, self.set64),
+            ordered=True,
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+        self.staged_frames[fb_index] = target
+
+    async def async_show_frame(
+        self,
+        fb_index: int = 1,
+        duration: int = 0,
+        power_on: bool = False,
+        *,
+        immediate: bool = False,
+    ) -> None:
+        """
+        Fade the visible framebuffer to a staged frame over duration seconds.
+
+        With immediate, the copy is written to the socket as soon as this is
+        called rather than from a task aiolifx schedules, and its send and ack
+        times are kept in show_timing.
+        """
+        if (staged := self.staged_frames.get(fb_index)) is None:
+            msg = f"No frame is staged in framebuffer {fb_index}"
+            raise LIFXCeilingError(msg)
+
+        await async_execute_lifx(
+            self._show_methods(fb_index, duration, power_on, immediate=immediate),
+            ordered=True,
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+        self.chain[0] = list(staged)
+        if power_on:
+            self.power_level = 65535
+        self.invalidate_zone_summary()
+
+    def pack_frame(
+        self,
+        colors: Sequence[tuple[int, int, int, int]] | LIFXCeilingZoneBuffer,
+    ) -> list[bytes]:
+        """Serialise the set64 payloads that upload a frame into framebuffer 1."""
+        if len(colors) != self.total_zones:
+            msg = f"Expected {self.total_zones} colors, got {len(colors)}"
+            raise LIFXCeilingError(msg)
+
+        frame = LIFXCeilingZoneBuffer.from_colors(colors)
+        return [
+            method() for method in self._upload_methods(frame, 1, self._set64_payload)
+        ]
+
+    async def async_show_packed(
+        self,
+        colors: list[tuple[int, int, int, int]],
+        payloads: Sequence[bytes],
+        duration: int = 0,
+        power_on: bool = False,
+    ) -> None:
+        """
+        Show a frame serialised ahead of time by pack_frame.
+
+        If framebuffer 1 already holds the frame this is a single
+        copy_frame_buffer. Otherwise the packed set64 payloads are sent first,
+        in the same pipeline, with no color conversion or packing on the way.
+        """
+        methods: list[Callable] = []
+        if self.staged_frames.get(1) != colors:
+            self.staged_frames.pop(1, None)
+            methods = [partial(self.set64_packed, payload) for payload in payloads]
+        methods.extend(self._show_methods(1, duration, power_on))
+
+        await async_execute_lifx(
+            methods,
+            ordered=True,
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+        self.staged_frames[1] = colors
+        self.chain[0] = list(colors)
+        if power_on:
+            self.power_level = 65535
+        self.invalidate_zone_summary()
+
+    async def async_stage_packed(
+        self, colors: list[tuple[int, int, int, int]], payloads: Sequence[bytes]
+    ) -> None:
+        """Upload a frame serialised by pack_frame into framebuffer 1."""
+        if self.staged_frames.get(1) == colors:
+            return
+
+        self.staged_frames.pop(1, None)
         await async_execute_lifx(
+            [partial(self.set64_packed, payload) for payload in payloads],
+            ordered=True,
+            rtt=self.rtt,
+            metrics=self.metrics,
+            limiter=self.limiter,
+            generations=self.generations,
+        )
+        self.staged_frames[1] = colors
+
+    def set64(  # noqa: PLR0913
+        self,
+        tile_index: int = 0,
+        length: int = 1,
+        fb_index: int = 0,
+        x: int = 0,
+        y: int = 0,
+        width: int | None = None,
+        duration: float = 0,
+        colors: Sequence[tuple[int, int, int, int]] | None = None,
+        callb: Callable[..., None] | None = None,
+    ) -> None:
+        """
+        Set up to 64 zones, asking for an ack; duration is in seconds.
+
+        Takes the same arguments as aiolifx's set64 but sends the payload from
+        packed_set64_payload, so identical requests reuse its encoded bytes.
+        Core LIFX themes also paint through here, so an off-screen framebuffer
+        written to no longer holds the frame staged there.
+        """
+        if width is None:
+            if not self.tile_device_width:
+                return
+            width = self.tile_device_width
+        if fb_index > 0:
+            self.staged_frames.pop(fb_index, None)
+
+        self.set64_packed(
+            self._set64_payload(
+                tile_index=tile_index,
+                length=length,
+                fb_index=fb_index,
+                x=x,
+                y=y,
+                width=width,
+                colors=colors or [],
+                duration=round(duration * 1000),
+            ),
+            callb=callb,
+        )
+
+    def copy_frame_buffer(  # noqa: PLR0913
+        self,
+        tile_index: int = 0,
+        length: int = 1,
+        src_fb_index: int = 1,
+        dst_fb_index: int = 0,
+        src_x: int = 0,
+        src_y: int = 0,
+        dst_x: int = 0,
+        dst_y: int = 0,
+        width: int | None = None,
+        height: int | None = None,
+        duration: float = 0,
+        callb: Callable[..., None] | None = None,
+    ) -> None:
+        """Copy between framebuffers, forgetting the frame staged in dst_fb_index."""
+        if dst_fb_index > 0:
+            self.staged_frames.pop(dst_fb_index, None)
+        super().copy_frame_buffer(
+            tile_index=tile_index,
+            length=length,
+            src_fb_index=src_fb_index,
+            dst_fb_index=dst_fb_index,
+            src_x=src_x,
+            src_y=src_y,
+            dst_x=dst_x,
+            dst_y=dst_y,
+            width=width,
+            height=height,
+            duration=duration,
+            callb=callb,
+        )
+
+    def set64_packed(
+        self, payload: bytes, callb: Callable[..., None] | None = None
+    ) -> None:
+        """Send a set64 payload packed by pack_frame, asking for an ack."""
+        self.req_with_ack(
+            LIFXCeilingPackedMessage,
+            {"msg_type": MSG_IDS[TileSet64], "packed": payload},
+            callb=callb,
+        )
+
+    def copy_frame_buffer_now(  # noqa: PLR0913
+        self,
+        *,
+        tile_index: int,
+        length: int,
+        src_fb_index: int,
+        dst_fb_index: int,
+        src_x: int,
+        src_y: int,
+        dst_x: int,
+        dst_y: int,
+        width: int,
+        height: int = 8,
+        duration: int = 0,
+        callb: Callable[..., None] | None = None,
+    ) -> None:
+        """
+        Send a copy_frame_buffer asking for an ack, straight away.
+
+        Takes the same arguments as aiolifx's copy_frame_buffer, with duration
+        in seconds, but packs the message with struct and sends it before
+        returning. Used to start several ceilings as close together as
+        possible; the send and ack times are kept in show_timing.
+        """
+        message = LIFXCeilingPackedMessage(
+            self.mac_addr,
+            self.source_id,
+            self.seq_next(),
+            {
+                "msg_type": MSG_IDS[TileCopyFrameBuffer],
+                "packed": self._copy_frame_buffer_payload(
+                    tile_index=tile_index,
+                    length=length,
+                    src_fb_index=src_fb_index,
+                    dst_fb_index=dst_fb_index,
+                    src_x=src_x,
+                    src_y=src_y,
+                    dst_x=dst_x,
+                    dst_y=dst_y,
+                    width=width,
+                    height=height,
+                    duration=duration * 1000,
+                ),
+            },
+            ack_requested=True,
+        )
+        sent = time.monotonic()
+        self.show_timing = (sent, None)
+
+        def _acked(bulb: Light, response: Message | None) -> None:
+            if response is not None and self.show_timing == (sent, None):
+                self.show_timing = (sent, time.monotonic())
+            if callb is not None:
+                callb(bulb, response)
+
+        # Registered the way aiolifx's req_with_ack does, so the ack is matched.
+        self.message[message.seq_num] = [Acknowledgement, asyncio.Event(), _acked]
+        self.limiter.send(
+            PRIORITY_CONTROL, partial(self._write, message.packed_message)
+        )
+
+    def _show_methods(
+        self,
+        fb_index: int,
+        duration: int,
+        power_on: bool,
+        *,
+        immediate: bool = False,
+    ) -> list[Callable]:
+        """Return the calls that fade to a framebuffer, powering on if asked."""
+        methods: list[Callable] = [
             partial(
-                self.copy_frame_buffer,
+                self.copy_frame_buffer_now if immediate else self.copy_frame_buffer,
                 tile_index=0,
                 length=1,
-                src_fb_index=1,
+                src_fb_index=fb_index,
                 dst_fb_index=0,
                 src_x=0,
                 src_y=0,
@@ -291,10 +827,303 @@ class LIFXCeiling(Light):
                 dst_y=0,
                 width=self.tile_device_width,
                 duration=duration if power_on is False else 0,
+            )
+        ]
+        if power_on:
+            methods.append(
+                partial(self.set_power, value="on", duration=duration * 1000)
+            )
+        return methods
+
+    def stream_frame(
+        self,
+        colors: Sequence[tuple[int, int, int, int]] | LIFXCeilingZoneBuffer,
+        duration: float = 0,
+    ) -> None:
+        """
+        Send a frame without asking the ceiling to acknowledge it.
+
+        Used for intermediate animation frames: a lost packet is simply
+        superseded by the next frame, so nothing waits on the network and
+        nothing is resent. Unchanged frames are not sent at all. Duration is
+        the fade to the new frame in seconds.
+        """
+        if len(colors) != self.total_zones:
+            msg = f"Expected {self.total_zones} colors, got {len(colors)}"
+            raise LIFXCeilingError(msg)
+
+        frame = LIFXCeilingZoneBuffer.from_colors(colors)
+        target = frame.colors()
+        rectangles = self._changed_rectangles(target)
+        if rectangles == []:
+            return
+        if rectangles is None or len(rectangles) != 1:
+            self.staged_frames.pop(1, None)
+
+        for method in self._frame_methods(
+            frame,
+            rectangles,
+            round(duration * 1000),
+            set64=self._set64_no_ack,
+            copy_frame_buffer=self._copy_frame_buffer_no_ack,
+        ):
+            method()
+
+        self.chain[0] = target
+        self.invalidate_zone_summary()
+
+    def _set64_no_ack(self, **kwargs: Any) -> None:
+        """Send a set64 without an ack; duration is in milliseconds."""
+        self._send_no_ack(TileSet64, self._set64_payload(**kwargs))
+
+    @staticmethod
+    def _set64_payload(  # noqa: PLR0913
+        *,
+        tile_index: int,
+        length: int,
+        fb_index: int,
+        x: int,
+        y: int,
+        width: int,
+        colors: Sequence[tuple[int, int, int, int]],
+        duration: int = 0,
+    ) -> bytes:
+        """Return the set64 payload for a request, from the payload cache."""
+        return packed_set64_payload(
+            tile_index, length, fb_index, x, y, width, duration, tuple(colors[:64])
+        )
+
+    def _copy_frame_buffer_no_ack(  # noqa: PLR0913
+        self,
+        *,
+        tile_index: int,
+        length: int,
+        src_fb_index: int,
+        dst_fb_index: int,
+        src_x: int,
+        src_y: int,
+        dst_x: int,
+        dst_y: int,
+        width: int,
+        height: int = 8,
+        duration: int = 0,
+    ) -> None:
+        """Send a copy_frame_buffer without an ack; duration is in milliseconds."""
+        self._send_no_ack(
+            TileCopyFrameBuffer,
+            self._copy_frame_buffer_payload(
+                tile_index=tile_index,
+                length=length,
+                src_fb_index=src_fb_index,
+                dst_fb_index=dst_fb_index,
+                src_x=src_x,
+                src_y=src_y,
+                dst_x=dst_x,
+                dst_y=dst_y,
+                width=width,
+                height=height,
+                duration=duration,
             ),
         )
 
-        if power_on:
-            await async_execute_lifx(
-                partial(self.set_power, value="on", duration=duration * 1000)
+    @staticmethod
+    def _copy_frame_buffer_payload(  # noqa: PLR0913
+        *,
+        tile_index: int,
+        length: int,
+        src_fb_index: int,
+        dst_fb_index: int,
+        src_x: int,
+        src_y: int,
+        dst_x: int,
+        dst_y: int,
+        width: int,
+        height: int,
+        duration: int,
+    ) -> bytes:
+        """Pack a copy_frame_buffer payload; duration is in milliseconds."""
+        return COPY_FRAME_BUFFER_PAYLOAD.pack(
+            tile_index,
+            length,
+            src_fb_index,
+            dst_fb_index,
+            src_x,
+            src_y,
+            dst_x,
+            dst_y,
+            width,
+            height,
+            duration,
+        )
+
+    def _send_no_ack(self, msg_type: type, payload: bytes) -> None:
+        """Send a message once, with neither an ack nor a response requested."""
+        header = LIFX_HEADER.pack(
+            LIFX_HEADER.size + len(payload),
+            LIFX_PROTOCOL,
+            self.source_id,
+            bytes.fromhex(self.mac_addr.replace(":", "")),
+            0,
+            0,
+            0,
+            MSG_IDS[msg_type],
+            0,
+        )
+        self.limiter.send(PRIORITY_STREAM, partial(self._write, header + payload))
+        self.metrics.record_send(
+            "set64" if msg_type is TileSet64 else "copy_frame_buffer", retry=False
+        )
+
+    def _write(self, packet: bytes) -> None:
+        """Write a packed message to the transport, if still connected."""
+        if self.transport is not None:
+            self.transport.sendto(packet)
+
+    async def try_sending(
+        self,
+        msg: Message,
+        timeout_secs: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """
+        Send a request until it is answered, pacing every attempt.
+
+        Replaces aiolifx's try_sending, which every acknowledged write and
+        state request goes through, so its resends also wait for the rate
+        limiter. State requests give way to writes, and writes stop being
+        resent once a newer command supersedes them.
+        """
+        timeout_secs = self.timeout if timeout_secs is None else timeout_secs
+        max_attempts = self.retry_count if max_attempts is None else max_attempts
+        priority = PRIORITY_POLL if msg.response_requested else PRIORITY_COMMAND
+        generation = self.generations.current
+
+        for attempt in range(1, max_attempts + 1):
+            await self.limiter.acquire(priority)
+            if msg.seq_num not in self.message:
+                return
+            if priority == PRIORITY_COMMAND and generation != self.generations.current:
+                # A newer command replaced this write, so stop resending it.
+                callb = self.message.pop(msg.seq_num)[2]
+                if callb:
+                    callb(self, None)
+                return
+            event = asyncio.Event()
+            self.message[msg.seq_num][1] = event
+            self._write(msg.packed_message)
+            try:
+                async with asyncio.timeout(timeout_secs):
+                    await event.wait()
+            except TimeoutError:
+                if attempt < max_attempts:
+                    continue
+                if msg.seq_num in self.message:
+                    callb = self.message[msg.seq_num][2]
+                    if callb:
+                        callb(self, None)
+                    del self.message[msg.seq_num]
+                # Same as aiolifx: a request that is never answered means the
+                # ceiling has gone away.
+                self.unregister()
+            return
+
+    def _frame_methods(
+        self,
+        frame: LIFXCeilingZoneBuffer,
+        rectangles: list[tuple[int, int, int, list[tuple[int, int, int, int]]]] | None,
+        duration: float,
+        *,
+        set64: Callable[..., None],
+        copy_frame_buffer: Callable[..., None],
+    ) -> list[Callable]:
+        """
+        Return the set64 and copy_frame_buffer calls that display a frame.
+
+        A single changed rectangle is written straight to the visible
+        framebuffer. Anything else, including an unknown cached state, is
+        uploaded to the off-screen framebuffer and copied across at once.
+        Duration is passed on unchanged, so it is in whatever unit the given
+        callables expect.
+        """
+        methods: list[Callable]
+        if rectangles is not None and len(rectangles) == 1:
+            methods = [
+                partial(
+                    set64,
+                    tile_index=0,
+                    length=1,
+                    fb_index=0,
+                    x=x,
+                    y=y,
+                    width=width,
+                    duration=duration,
+                    colors=rectangle_colors,
+                )
+                for x, y, width, rectangle_colors in rectangles
+            ]
+        else:
+            methods = self._upload_methods(frame, 1, set64)
+            methods.append(
+                partial(
+                    copy_frame_buffer,
+                    tile_index=0,
+                    length=1,
+                    src_fb_index=1,
+                    dst_fb_index=0,
+                    src_x=0,
+                    src_y=0,
+                    dst_x=0,
+                    dst_y=0,
+                    width=self.tile_device_width,
+                    duration=duration,
+                )
+            )
+
+        return methods
+
+    def _upload_methods(
+        self,
+        frame: LIFXCeilingZoneBuffer,
+        fb_index: int,
+        set64: Callable[..., None],
+    ) -> list[Callable]:
+        """Return the set64 calls that write a whole frame into a framebuffer."""
+        return [
+            partial(
+                set64,
+                tile_index=0,
+                length=1,
+                fb_index=fb_index,
+                x=0,
+                y=y,
+                width=self.tile_device_width,
+                colors=frame.colors(start, start + 64),
             )
+            for start, y in self._set64_batches()
+        ]
+
+    def zone_buffer(self) -> LIFXCeilingZoneBuffer:
+        """Return a copy of the cached zones as a zone buffer."""
+        return LIFXCeilingZoneBuffer.from_colors(self.chain[0])
+
+    def _changed_rectangles(
+        self, colors: list[tuple[int, int, int, int]]
+    ) -> list[tuple[int, int, int, list[tuple[int, int, int, int]]]] | None:
+        """Return set64 rectangles for zones that differ from the cached state."""
+        try:
+            current = self.chain[0]
+        except (KeyError, IndexError):
+            return None
+
+        if len(current) != self.total_zones or None in current:
+            return None
+
+        return set64_rectangles(current, colors, self.tile_device_width)
+
+    def _set64_batches(self) -> list[tuple[int, int]]:
+        """Return (first zone, row) pairs for each 64-zone set64 batch."""
+        rows_per_batch = 64 // self.tile_device_width
+        return [
+            (start, (start // 64) * rows_per_batch)
+            for start in range(0, self.total_zones, 64)
+        ]
@@ -15,6 +15,44 @@ ATTR_UPLIGHT_SATURATION = "uplight_saturation"
 ATTR_UPLIGHT_BRIGHTNESS = "uplight_brightness"
 ATTR_UPLIGHT_KELVIN = "uplight_kelvin"
 
+ATTR_GRADIENT = "gradient"
+ATTR_STOPS = "stops"
+ATTR_ZONES = "zones"
+ATTR_ANGLE = "angle"
+ATTR_CENTER_X = "center_x"
+ATTR_CENTER_Y = "center_y"
+ATTR_POSITION = "position"
+ATTR_HUE = "hue"
+ATTR_SATURATION = "saturation"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_KELVIN = "kelvin"
+ATTR_KEYFRAMES = "keyframes"
+ATTR_REPEAT = "repeat"
+ATTR_SCENE = "scene"
+ATTR_PRELOAD = "preload"
+ATTR_SYNC = "sync"
+ATTR_FORCE = "force"
+
+GRADIENT_LINEAR = "linear"
+GRADIENT_RADIAL = "radial"
+GRADIENT_ANGULAR = "angular"
+GRADIENT_TYPES = (GRADIENT_LINEAR, GRADIENT_RADIAL, GRADIENT_ANGULAR)
+
+EFFECT_FLAME = "flame"
+EFFECT_AURORA = "aurora"
+EFFECT_BREATHE = "breathe"
+
+# Seconds between acknowledged effect frames; the frames in between are
+# streamed without acks and dropped while an acknowledged one is outstanding.
+EFFECT_SYNC_INTERVAL = 1.0
+
+# Off-screen framebuffers (fb 1 onwards) used to stage frames on the device.
+# Ceiling firmware is only known to provide one.
+OFFSCREEN_FRAMEBUFFERS = 1
+
+# Seconds a keyframe with no transition is shown before the next one starts
+KEYFRAME_MIN_HOLD = 1
+
 ATTR_UPLIGHT = "uplight"
 ATTR_POWER = "power"
 ATTR_DOWNLIGHT = "downlight"
@@ -24,6 +62,21 @@ CONF_SERIAL = "serial"
 DEFAULT_ATTEMPTS = 3
 OVERALL_TIMEOUT = 5
 
+# Bounds, in seconds, for the per-device retransmission timeout (RTO)
+MIN_RETRANSMIT_TIMEOUT = 0.05
+MAX_RETRANSMIT_TIMEOUT = 2.0
+
+# Packets a second sent to one ceiling, as LIFX recommend, and how many may
+# go back to back, such as a full 128-zone frame with its copy and power.
+SEND_RATE = 20
+SEND_BURST = 8
+
+# Seconds after a write (plus its transition) before the device state is re-read
+STATE_VERIFY_DELAY = 2
+
+# Fixed upper bound on ceilings written concurrently by a single service call
+MAX_CONCURRENT_DEVICES = 8
+
 DOMAIN = "lifx_ceiling"
 NAME = "LIFX Ceiling"
 
@@ -32,12 +85,22 @@ HSBK_SATURATION = 1
 HSBK_BRIGHTNESS = 2
 HSBK_KELVIN = 3
 
-DISCOVERY_INTERVAL = timedelta(minutes=5)
+# Ceilings are found as core LIFX config entries load and unload; the full
+# scan only catches anything those events missed.
+DISCOVERY_INTERVAL = timedelta(hours=1)
+
+# Dispatched with the MAC address when a ceiling's core LIFX entry unloads
+SIGNAL_CEILING_REMOVED = f"{DOMAIN}_ceiling_removed_{{}}"
 
 LIFX_CEILING_PRODUCT_IDS = {176, 177, 201, 202}
 LIFX_CEILING_64ZONES_PRODUCT_IDS = {176, 177}
 LIFX_CEILING_128ZONES_PRODUCT_IDS = {201, 202}
 
 SERVICE_LIFX_CEILING_SET_STATE = "set_state"
+SERVICE_LIFX_CEILING_SET_ZONES = "set_zones"
+SERVICE_LIFX_CEILING_PLAY_KEYFRAMES = "play_keyframes"
+SERVICE_LIFX_CEILING_STORE_SCENE = "store_scene"
+SERVICE_LIFX_CEILING_ACTIVATE_SCENE = "activate_scene"
+SERVICE_LIFX_CEILING_REMOVE_SCENE = "remove_scene"
 
 RUNTIME_DATA_HASS_VERSION = "2025.7.0"
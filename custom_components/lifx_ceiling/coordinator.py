@@ -2,44 +2,208 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from functools import partial
 from typing import TYPE_CHECKING
 
 from awesomeversion import AwesomeVersion
+from homeassistant.components.lifx.const import DOMAIN as LIFX_DOMAIN
 from homeassistant.components.light import ATTR_TRANSITION
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
 from homeassistant.const import ATTR_DEVICE_ID, MAJOR_VERSION, MINOR_VERSION
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .api import LIFXCeiling
+from .api import LIFXCeiling, LIFXCeilingError
 from .const import (
     _LOGGER,
+    ATTR_ANGLE,
+    ATTR_CENTER_X,
+    ATTR_CENTER_Y,
+    ATTR_DOWNLIGHT,
     ATTR_DOWNLIGHT_BRIGHTNESS,
     ATTR_DOWNLIGHT_HUE,
     ATTR_DOWNLIGHT_KELVIN,
     ATTR_DOWNLIGHT_SATURATION,
+    ATTR_FORCE,
+    ATTR_GRADIENT,
+    ATTR_KEYFRAMES,
+    ATTR_PRELOAD,
+    ATTR_REPEAT,
+    ATTR_SCENE,
+    ATTR_STOPS,
+    ATTR_SYNC,
+    ATTR_UPLIGHT,
     ATTR_UPLIGHT_BRIGHTNESS,
     ATTR_UPLIGHT_HUE,
     ATTR_UPLIGHT_KELVIN,
     ATTR_UPLIGHT_SATURATION,
+    ATTR_ZONES,
     DOMAIN,
+    GRADIENT_LINEAR,
+    MAX_CONCURRENT_DEVICES,
+    SIGNAL_CEILING_REMOVED,
+    STATE_VERIFY_DELAY,
+)
+from .effects import LIFXCeilingEffectEngine
+from .gradient import gradient_positions, gradient_stops, render_gradient
+from .scenes import LIFXCeilingSceneRegistry
+from .util import (
+    LIFXCeilingSupersededError,
+    find_lifx_coordinators,
+    hsbk_from_service,
+    lifx_ceiling_coordinator,
 )
-from .util import async_execute_lifx, find_lifx_coordinators
+from .zones import LIFXCeilingZoneBuffer
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Mapping
     from datetime import datetime
+    from typing import Any
 
     from homeassistant.components.lifx.coordinator import LIFXUpdateCoordinator
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.core import Event, HomeAssistant, ServiceCall
     from homeassistant.helpers.device_registry import DeviceEntry
 
+    from .api import LIFXCeilingZoneSummary
+
 type LIFXCeilingConfigEntry = ConfigEntry[LIFXCeilingUpdateCoordinator]
 
 
+class LIFXCeilingCommandCoalescer:
+    """
+    Serialise writes to a single ceiling, keeping only the latest per light.
+
+    Commands are keyed by the light they target. While a write is in flight,
+    a newer command for the same key replaces the pending one and every
+    caller waiting on the replaced command is released when the newest one
+    completes, so bursts never queue up more than one write per light.
+    A newer command for the light being written also supersedes the write
+    in flight, which stops retrying so the newer one goes out at once.
+    """
+
+    def __init__(self, supersede: Callable[[], None] | None = None) -> None:
+        """Initialise the coalescer, with the ceiling's supersede callback."""
+        self._lock = asyncio.Lock()
+        self._pending: dict[
+            str, tuple[Callable[[], Awaitable[None]], list[asyncio.Future[None]]]
+        ] = {}
+        self._supersede = supersede
+        self._running: str | None = None
+
+    async def async_run(self, key: str, command: Callable[[], Awaitable[None]]) -> None:
+        """Run the command once any in-flight write has finished."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        _, waiters = self._pending.get(key, (None, []))
+        waiters.append(future)
+        self._pending[key] = (command, waiters)
+        if key == self._running and self._supersede is not None:
+            self._supersede()
+
+        try:
+            while not future.done():
+                async with self._lock:
+                    if future.done():
+                        break
+                    await self._async_run_next()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        await future
+
+    async def _async_run_next(self) -> None:
+        """Send the oldest pending command and release everyone waiting on it."""
+        key = next(iter(self._pending))
+        command, waiters = self._pending.pop(key)
+        self._running = key
+        try:
+            await command()
+        except LIFXCeilingSupersededError:
+            # Whoever superseded the write brings the light up to date.
+            if not self._hand_over(key, waiters):
+                _release_waiters(waiters)
+        except asyncio.CancelledError:
+            # Hand the command back so another waiter can send it.
+            if not self._hand_over(key, waiters):
+                self._pending = {key: (command, waiters), **self._pending}
+            raise
+        except Exception as err:  # noqa: BLE001
+            _release_waiters(waiters, err)
+        else:
+            _release_waiters(waiters)
+        finally:
+            self._running = None
+
+    def _hand_over(self, key: str, waiters: list[asyncio.Future[None]]) -> bool:
+        """Make a newer pending command for the key release the waiters too."""
+        if key not in self._pending:
+            return False
+        newer_command, newer_waiters = self._pending[key]
+        self._pending[key] = (newer_command, waiters + newer_waiters)
+        return True
+
+
+class LIFXCeilingStateDispatcher:
+    """
+    The one core coordinator listener of a ceiling, fanning out to its lights.
+
+    Every core update works out the ceiling's zone summary once and passes it
+    to the callback of each light whose part of it, or whose effect, changed
+    since that light was last called.
+    """
+
+    def __init__(self, device: LIFXCeiling, effects: LIFXCeilingEffectEngine) -> None:
+        """Initialise the dispatcher with no lights."""
+        self._device = device
+        self._effects = effects
+        self._callbacks: dict[str, Callable[[LIFXCeilingZoneSummary], None]] = {}
+        self._states: dict[str, tuple[Any, ...]] = {}
+
+    def add(
+        self, light: str, update: Callable[[LIFXCeilingZoneSummary], None]
+    ) -> Callable[[], None]:
+        """Call update for changes to a light until the returned callable runs."""
+        self._callbacks[light] = update
+        # A new callback has not seen any state yet.
+        self._states.pop(light, None)
+
+        def _remove() -> None:
+            if self._callbacks.get(light) is update:
+                del self._callbacks[light]
+                self._states.pop(light, None)
+
+        return _remove
+
+    @callback
+    def async_dispatch(self) -> None:
+        """Pass the zone summary to every light whose state changed."""
+        summary = self._device.zone_summary
+        for light, update in list(self._callbacks.items()):
+            if light == ATTR_UPLIGHT:
+                state = (summary.uplight_is_on, summary.uplight_color)
+            else:
+                state = (summary.downlight_is_on, summary.downlight_color)
+            state += (self._effects.effect(self._device, light),)
+            if self._states.get(light) != state:
+                self._states[light] = state
+                update(summary)
+
+
 class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
     """LIFX Ceiling data update coordinator."""
 
@@ -60,69 +224,220 @@ class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
         )
 
         self.stop_discovery: Callable[[], None] | None = None
-        self._discovery_callback: Callable[[LIFXCeiling], None] | None = None
+        self._discovery_listeners: list[Callable[[LIFXCeiling], None]] = []
         self._ceiling_coordinators: dict[str, LIFXUpdateCoordinator] = {}
+        self._entry_macs: dict[str, str] = {}
+        self._device_ceilings: dict[str, LIFXCeiling] = {}
         self._ceilings: set[LIFXCeiling] = set()
         self._hass_version = AwesomeVersion(f"{MAJOR_VERSION}.{MINOR_VERSION}")
+        # Fixed, not a user option; kept per instance so tests can lower it.
+        self.max_concurrency: int = MAX_CONCURRENT_DEVICES
+        self._command_coalescers: dict[str, LIFXCeilingCommandCoalescer] = {}
+        self._state_dispatchers: dict[
+            str, tuple[LIFXCeilingStateDispatcher, Callable[[], None]]
+        ] = {}
+        self._cancel_verify: dict[str, Callable[[], None]] = {}
+        self.discovery_runs = 0
+        self.last_discovery: datetime | None = None
+        self.last_discovery_duration: float | None = None
+        self.effects = LIFXCeilingEffectEngine(hass)
+        self.scenes = LIFXCeilingSceneRegistry()
+        self.last_sync: dict[str, Any] | None = None
 
     @property
     def devices(self) -> list[LIFXCeiling]:
         """Return a list of instantiated LIFX Ceiling devices."""
         return list(self._ceilings)
 
-    @property
-    def discovery_callback(self) -> Callable[[LIFXCeiling], None] | None:
-        """Return the discovery callback for the LIFX Ceiling Finder."""
-        return self._discovery_callback
-
     @callback
-    def set_discovery_callback(
-        self, callback: Callable[[LIFXCeiling], None]
-    ) -> Callable[[LIFXCeiling], None] | None:
-        """Set the discovery callback for the LIFX Ceiling Finder."""
-        old_callback = self._discovery_callback
-        self._discovery_callback = callback
-        return old_callback
+    def async_add_discovery_listener(
+        self, listener: Callable[[LIFXCeiling], None]
+    ) -> Callable[[], None]:
+        """Call listener for every newly discovered ceiling; return a remover."""
+        self._discovery_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._discovery_listeners:
+                self._discovery_listeners.remove(listener)
+
+        return _remove
 
     def async_add_core_listener(
-        self, device: LIFXCeiling, callback: Callable[[], None]
+        self,
+        device: LIFXCeiling,
+        light: str,
+        update: Callable[[LIFXCeilingZoneSummary], None],
+    ) -> Callable[[], None]:
+        """
+        Call update with the zone summary whenever a light's state changes.
+
+        The ceiling's core coordinator gets a single listener however many
+        lights are registered; see LIFXCeilingStateDispatcher.
+        """
+        entry = self._state_dispatchers.get(device.mac_addr)
+        if entry is None:
+            dispatcher = LIFXCeilingStateDispatcher(device, self.effects)
+            core_coordinator = self._ceiling_coordinators[device.mac_addr]
+            remove_listener = core_coordinator.async_add_listener(
+                partial(self._async_core_updated, core_coordinator, dispatcher)
+            )
+            entry = self._state_dispatchers[device.mac_addr] = (
+                dispatcher,
+                remove_listener,
+            )
+        return entry[0].add(light, update)
+
+    @callback
+    def _async_core_updated(
+        self,
+        core_coordinator: LIFXUpdateCoordinator,
+        dispatcher: LIFXCeilingStateDispatcher,
     ) -> None:
-        """Set the update listener for the LIFX Ceiling Finder."""
-        self._ceiling_coordinators[device.mac_addr].async_add_listener(callback)
+        """
+        Dispatch a core update to the lights of its ceiling.
+
+        The update may have read new zones or power, so the zone summary is
+        recomputed. A failed update means the ceiling stopped answering,
+        perhaps because it was switched off at the wall, so its staged frames
+        are forgotten.
+        """
+        device = core_coordinator.device
+        device.invalidate_zone_summary()
+        if not core_coordinator.last_update_success:
+            device.forget_staged_frames()
+        dispatcher.async_dispatch()
 
     async def _async_update_data(self) -> list[LIFXCeiling]:
         """Return the list of LIFX Ceilings."""
         return list(self._ceilings)
 
     async def async_update(self, update_time: datetime | None = None) -> None:
-        """Fetch new LIFX Ceiling coordinators from the core integration."""
-        try:
-            lifx_coordinators: list[LIFXUpdateCoordinator] = [
-                coordinator
-                for coordinator in find_lifx_coordinators(self.hass)
-                if coordinator.device.mac_addr not in self._ceiling_coordinators
-            ]
+        """
+        Scan every loaded core LIFX config entry for ceilings.
 
+        Ceilings are normally added and removed as their core entries load and
+        unload (see async_track_lifx_entries), so this full scan is only run at
+        setup and as an infrequent safety net for anything those events missed.
+        """
+        started = time.perf_counter()
+        try:
+            lifx_coordinators = find_lifx_coordinators(self.hass)
+            entry_ids = {
+                coordinator.config_entry.entry_id for coordinator in lifx_coordinators
+            }
+            for entry_id in set(self._entry_macs) - entry_ids:
+                self._async_remove_lifx_entry(entry_id)
             for coordinator in lifx_coordinators:
-                # Cast the existing connection to a LIFX Ceiling objects
-                ceiling: LIFXCeiling = LIFXCeiling.cast(coordinator.device)
-                self._ceiling_coordinators[ceiling.mac_addr] = coordinator
-
-                self._ceilings.add(ceiling)
-
-                if self._discovery_callback and callable(self._discovery_callback):
-                    self._discovery_callback(ceiling)
+                self._async_add_lifx_coordinator(coordinator)
 
         except HomeAssistantError as err:
             _LOGGER.warning("Error updating LIFX Ceiling coordinators: %s", err)
+        finally:
+            self.discovery_runs += 1
+            self.last_discovery = dt_util.utcnow()
+            self.last_discovery_duration = time.perf_counter() - started
+
+    @callback
+    def async_track_lifx_entries(self) -> Callable[[], None]:
+        """Add and remove ceilings as core LIFX config entries load and unload."""
+        return async_dispatcher_connect(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_lifx_entry_changed
+        )
+
+    @callback
+    def async_track_device_registry(self) -> Callable[[], None]:
+        """Keep the device ID to ceiling cache current as devices change."""
+        return self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_device_registry_updated,
+            event_filter=self._async_device_registry_filter,
+        )
+
+    @callback
+    def _async_device_registry_filter(
+        self, event_data: dr.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Only handle changes to devices whose ceiling is cached."""
+        return event_data["device_id"] in self._device_ceilings
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Forget the cached ceiling of an updated or removed device."""
+        self._device_ceilings.pop(event.data["device_id"], None)
+
+    @callback
+    def _async_lifx_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Update the ceiling index when a core LIFX config entry changes state."""
+        if entry.domain != LIFX_DOMAIN:
+            return
+
+        if change is not ConfigEntryChange.REMOVED and (
+            entry.state is ConfigEntryState.LOADED
+        ):
+            if (coordinator := lifx_ceiling_coordinator(entry)) is not None:
+                self._async_add_lifx_coordinator(coordinator)
+        else:
+            self._async_remove_lifx_entry(entry.entry_id)
+
+    @callback
+    def _async_add_lifx_coordinator(self, coordinator: LIFXUpdateCoordinator) -> None:
+        """Index a core LIFX ceiling coordinator and announce the new ceiling."""
+        mac_addr: str = coordinator.device.mac_addr
+        self._entry_macs[coordinator.config_entry.entry_id] = mac_addr
+        if mac_addr in self._ceiling_coordinators:
+            return
 
-    async def async_set_state(self, call: ServiceCall) -> None:
-        """Handle the set_state service call."""
+        # Cast the existing connection to a LIFX Ceiling objects
+        ceiling: LIFXCeiling = LIFXCeiling.cast(coordinator.device)
+        self._ceiling_coordinators[mac_addr] = coordinator
+        self._ceilings.add(ceiling)
+
+        for listener in list(self._discovery_listeners):
+            listener(ceiling)
+
+    @callback
+    def _async_remove_lifx_entry(self, entry_id: str) -> None:
+        """Forget the ceiling of an unloaded core LIFX entry and its entities."""
+        if (mac_addr := self._entry_macs.pop(entry_id, None)) is None:
+            return
+
+        coordinator = self._ceiling_coordinators.pop(mac_addr, None)
+        if coordinator is not None:
+            self._ceilings.discard(coordinator.device)
+        self._device_ceilings = {
+            device_id: device
+            for device_id, device in self._device_ceilings.items()
+            if device.mac_addr != mac_addr
+        }
+        self._command_coalescers.pop(mac_addr, None)
+        if dispatcher := self._state_dispatchers.pop(mac_addr, None):
+            _, remove_listener = dispatcher
+            remove_listener()
+        if coordinator is not None:
+            self.effects.async_stop_device(coordinator.device)
+        if cancel := self._cancel_verify.pop(mac_addr, None):
+            cancel()
+
+        async_dispatcher_send(self.hass, SIGNAL_CEILING_REMOVED.format(mac_addr))
+
+    async def async_set_state(self, call: ServiceCall) -> dict[str, Any] | None:
+        """
+        Handle the set_state service call.
+
+        With sync, every target is staged first and then started in one burst;
+        the timing report of the burst is returned. Otherwise ceilings already
+        showing the requested state are left alone unless force is set.
+        """
         device_ids: list[str] | str | None = call.data.get(ATTR_DEVICE_ID)
 
         if device_ids is None:
             _LOGGER.warning("Set state called with no device ID; ignoring")
-            return
+            return None
 
         if not isinstance(device_ids, list):
             device_ids = [str(device_ids)]
@@ -174,84 +489,602 @@ class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
         )
 
         transition = call.data.get(ATTR_TRANSITION, 0)
+        force = bool(call.data.get(ATTR_FORCE, False))
+        turn_off = downlight_brightness == 0 and uplight_brightness == 0
 
-        device_registry = dr.async_get(self.hass)
-        for device_id in device_ids:
-            device_entry: DeviceEntry | None = device_registry.async_get(device_id)
-
-            if device_entry is None:
-                _LOGGER.warning(
-                    "Device ID %s not found in the device registry;"
-                    " the device may have been removed or the service"
-                    " call targets an incorrect device",
-                    device_id,
-                )
-                continue
+        def _frame(device: LIFXCeiling) -> LIFXCeilingZoneBuffer:
+            colors = LIFXCeilingZoneBuffer.filled(downlight_color, device.total_zones)
+            colors[device.uplight_zone] = uplight_color
+            return colors
 
-            device: LIFXCeiling | None = None
-            for identifier in device_entry.identifiers:
-                if (
-                    identifier[0] != DOMAIN
-                    or identifier[1] not in self._ceiling_coordinators
-                ):
-                    continue
+        if call.data.get(ATTR_SYNC) and not turn_off:
+            return await self._async_apply_synchronized(
+                self._async_resolve_devices(device_ids), _frame, transition
+            )
 
-                coordinator: LIFXUpdateCoordinator | None = (
-                    self._ceiling_coordinators.get(identifier[1])
-                )
+        async def _async_apply(device: LIFXCeiling) -> bool:
+            """Apply the requested state to a single ceiling."""
+            if turn_off:
+                # set_state has always passed its transition to set_power as is.
+                return await device.async_power_off(transition / 1000, force=force)
+            return await device.async_set64(
+                colors=_frame(device),
+                duration=transition,
+                power_on=bool(device.power_level == 0),
+                force=force,
+            )
 
-                if (
-                    coordinator is not None
-                    and hasattr(coordinator, "device")
-                    and isinstance(coordinator.device, LIFXCeiling)
-                ):
-                    device = coordinator.device
-                    break
-
-                _LOGGER.warning(
-                    "Device ID %s matched identifier %s but coordinator is invalid",
-                    device_id,
-                    identifier[1],
-                )
+        await self._async_apply_to_devices(device_ids, _async_apply, transition)
+        return None
 
-            if device is None:
-                _LOGGER.warning(
-                    "No valid LIFX Ceiling device found for device ID %s", device_id
-                )
-                continue
+    async def async_set_zones(self, call: ServiceCall) -> dict[str, Any] | None:
+        """Handle the set_zones service call, synchronized like set_state."""
+        transition = call.data.get(ATTR_TRANSITION, 0)
+        force = call.data.get(ATTR_FORCE, False)
+        zones_frame = self._zones_frame(call.data)
+
+        if call.data.get(ATTR_SYNC):
+            return await self._async_apply_synchronized(
+                self._async_resolve_devices(call.data[ATTR_DEVICE_ID]),
+                zones_frame,
+                transition,
+            )
+
+        async def _async_apply(device: LIFXCeiling) -> bool:
+            """Paint the zones of a single ceiling."""
+            return await device.async_set64(
+                colors=zones_frame(device),
+                duration=transition,
+                power_on=bool(device.power_level == 0),
+                force=force,
+            )
+
+        await self._async_apply_to_devices(
+            call.data[ATTR_DEVICE_ID], _async_apply, transition
+        )
+        return None
+
+    async def async_play_keyframes(self, call: ServiceCall) -> None:
+        """
+        Handle the play_keyframes service call.
+
+        Every keyframe is painted like a set_zones call and staged in the
+        ceiling's off-screen framebuffers; the call returns once the first
+        keyframes are staged and the ceiling plays them in the background.
+        """
+        keyframes = [
+            (self._zones_frame(keyframe), keyframe.get(ATTR_TRANSITION, 0))
+            for keyframe in call.data[ATTR_KEYFRAMES]
+        ]
+        repeat = call.data.get(ATTR_REPEAT, False)
+
+        async def _async_apply(device: LIFXCeiling) -> None:
+            """Stage and start the keyframes on a single ceiling."""
+            await self.effects.async_play_keyframes(
+                device,
+                [
+                    (zones_frame(device), transition)
+                    for zones_frame, transition in keyframes
+                ],
+                repeat=repeat,
+                on_keyframe=self._async_state_written,
+            )
+
+        await self._async_apply_to_devices(call.data[ATTR_DEVICE_ID], _async_apply, 0)
+
+    async def async_store_scene(self, call: ServiceCall) -> None:
+        """
+        Handle the store_scene service call.
+
+        Paints the scene like set_zones, or takes each ceiling's current zones,
+        and keeps it ready to send. A preloaded scene is also uploaded to the
+        ceiling's off-screen framebuffer now, and again after anything else
+        has used it, so activating it is a single packet.
+        """
+        name = call.data[ATTR_SCENE]
+        preload = call.data.get(ATTR_PRELOAD, True)
+        zones_frame = (
+            self._zones_frame(call.data)
+            if ATTR_STOPS in call.data or ATTR_ZONES in call.data
+            else None
+        )
+
+        devices = self._async_resolve_devices(call.data[ATTR_DEVICE_ID])
+        for device in devices.values():
+            frame = device.zone_buffer() if zones_frame is None else zones_frame(device)
+            try:
+                self.scenes.store(name, device, frame, preload=preload)
+            except LIFXCeilingError as err:
+                msg = f"Cannot store scene {name!r} for {device.label}: {err}"
+                raise HomeAssistantError(msg) from err
+
+        if preload:
+            await asyncio.gather(
+                *(self._async_preload_scene(device) for device in devices.values())
+            )
+
+    async def async_activate_scene(self, call: ServiceCall) -> None:
+        """
+        Handle the activate_scene service call.
+
+        Sends each ceiling its stored packets, or only the framebuffer copy if
+        the scene is preloaded. Without device IDs, every ceiling the scene was
+        stored for is activated.
+        """
+        name = call.data[ATTR_SCENE]
+        transition = call.data.get(ATTR_TRANSITION, 0)
+        mac_addrs = self.scenes.mac_addrs(name)
+
+        if ATTR_DEVICE_ID in call.data:
+            devices = self._async_resolve_devices(call.data[ATTR_DEVICE_ID])
+        else:
+            devices = {
+                mac_addr: coordinator.device
+                for mac_addr in mac_addrs
+                if (coordinator := self._ceiling_coordinators.get(mac_addr)) is not None
+            }
 
-            if downlight_brightness == 0 and uplight_brightness == 0:
-                await async_execute_lifx(
-                    partial(device.set_power, value="off", duration=transition)
+        async def _async_apply(device: LIFXCeiling) -> None:
+            """Show the scene on a single ceiling."""
+            scene = self.scenes.get(name, device)
+            await device.async_show_packed(
+                scene.colors,
+                scene.payloads,
+                transition,
+                power_on=bool(device.power_level == 0),
+            )
+
+        await self._async_apply_to_ceilings(devices, _async_apply, transition)
+
+    @callback
+    def async_remove_scene(self, call: ServiceCall) -> None:
+        """Handle the remove_scene service call."""
+        self.scenes.remove(call.data[ATTR_SCENE])
+
+    async def _async_preload_scene(self, device: LIFXCeiling) -> None:
+        """Upload a ceiling's preloaded scene unless its framebuffers are busy."""
+        scene = self.scenes.preloaded(device)
+        if scene is None or self.effects.active(device):
+            return
+        try:
+            await device.async_stage_packed(scene.colors, scene.payloads)
+        except (TimeoutError, LIFXCeilingSupersededError) as err:
+            _LOGGER.debug(
+                "Could not preload scene %r on %s: %s", scene.name, device.label, err
+            )
+
+    def _zones_frame(
+        self, data: Mapping[str, Any]
+    ) -> Callable[[LIFXCeiling], LIFXCeilingZoneBuffer]:
+        """
+        Return a function painting set_zones data onto a given ceiling.
+
+        Paints the downlight with a gradient through the given stops, or sets
+        every zone from an explicit array. A gradient, or an array covering
+        only the downlight, keeps the current uplight color, dimmed to zero if
+        the ceiling is off so only the downlight comes on.
+        """
+        if ATTR_ZONES in data:
+            zones = [hsbk_from_service(*zone) for zone in data[ATTR_ZONES]]
+
+            def _frame(device: LIFXCeiling) -> LIFXCeilingZoneBuffer:
+                if len(zones) != device.uplight_zone:
+                    return LIFXCeilingZoneBuffer.from_colors(zones)
+                frame = LIFXCeilingZoneBuffer.from_colors(
+                    [*zones, device.chain[0][device.uplight_zone]]
                 )
-            else:
-                colors = [downlight_color] * (device.total_zones - 1) + [uplight_color]
-                await device.async_set64(
-                    colors=colors,
-                    duration=transition,
+                if device.power_level == 0:
+                    frame.zero_brightness(start=device.uplight_zone)
+                return frame
+
+            return _frame
+
+        stops = gradient_stops(data[ATTR_STOPS])
+        layout = (
+            data.get(ATTR_ANGLE, 0.0),
+            data.get(ATTR_CENTER_X, 50) / 100,
+            data.get(ATTR_CENTER_Y, 50) / 100,
+        )
+        gradient = data.get(ATTR_GRADIENT, GRADIENT_LINEAR)
+
+        def _frame(device: LIFXCeiling) -> LIFXCeilingZoneBuffer:
+            positions = gradient_positions(
+                gradient, device.tile_device_width, device.total_zones, *layout
+            )
+            frame = render_gradient(stops, positions)
+            frame[device.uplight_zone] = device.chain[0][device.uplight_zone]
+            if device.power_level == 0:
+                frame.zero_brightness(start=device.uplight_zone)
+            return frame
+
+        return _frame
+
+    async def _async_apply_to_devices(
+        self,
+        device_ids: list[str],
+        apply: Callable[[LIFXCeiling], Awaitable[bool | None]],
+        transition: int,
+    ) -> None:
+        """Run a service action against each targeted device ID."""
+        await self._async_apply_to_ceilings(
+            self._async_resolve_devices(device_ids), apply, transition
+        )
+
+    async def _async_apply_to_ceilings(
+        self,
+        devices: dict[str, LIFXCeiling],
+        apply: Callable[[LIFXCeiling], Awaitable[bool | None]],
+        transition: int,
+    ) -> None:
+        """
+        Run a service action against ceilings keyed by how they were targeted.
+
+        Targets are written concurrently, at most max_concurrency at a time.
+        A failing ceiling does not stall the others; failures are logged and
+        raised together once every target has finished. An action returning
+        False sent nothing, so there is no new state to publish or verify.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _async_apply(device: LIFXCeiling) -> None:
+            """Apply the action to a single ceiling."""
+            # The action replaces whatever effect, keyframes or earlier
+            # command was still being sent.
+            device.generations.supersede()
+            self.effects.async_stop_device(device)
+            async with semaphore:
+                sent = await apply(device)
+            if sent is not False:
+                self._async_state_written(device, transition)
+
+        results = await asyncio.gather(
+            *(_async_apply(device) for device in devices.values()),
+            return_exceptions=True,
+        )
+
+        _raise_for_failures(devices, results)
+
+    async def _async_apply_synchronized(
+        self,
+        devices: dict[str, LIFXCeiling],
+        frame: Callable[[LIFXCeiling], LIFXCeilingZoneBuffer],
+        transition: int,
+    ) -> dict[str, Any]:
+        """
+        Stage a frame on every ceiling, then start all their transitions at once.
+
+        Frames are uploaded to the off-screen framebuffers first, at most
+        max_concurrency at a time. Only then are the copy_frame_buffer packets
+        sent, one straight after another, so the ceilings start fading together
+        rather than staggered by each one's upload. Returns how far apart the
+        copies left and how far apart the ceilings are estimated to have
+        started, taking each copy to arrive half an ack round trip after it
+        was sent.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _async_stage(device: LIFXCeiling) -> None:
+            """Upload the frame to a single ceiling without showing it."""
+            device.generations.supersede()
+            self.effects.async_stop_device(device)
+            async with semaphore:
+                await device.async_stage_frame(frame(device))
+
+        staging = await asyncio.gather(
+            *(_async_stage(device) for device in devices.values()),
+            return_exceptions=True,
+        )
+        results = dict(zip(devices, staging, strict=True))
+        staged = {
+            device_id: device
+            for device_id, device in devices.items()
+            if results[device_id] is None
+        }
+        for device in staged.values():
+            device.show_timing = None
+
+        # Each copy is written to the socket as soon as its task first runs,
+        # so they all leave within one pass of the event loop.
+        shown = await asyncio.gather(
+            *(
+                device.async_show_frame(
+                    1,
+                    transition,
                     power_on=bool(device.power_level == 0),
+                    immediate=True,
                 )
+                for device in staged.values()
+            ),
+            return_exceptions=True,
+        )
+        results.update(zip(staged, shown, strict=True))
+        for device_id, device in staged.items():
+            if results[device_id] is None:
+                self._async_state_written(device, transition)
+
+        report = self.last_sync = _sync_report(staged)
+        _LOGGER.debug(
+            "Synchronized %d LIFX Ceilings: copies sent within %s ms,"
+            " started within about %s ms",
+            len(staged),
+            report["send_spread_ms"],
+            report["start_spread_ms"],
+        )
+        _raise_for_failures(devices, list(results.values()))
+        return report
+
+    @callback
+    def _async_resolve_devices(self, device_ids: list[str]) -> dict[str, LIFXCeiling]:
+        """Return the LIFX Ceilings for device registry IDs, skipping unknown ones."""
+        devices: dict[str, LIFXCeiling] = {}
+        for device_id in device_ids:
+            device = self._async_resolve_device(device_id)
+            if device is not None:
+                devices[device_id] = device
+        return devices
+
+    @callback
+    def _async_resolve_device(self, device_id: str) -> LIFXCeiling | None:
+        """Return the LIFX Ceiling for a device registry ID, caching the result."""
+        if (device := self._device_ceilings.get(device_id)) is not None:
+            return device
+
+        device = self._async_lookup_device(dr.async_get(self.hass), device_id)
+        if device is not None:
+            self._device_ceilings[device_id] = device
+        return device
+
+    @callback
+    def _async_lookup_device(
+        self, device_registry: dr.DeviceRegistry, device_id: str
+    ) -> LIFXCeiling | None:
+        """Find the LIFX Ceiling for a device registry ID from its identifiers."""
+        device_entry: DeviceEntry | None = device_registry.async_get(device_id)
+
+        if device_entry is None:
+            _LOGGER.warning(
+                "Device ID %s not found in the device registry;"
+                " the device may have been removed or the service"
+                " call targets an incorrect device",
+                device_id,
+            )
+            return None
+
+        for identifier in device_entry.identifiers:
+            if (
+                identifier[0] != DOMAIN
+                or identifier[1] not in self._ceiling_coordinators
+            ):
+                continue
+
+            coordinator: LIFXUpdateCoordinator | None = self._ceiling_coordinators.get(
+                identifier[1]
+            )
+
+            if (
+                coordinator is not None
+                and hasattr(coordinator, "device")
+                and isinstance(coordinator.device, LIFXCeiling)
+            ):
+                return coordinator.device
+
+            _LOGGER.warning(
+                "Device ID %s matched identifier %s but coordinator is invalid",
+                device_id,
+                identifier[1],
+            )
+
+        _LOGGER.warning(
+            "No valid LIFX Ceiling device found for device ID %s", device_id
+        )
+        return None
+
+    async def _async_run_command(
+        self,
+        device: LIFXCeiling,
+        light: str,
+        command: Callable[[], Awaitable[bool | None]],
+        duration: int,
+    ) -> None:
+        """
+        Send a zone command through the device's coalescer.
+
+        A command returning False sent nothing, so no state is published.
+        """
+        coalescer = self._command_coalescers.get(device.mac_addr)
+        if coalescer is None:
+            coalescer = self._command_coalescers[device.mac_addr] = (
+                LIFXCeilingCommandCoalescer(device.generations.supersede)
+            )
+
+        async def _async_send() -> None:
+            if await command() is not False:
+                self._async_state_written(device, duration)
+
+        await coalescer.async_run(light, _async_send)
+
+    @callback
+    def _async_state_written(self, device: LIFXCeiling, duration: int) -> None:
+        """
+        Publish the optimistic state of a ceiling and schedule a verification.
+
+        The device already holds the frame that was written, so entities are
+        updated straight away. The confirming poll is deferred until after the
+        transition and pushed back by every further write to the same ceiling.
+        If the poll finds a different frame, the write did not show what was
+        expected, so the staged frames are forgotten before the scene preload.
+        """
+        core_coordinator = self._ceiling_coordinators[device.mac_addr]
+        core_coordinator.async_update_listeners()
+
+        if cancel := self._cancel_verify.pop(device.mac_addr, None):
+            cancel()
+
+        async def _async_verify(_now: datetime) -> None:
+            self._cancel_verify.pop(device.mac_addr, None)
+            expected = list(device.chain[0])
+            # async_request_refresh would return before its debouncer polls,
+            # and this read is already debounced by the timer.
+            await core_coordinator.async_refresh()
+            if not core_coordinator.last_update_success or device.chain[0] != expected:
+                device.forget_staged_frames()
+            await self._async_preload_scene(device)
+
+        self._cancel_verify[device.mac_addr] = async_call_later(
+            self.hass, STATE_VERIFY_DELAY + duration, _async_verify
+        )
+
+    async def async_shutdown(self) -> None:
+        """
+        Stop effects, cancel pending verification reads and shut down.
+
+        The core coordinators outlive this entry, so the state dispatchers'
+        listeners on them are removed too.
+        """
+        self.effects.async_stop_all()
+        for cancel in self._cancel_verify.values():
+            cancel()
+        self._cancel_verify.clear()
+        for _, remove_listener in self._state_dispatchers.values():
+            remove_listener()
+        self._state_dispatchers.clear()
+        await super().async_shutdown()
+
+    @callback
+    def async_start_effect(self, device: LIFXCeiling, light: str, effect: str) -> None:
+        """Start a host-rendered effect on the uplight or downlight."""
+        self.effects.async_start(device, light, effect)
+
+    async def async_stop_effect(
+        self, device: LIFXCeiling, light: str, *, restore: bool = False
+    ) -> None:
+        """
+        Stop the effect on the uplight or downlight, if one is running.
+
+        With restore, the light's zones are put back as they were before the
+        effect started. Otherwise they are left for the write that follows.
+        """
+        self.effects.async_stop_keyframes(device)
+        effect = self.effects.async_stop(device, light)
+        if effect is None or not restore:
+            return
+
+        async def _async_restore() -> None:
+            frame = device.zone_buffer()
+            effect.restore(frame)
+            await device.async_set64(colors=frame, full_frame=True)
+
+        await self._async_run_command(device, light, _async_restore, 0)
 
     async def turn_uplight_on(
         self, device: LIFXCeiling, color: tuple[int, int, int, int], duration: int = 0
     ) -> None:
         """Turn on the uplight."""
-        await device.turn_uplight_on(color, duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_run_command(
+            device,
+            ATTR_UPLIGHT,
+            partial(device.turn_uplight_on, color, duration),
+            duration,
+        )
 
     async def turn_uplight_off(self, device: LIFXCeiling, duration: int = 0) -> None:
         """Turn off the uplight."""
-        await device.turn_uplight_off(duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_run_command(
+            device, ATTR_UPLIGHT, partial(device.turn_uplight_off, duration), duration
+        )
 
     async def turn_downlight_on(
         self, device: LIFXCeiling, color: tuple[int, int, int, int], duration: int = 0
     ) -> None:
         """Turn on the downlight."""
-        await device.turn_downlight_on(color, duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_run_command(
+            device,
+            ATTR_DOWNLIGHT,
+            partial(device.turn_downlight_on, color, duration),
+            duration,
+        )
 
     async def turn_downlight_off(self, device: LIFXCeiling, duration: int = 0) -> None:
         """Turn off the downlight."""
-        await device.turn_downlight_off(duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_run_command(
+            device,
+            ATTR_DOWNLIGHT,
+            partial(device.turn_downlight_off, duration),
+            duration,
+        )
+
+
+def _release_waiters(
+    waiters: list[asyncio.Future[None]], err: Exception | None = None
+) -> None:
+    """Complete every waiter still pending, failing them with err if given."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if err is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(err)
+
+
+def _raise_for_failures(
+    devices: dict[str, LIFXCeiling], results: list[BaseException | None]
+) -> None:
+    """
+    Log every ceiling that failed, then raise them together.
+
+    A ceiling whose write was superseded by a newer command has not failed.
+    """
+    failed: list[str] = []
+    for device_id, result in zip(devices, results, strict=True):
+        if isinstance(result, LIFXCeilingSupersededError):
+            _LOGGER.debug("Command for device ID %s was superseded", device_id)
+        elif isinstance(result, Exception):
+            _LOGGER.warning(
+                "Failed to set state for device ID %s: %s", device_id, result
+            )
+            failed.append(device_id)
+        elif isinstance(result, BaseException):
+            raise result
+
+    if failed:
+        msg = (
+            f"Failed to set state for {len(failed)} of {len(devices)}"
+            f" LIFX Ceiling devices: {', '.join(failed)}"
+        )
+        raise HomeAssistantError(msg)
+
+
+def _sync_report(devices: dict[str, LIFXCeiling]) -> dict[str, Any]:
+    """Summarise when each ceiling's synchronized copy was sent and acked."""
+    timings = {
+        device_id: device.show_timing
+        for device_id, device in devices.items()
+        if device.show_timing is not None
+    }
+    if not timings:
+        return {"send_spread_ms": None, "start_spread_ms": None, "devices": {}}
+
+    starts = {
+        device_id: sent if acked is None else (sent + acked) / 2
+        for device_id, (sent, acked) in timings.items()
+    }
+    first_sent = min(sent for sent, _ in timings.values())
+    first_start = min(starts.values())
+    return {
+        "send_spread_ms": _ms(max(sent for sent, _ in timings.values()) - first_sent),
+        "start_spread_ms": _ms(max(starts.values()) - first_start),
+        "devices": {
+            device_id: {
+                "sent_ms": _ms(sent - first_sent),
+                "ack_ms": None if acked is None else _ms(acked - sent),
+                "start_ms": _ms(starts[device_id] - first_start),
+            }
+            for device_id, (sent, acked) in timings.items()
+        },
+    }
+
+
+def _ms(seconds: float) -> float:
+    """Return seconds as milliseconds, rounded to the microsecond."""
+    return round(seconds * 1000, 3)
@@ -0,0 +1,110 @@
+"""Diagnostics support for LIFX Ceiling."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST, CONF_IP_ADDRESS, CONF_MAC
+
+from .metrics import LATENCY_WINDOW
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import LIFXCeiling
+    from .coordinator import LIFXCeilingConfigEntry, LIFXCeilingUpdateCoordinator
+
+CONF_LABEL = "label"
+TO_REDACT = [CONF_LABEL, CONF_HOST, CONF_IP_ADDRESS, CONF_MAC]
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: LIFXCeilingConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for the LIFX Ceiling config entry."""
+    coordinator: LIFXCeilingUpdateCoordinator = entry.runtime_data
+    return {
+        "discovery": {
+            "runs": coordinator.discovery_runs,
+            "last_run": (
+                coordinator.last_discovery.isoformat()
+                if coordinator.last_discovery
+                else None
+            ),
+            "last_duration_ms": _milliseconds(coordinator.last_discovery_duration),
+        },
+        "last_sync": coordinator.last_sync,
+        "ceilings": [
+            async_redact_data(_ceiling_diagnostics(device), TO_REDACT)
+            for device in coordinator.devices
+        ],
+    }
+
+
+def _ceiling_diagnostics(device: LIFXCeiling) -> dict[str, Any]:
+    """Return geometry, zone state and command timing for one ceiling."""
+    metrics = device.metrics
+    rtt = device.rtt
+    return {
+        CONF_MAC: device.mac_addr,
+        CONF_IP_ADDRESS: device.ip_addr,
+        CONF_LABEL: device.label,
+        "product": device.product,
+        "model": device.model,
+        "firmware": device.host_firmware_version,
+        "geometry": {
+            "total_zones": device.total_zones,
+            "uplight_zone": device.uplight_zone,
+            "tile_width": device.tile_device_width,
+        },
+        "power_level": device.power_level,
+        "zones": _compact_zones(device.chain.get(0) or []),
+        "network": {
+            "commands": metrics.commands,
+            "retries": metrics.retries,
+            "timeouts": metrics.timeouts,
+            "skipped_writes": metrics.skipped,
+            "bytes_sent": metrics.bytes_sent,
+            "ack_latency_ms": {
+                f"p{percentile}": metrics.latency_percentile(percentile)
+                for percentile in (50, 95, 99)
+            },
+            "ack_latency_window": LATENCY_WINDOW,
+            "smoothed_rtt_ms": _milliseconds(rtt.smoothed_rtt),
+            "rtt_variance_ms": _milliseconds(rtt.rtt_variance),
+            "retransmit_timeout_ms": _milliseconds(rtt.timeout),
+            "paced_packets": device.limiter.delayed,
+            "dropped_stream_packets": device.limiter.dropped,
+        },
+        "recent_commands": [
+            {
+                "started": datetime.fromtimestamp(trace.started, UTC).isoformat(),
+                "methods": list(trace.methods),
+                "duration_ms": _milliseconds(trace.duration),
+                "retries": trace.retries,
+                "timed_out": trace.timed_out,
+            }
+            for trace in metrics.traces
+        ],
+    }
+
+
+def _compact_zones(
+    zones: list[tuple[int, int, int, int] | None],
+) -> list[list[Any]]:
+    """Run-length encode zones as [count, [hue, saturation, brightness, kelvin]]."""
+    runs: list[list[Any]] = []
+    for zone in zones:
+        color = list(zone) if zone is not None else None
+        if runs and runs[-1][1] == color:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, color])
+    return runs
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
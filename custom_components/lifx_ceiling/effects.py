@@ -0,0 +1,518 @@
+"""Animations rendered on the Home Assistant host and streamed to LIFX Ceilings."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from abc import ABC, abstractmethod
+from collections import deque
+from math import cos, sin, tau
+from random import Random
+from typing import TYPE_CHECKING, ClassVar
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    _LOGGER,
+    ATTR_DOWNLIGHT,
+    ATTR_UPLIGHT,
+    EFFECT_AURORA,
+    EFFECT_BREATHE,
+    EFFECT_FLAME,
+    EFFECT_SYNC_INTERVAL,
+    HSBK_KELVIN,
+    KEYFRAME_MIN_HOLD,
+    OFFSCREEN_FRAMEBUFFERS,
+)
+from .util import LIFXCeilingSupersededError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import LIFXCeiling
+    from .zones import LIFXCeilingZoneBuffer
+
+
+class LIFXCeilingEffect(ABC):
+    """
+    An animation of one light of a ceiling, rendered from the time elapsed.
+
+    Frames are a pure function of time, so a frame that is dropped is simply
+    never rendered and the animation does not slow down when a ceiling falls
+    behind. The frame rate is chosen per effect so that a full 128-zone frame
+    (three packets) stays near the 20 messages a second a LIFX device handles.
+    """
+
+    name: ClassVar[str]
+    light: ClassVar[str]
+    fps: ClassVar[float]
+
+    def __init__(
+        self, device: LIFXCeiling, base: LIFXCeilingZoneBuffer, started: float
+    ) -> None:
+        """Remember the zones of the light as they were before the effect."""
+        self.started = started
+        if self.light == ATTR_UPLIGHT:
+            self.start, self.stop = device.uplight_zone, device.uplight_zone + 1
+        else:
+            self.start, self.stop = 0, device.uplight_zone
+        self.base = base.colors(self.start, self.stop)
+        self.brightness = base.max_brightness(self.start, self.stop) or 65535
+
+    @abstractmethod
+    def render(self, frame: LIFXCeilingZoneBuffer, elapsed: float) -> None:
+        """Draw the effect's zones into a frame."""
+
+    def restore(self, frame: LIFXCeilingZoneBuffer) -> None:
+        """Put the light's zones back as they were before the effect started."""
+        frame.write(self.base, self.start)
+
+
+class LIFXCeilingFlameEffect(LIFXCeilingEffect):
+    """Flickering red to yellow flames, brightest along the first row."""
+
+    name = EFFECT_FLAME
+    light = ATTR_DOWNLIGHT
+    fps = 6
+
+    # Hue of the hottest zones, about 30°
+    HOTTEST_HUE = 5461
+
+    def __init__(
+        self, device: LIFXCeiling, base: LIFXCeilingZoneBuffer, started: float
+    ) -> None:
+        """Give every zone its own flicker, seeded by the ceiling's address."""
+        super().__init__(device, base, started)
+        random = Random(device.mac_addr)  # noqa: S311
+        width = device.tile_device_width
+        rows = max(1, (self.stop - 1) // width)
+        self._kelvin = self.base[0][HSBK_KELVIN]
+        self._zones = [
+            (
+                1 - 0.4 * (zone // width) / rows,
+                random.uniform(3, 7),
+                random.uniform(0, tau),
+                random.uniform(9, 15),
+                random.uniform(0, tau),
+            )
+            for zone in range(self.start, self.stop)
+        ]
+
+    def render(self, frame: LIFXCeilingZoneBuffer, elapsed: float) -> None:
+        """Draw the effect's zones into a frame."""
+        colors = []
+        for heat, slow, slow_phase, fast, fast_phase in self._zones:
+            level = heat * (
+                0.6
+                + 0.25 * sin(slow * elapsed + slow_phase)
+                + 0.15 * sin(fast * elapsed + fast_phase)
+            )
+            colors.append(
+                (
+                    round(self.HOTTEST_HUE * level),
+                    65535,
+                    round(self.brightness * level),
+                    self._kelvin,
+                )
+            )
+        frame.write(colors, self.start)
+
+
+class LIFXCeilingAuroraEffect(LIFXCeilingEffect):
+    """Slow curtains of green, blue and violet drifting across the downlight."""
+
+    name = EFFECT_AURORA
+    light = ATTR_DOWNLIGHT
+    fps = 4
+
+    # Hue range of the curtains, from 120° to 300°
+    LOW_HUE = 21845
+    HUE_SPAN = 32768
+
+    def __init__(
+        self, device: LIFXCeiling, base: LIFXCeilingZoneBuffer, started: float
+    ) -> None:
+        """Place every zone on the layout once."""
+        super().__init__(device, base, started)
+        width = device.tile_device_width
+        rows = max(1, (self.stop - 1) // width)
+        self._kelvin = self.base[0][HSBK_KELVIN]
+        self._zones = [
+            ((zone % width) / width, (zone // width) / rows)
+            for zone in range(self.start, self.stop)
+        ]
+
+    def render(self, frame: LIFXCeilingZoneBuffer, elapsed: float) -> None:
+        """Draw the effect's zones into a frame."""
+        colors = []
+        for x, y in self._zones:
+            hue = 0.5 + 0.5 * sin(
+                tau * (0.8 * x + 0.05 * elapsed) + 1.3 * y + 0.8 * sin(0.3 * elapsed)
+            )
+            curtain = 0.5 + 0.5 * sin(tau * (1.7 * x - 0.08 * elapsed) + 0.6 * y)
+            colors.append(
+                (
+                    round(self.LOW_HUE + self.HUE_SPAN * hue),
+                    65535,
+                    round(self.brightness * (0.25 + 0.75 * curtain)),
+                    self._kelvin,
+                )
+            )
+        frame.write(colors, self.start)
+
+
+class LIFXCeilingBreatheEffect(LIFXCeilingEffect):
+    """The uplight slowly brightening and dimming in its current color."""
+
+    name = EFFECT_BREATHE
+    light = ATTR_UPLIGHT
+    fps = 5
+
+    # Seconds for one full breath
+    PERIOD = 4.0
+
+    def render(self, frame: LIFXCeilingZoneBuffer, elapsed: float) -> None:
+        """Draw the effect's zones into a frame."""
+        level = 0.15 + 0.85 * (0.5 - 0.5 * cos(tau * elapsed / self.PERIOD))
+        hue, saturation, _, kelvin = self.base[0]
+        frame[self.start] = (hue, saturation, round(self.brightness * level), kelvin)
+
+
+EFFECTS: dict[str, type[LIFXCeilingEffect]] = {
+    effect.name: effect
+    for effect in (
+        LIFXCeilingFlameEffect,
+        LIFXCeilingAuroraEffect,
+        LIFXCeilingBreatheEffect,
+    )
+}
+
+
+def effect_names(light: str) -> list[str]:
+    """Return the names of the effects available to a light."""
+    return [name for name, effect in EFFECTS.items() if effect.light == light]
+
+
+class LIFXCeilingEffectRun:
+    """The effects running on one ceiling and when its next frame is due."""
+
+    __slots__ = (
+        "device",
+        "dropped",
+        "effects",
+        "frame_index",
+        "frames",
+        "interval",
+        "next_frame",
+        "next_sync",
+        "started",
+        "sync",
+    )
+
+    def __init__(self, device: LIFXCeiling) -> None:
+        """Initialise an empty run."""
+        self.device = device
+        self.effects: dict[str, LIFXCeilingEffect] = {}
+        self.sync: asyncio.Task[None] | None = None
+        self.frames = 0
+        self.dropped = 0
+        self.interval = 0.0
+        self.started = 0.0
+        self.frame_index = -1
+        self.next_frame = 0.0
+        self.next_sync = 0.0
+
+    def reschedule(self, now: float) -> None:
+        """Restart the frame clock at the rate of the fastest running effect."""
+        self.interval = 1 / max(effect.fps for effect in self.effects.values())
+        self.started = self.next_frame = now
+        self.frame_index = -1
+
+
+class LIFXCeilingKeyframePlayback:
+    """
+    Keyframes faded between by the ceiling itself.
+
+    Every keyframe is uploaded into an off-screen framebuffer ahead of time
+    and shown with a single copy_frame_buffer whose duration makes the ceiling
+    interpolate to it, so starting a keyframe costs one small packet. Once a
+    keyframe has been copied its framebuffer is free again and the next
+    keyframe is uploaded into it while the ceiling is still fading. Repeated
+    keyframes uploaded earlier in the same playback and still resident are
+    not uploaded again.
+    """
+
+    def __init__(
+        self,
+        device: LIFXCeiling,
+        keyframes: Sequence[tuple[LIFXCeilingZoneBuffer, int]],
+        *,
+        repeat: bool = False,
+        framebuffers: int = OFFSCREEN_FRAMEBUFFERS,
+        on_keyframe: Callable[[LIFXCeiling, int], None] | None = None,
+    ) -> None:
+        """Initialise playback of (frame, transition in seconds) keyframes."""
+        self.device = device
+        self.keyframes = list(keyframes)
+        self.repeat = repeat
+        self.shown = 0
+        self._on_keyframe = on_keyframe
+        self._free = deque(range(1, min(framebuffers, len(self.keyframes)) + 1))
+        self._staged: deque[tuple[int, int]] = deque()
+        self._next = 0
+
+    async def async_stage(self) -> None:
+        """Upload the next keyframes into every free off-screen framebuffer."""
+        while self._free and (self.repeat or self._next < len(self.keyframes)):
+            fb_index = self._free.popleft()
+            index = self._next % len(self.keyframes)
+            await self.device.async_stage_frame(self.keyframes[index][0], fb_index)
+            self._staged.append((fb_index, index))
+            self._next += 1
+
+    async def async_play(self) -> None:
+        """Show the staged keyframes in turn until none are left."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._staged:
+                fb_index, index = self._staged.popleft()
+                duration = self.keyframes[index][1]
+                started = loop.time()
+                await self.device.async_show_frame(
+                    fb_index, duration, power_on=self.device.power_level == 0
+                )
+                self.shown += 1
+                if self._on_keyframe is not None:
+                    self._on_keyframe(self.device, duration)
+
+                self._free.append(fb_index)
+                await self.async_stage()
+                if self._staged:
+                    hold = max(duration, KEYFRAME_MIN_HOLD)
+                    await asyncio.sleep(max(0.0, started + hold - loop.time()))
+        except LIFXCeilingSupersededError:
+            _LOGGER.debug(
+                "Keyframe playback on %s superseded by a newer command",
+                self.device.label,
+            )
+        except TimeoutError as err:
+            _LOGGER.warning(
+                "Keyframe playback on %s stopped: %s", self.device.label, err
+            )
+
+
+class LIFXCeilingEffectEngine:
+    """
+    Render effects for every ceiling from a single scheduler task.
+
+    Frames are timed against the event loop's monotonic clock. Each ceiling's
+    due frames are rendered in turn, yielding to the event loop between
+    ceilings, and the task sleeps until the next frame of any ceiling is due,
+    so many animated ceilings share one task instead of one timer each.
+
+    Most frames are streamed without acks and fade over one frame interval.
+    Every EFFECT_SYNC_INTERVAL a full frame is sent with acks instead, which
+    both repairs anything lost and shows whether the ceiling keeps up: until
+    it is acknowledged, that ceiling's frames are dropped rather than queued.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the engine with nothing running."""
+        self.hass = hass
+        self._runs: dict[str, LIFXCeilingEffectRun] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._playbacks: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def runs(self) -> list[LIFXCeilingEffectRun]:
+        """Return the ceilings with at least one running effect."""
+        return list(self._runs.values())
+
+    def playing_keyframes(self, device: LIFXCeiling) -> bool:
+        """Return whether a ceiling is playing keyframes."""
+        return device.mac_addr in self._playbacks
+
+    def active(self, device: LIFXCeiling) -> bool:
+        """Return whether an effect or keyframes are using a ceiling's framebuffers."""
+        return device.mac_addr in self._runs or device.mac_addr in self._playbacks
+
+    def effect(self, device: LIFXCeiling, light: str) -> str | None:
+        """Return the name of the effect running on a light, if any."""
+        run = self._runs.get(device.mac_addr)
+        if run is None or (effect := run.effects.get(light)) is None:
+            return None
+        return effect.name
+
+    @callback
+    def async_start(self, device: LIFXCeiling, light: str, name: str) -> None:
+        """Start an effect on a light, replacing any effect already running there."""
+        effect_class = EFFECTS.get(name)
+        if effect_class is None or effect_class.light != light:
+            msg = f"Unknown {light} effect {name!r}"
+            raise HomeAssistantError(msg)
+
+        self.async_stop_keyframes(device)
+        now = asyncio.get_running_loop().time()
+        run = self._runs.get(device.mac_addr)
+        if run is None:
+            run = self._runs[device.mac_addr] = LIFXCeilingEffectRun(device)
+        base = device.zone_buffer()
+        if (previous := run.effects.get(light)) is not None:
+            previous.restore(base)
+        run.effects[light] = effect_class(device, base, now)
+        run.reschedule(now)
+
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), name="LIFX Ceiling effects"
+            )
+        else:
+            self._wake.set()
+
+    @callback
+    def async_stop(self, device: LIFXCeiling, light: str) -> LIFXCeilingEffect | None:
+        """Stop the effect running on a light and return it."""
+        run = self._runs.get(device.mac_addr)
+        if run is None or (effect := run.effects.pop(light, None)) is None:
+            return None
+
+        # A frame still being acknowledged would land after the caller's write.
+        if run.sync is not None:
+            run.sync.cancel()
+            run.sync = None
+        if run.effects:
+            run.reschedule(asyncio.get_running_loop().time())
+        else:
+            del self._runs[device.mac_addr]
+        return effect
+
+    async def async_play_keyframes(
+        self,
+        device: LIFXCeiling,
+        keyframes: Sequence[tuple[LIFXCeilingZoneBuffer, int]],
+        *,
+        repeat: bool = False,
+        on_keyframe: Callable[[LIFXCeiling, int], None] | None = None,
+    ) -> LIFXCeilingKeyframePlayback:
+        """
+        Stage keyframes on a ceiling, then play them in the background.
+
+        Replaces any effect or keyframes already running on the ceiling. Returns
+        once the first keyframes are staged, so upload errors reach the caller.
+        """
+        self.async_stop_device(device)
+        # Only frames uploaded by this playback are trusted to be resident.
+        device.forget_staged_frames()
+        playback = LIFXCeilingKeyframePlayback(
+            device, keyframes, repeat=repeat, on_keyframe=on_keyframe
+        )
+        await playback.async_stage()
+
+        task = self.hass.async_create_background_task(
+            playback.async_play(), name=f"LIFX Ceiling keyframes {device.mac_addr}"
+        )
+        self._playbacks[device.mac_addr] = task
+
+        def _async_done(_task: asyncio.Task[None]) -> None:
+            if self._playbacks.get(device.mac_addr) is task:
+                del self._playbacks[device.mac_addr]
+
+        task.add_done_callback(_async_done)
+        return playback
+
+    @callback
+    def async_stop_keyframes(self, device: LIFXCeiling) -> None:
+        """Stop keyframes playing on a ceiling where the current one ends."""
+        if (task := self._playbacks.pop(device.mac_addr, None)) is not None:
+            task.cancel()
+
+    @callback
+    def async_stop_device(self, device: LIFXCeiling) -> None:
+        """Stop every effect and keyframe on a ceiling without restoring its zones."""
+        self.async_stop_keyframes(device)
+        if (run := self._runs.get(device.mac_addr)) is not None:
+            for light in list(run.effects):
+                self.async_stop(device, light)
+
+    @callback
+    def async_stop_all(self) -> None:
+        """Stop every effect, keyframe playback and the scheduler task."""
+        for task in self._playbacks.values():
+            task.cancel()
+        self._playbacks.clear()
+        for run in self._runs.values():
+            if run.sync is not None:
+                run.sync.cancel()
+        self._runs.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        """Render due frames until no effects are left running."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._runs:
+                for run in list(self._runs.values()):
+                    if (
+                        self._runs.get(run.device.mac_addr) is run
+                        and run.next_frame <= loop.time()
+                    ):
+                        self._render(run, loop.time())
+                        # Let everything else run between ceilings.
+                        await asyncio.sleep(0)
+
+                self._wake.clear()
+                if not self._runs:
+                    break
+                delay = min(run.next_frame for run in self._runs.values())
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wake.wait(), max(0.0, delay - loop.time())
+                    )
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _render(self, run: LIFXCeilingEffectRun, now: float) -> None:
+        """Render and send the current frame of a ceiling, or drop it."""
+        frame_index = int((now - run.started) / run.interval)
+        # Frames the scheduler was too late for are skipped, not caught up.
+        run.dropped += max(0, frame_index - run.frame_index - 1)
+        run.frame_index = frame_index
+        run.next_frame = run.started + (frame_index + 1) * run.interval
+
+        if run.sync is not None and not run.sync.done():
+            # The ceiling has not acknowledged the last synced frame yet.
+            run.dropped += 1
+            return
+
+        device = run.device
+        frame = device.zone_buffer()
+        for effect in run.effects.values():
+            effect.render(frame, now - effect.started)
+        run.frames += 1
+
+        if now >= run.next_sync:
+            run.next_sync = now + EFFECT_SYNC_INTERVAL
+            run.sync = self.hass.async_create_background_task(
+                self._async_sync(device, frame),
+                name=f"LIFX Ceiling effect frame {device.mac_addr}",
+            )
+        else:
+            device.stream_frame(frame, run.interval)
+
+    async def _async_sync(
+        self, device: LIFXCeiling, frame: LIFXCeilingZoneBuffer
+    ) -> None:
+        """Send a full frame and wait for the ceiling to acknowledge it."""
+        try:
+            await device.async_set64(colors=frame, full_frame=True)
+        except (TimeoutError, LIFXCeilingSupersededError) as err:
+            _LOGGER.debug(
+                "Effect frame for %s was not acknowledged: %s", device.label, err
+            )
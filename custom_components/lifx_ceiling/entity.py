@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_CEILING_REMOVED
 from .coordinator import LIFXCeilingUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -25,6 +27,7 @@ class LIFXCeilingEntity(CoordinatorEntity[LIFXCeilingUpdateCoordinator]):
     ) -> None:
         """Initialise the light."""
         super().__init__(coordinator)
+        self._device = device
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device.mac_addr)},
             connections={(dr.CONNECTION_NETWORK_MAC, device.mac_addr)},
@@ -35,3 +38,36 @@ class LIFXCeilingEntity(CoordinatorEntity[LIFXCeilingUpdateCoordinator]):
             sw_version=device.host_firmware_version,
             suggested_area=device.group,
         )
+
+    async def async_added_to_hass(self) -> None:
+        """Remove the entity when its ceiling's core LIFX entry unloads."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_CEILING_REMOVED.format(self._device.mac_addr),
+                self._async_ceiling_removed,
+            )
+        )
+
+    @callback
+    def _async_write_changed_state(self, **attrs: Any) -> None:
+        """
+        Set the given _attr_ values and write the state if any of them changed.
+
+        Core LIFX polls usually find the ceiling as it was, so most updates
+        leave the entity untouched and cost no state machine write.
+        """
+        changed = False
+        for name, value in attrs.items():
+            attr = f"_attr_{name}"
+            if getattr(self, attr, None) != value:
+                setattr(self, attr, value)
+                changed = True
+        if changed:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_ceiling_removed(self) -> None:
+        """Drop the entity; it is added again when the ceiling is rediscovered."""
+        self.hass.async_create_task(self.async_remove())
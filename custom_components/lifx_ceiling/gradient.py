@@ -0,0 +1,167 @@
+"""Gradient rendering across the LIFX Ceiling zone layout."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import pairwise
+from math import atan2, cos, degrees, hypot, radians, sin
+from typing import TYPE_CHECKING
+
+from .const import (
+    ATTR_BRIGHTNESS,
+    ATTR_HUE,
+    ATTR_KELVIN,
+    ATTR_POSITION,
+    ATTR_SATURATION,
+    GRADIENT_ANGULAR,
+    GRADIENT_LINEAR,
+    GRADIENT_RADIAL,
+    HSBK_HUE,
+)
+from .util import hsbk_from_service
+from .zones import HSBK_FIELDS, LIFXCeilingZoneBuffer
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Any
+
+    type GradientStop = tuple[float, tuple[int, int, int, int]]
+
+HUE_RANGE = 65536
+
+
+def gradient_stops(stops: Sequence[Mapping[str, Any]]) -> list[GradientStop]:
+    """
+    Convert set_zones service stops to (position, HSBK) pairs sorted by position.
+
+    Positions are percentages; stops without one are spaced evenly by their
+    place in the list.
+    """
+    last = max(1, len(stops) - 1)
+    return sorted(
+        (
+            (
+                stop.get(ATTR_POSITION, index / last * 100) / 100,
+                hsbk_from_service(
+                    stop[ATTR_HUE],
+                    stop[ATTR_SATURATION],
+                    stop[ATTR_BRIGHTNESS],
+                    stop[ATTR_KELVIN],
+                ),
+            )
+            for index, stop in enumerate(stops)
+        ),
+        key=lambda stop: stop[0],
+    )
+
+
+@lru_cache(maxsize=32)
+def gradient_positions(  # noqa: PLR0913
+    gradient: str,
+    width: int,
+    zones: int,
+    angle: float = 0.0,
+    center_x: float = 0.5,
+    center_y: float = 0.5,
+) -> tuple[float, ...]:
+    """
+    Return the position, from 0 to 1, of every zone along a gradient.
+
+    Zones are laid out row by row, width zones to a row, and measured from
+    their centres. A linear gradient runs across the layout in the direction
+    of angle (0° is left to right, 90° is top to bottom), a radial one runs
+    out from the centre to the furthest zone and an angular one sweeps
+    clockwise around the centre starting at angle. The centre is given as a
+    fraction of the layout's width and height. The result only depends on
+    the layout, so it is cached and shared by every ceiling of that size.
+    """
+    height = zones // width
+    origin_x, origin_y = center_x * width, center_y * height
+    points = [
+        (index % width + 0.5 - origin_x, index // width + 0.5 - origin_y)
+        for index in range(zones)
+    ]
+
+    if gradient == GRADIENT_LINEAR:
+        dx, dy = cos(radians(angle)), sin(radians(angle))
+        projections = [x * dx + y * dy for x, y in points]
+        low, high = min(projections), max(projections)
+        span = (high - low) or 1.0
+        return tuple((value - low) / span for value in projections)
+
+    if gradient == GRADIENT_RADIAL:
+        distances = [hypot(x, y) for x, y in points]
+        furthest = max(distances) or 1.0
+        return tuple(distance / furthest for distance in distances)
+
+    if gradient == GRADIENT_ANGULAR:
+        return tuple(((degrees(atan2(y, x)) - angle) % 360) / 360 for x, y in points)
+
+    msg = f"Unknown gradient {gradient!r}"
+    raise ValueError(msg)
+
+
+def render_gradient(
+    stops: Sequence[GradientStop], positions: Sequence[float]
+) -> LIFXCeilingZoneBuffer:
+    """
+    Interpolate HSBK stops at every position into a zone buffer.
+
+    Stops are (position, color) pairs sorted by position. Each zone is placed
+    between its two surrounding stops once, then every channel is filled with
+    one strided write into the buffer. Hue takes the shortest way around the
+    color wheel, so a gradient from red at 350° to 10° passes through 0°, not
+    through green. Positions outside the stops take the nearest stop's color.
+    """
+    if not stops:
+        msg = "A gradient needs at least one stop"
+        raise ValueError(msg)
+
+    offsets = [offset for offset, _ in stops]
+    last = len(stops) - 1
+    weights = [_segment(offsets, last, position) for position in positions]
+
+    data = array("H", bytes(2 * HSBK_FIELDS * len(positions)))
+    for channel in range(HSBK_FIELDS):
+        values = [color[channel] for _, color in stops]
+        if len(set(values)) == 1:
+            # Usually kelvin or saturation: nothing to interpolate.
+            data[channel::HSBK_FIELDS] = array("H", values[:1]) * len(positions)
+        elif channel == HSBK_HUE:
+            deltas = [
+                (end - start + HUE_RANGE // 2) % HUE_RANGE - HUE_RANGE // 2
+                for start, end in pairwise(values)
+            ]
+            deltas.append(0)
+            data[channel::HSBK_FIELDS] = array(
+                "H",
+                (
+                    round(values[index] + deltas[index] * fraction) % HUE_RANGE
+                    for index, fraction in weights
+                ),
+            )
+        else:
+            deltas = [end - start for start, end in pairwise(values)]
+            deltas.append(0)
+            data[channel::HSBK_FIELDS] = array(
+                "H",
+                (
+                    round(values[index] + deltas[index] * fraction)
+                    for index, fraction in weights
+                ),
+            )
+
+    return LIFXCeilingZoneBuffer(data)
+
+
+def _segment(offsets: list[float], last: int, position: float) -> tuple[int, float]:
+    """Return the stop a position starts from and how far it is to the next."""
+    if position <= offsets[0]:
+        return 0, 0.0
+    if position >= offsets[last]:
+        return last, 0.0
+    index = bisect_right(offsets, position) - 1
+    span = offsets[index + 1] - offsets[index]
+    return index, (position - offsets[index]) / span if span else 0.0
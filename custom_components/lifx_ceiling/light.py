@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.light import (
+    ATTR_EFFECT,
     ATTR_TRANSITION,
+    EFFECT_OFF,
     ColorMode,
     LightEntity,
     LightEntityFeature,
@@ -13,6 +15,8 @@ from homeassistant.components.light import (
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
 
+from .const import ATTR_DOWNLIGHT, ATTR_UPLIGHT, HSBK_KELVIN
+from .effects import effect_names
 from .entity import LIFXCeilingEntity
 from .util import hsbk_for_turn_on
 
@@ -20,13 +24,15 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-    from .api import LIFXCeiling
+    from .api import LIFXCeiling, LIFXCeilingZoneSummary
     from .coordinator import (
         LIFXCeilingConfigEntry,
         LIFXCeilingUpdateCoordinator,
     )
 
-PARALLEL_UPDATES = 1
+# Writes are serialised and coalesced per ceiling by the coordinator, so
+# entity service calls must not be queued behind each other here as well.
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -49,97 +55,134 @@ async def async_setup_entry(
     for device in coordinator.devices:
         _add_ceiling_entities(device)
 
-    coordinator.set_discovery_callback(_add_ceiling_entities)
+    entry.async_on_unload(
+        coordinator.async_add_discovery_listener(_add_ceiling_entities)
+    )
 
 
 class LIFXCeilingDownlight(LIFXCeilingEntity, LightEntity):
     """Represents the LIFX Ceiling downlight zone."""
 
-    _attr_supported_features = LightEntityFeature.TRANSITION
+    _attr_supported_features = LightEntityFeature.TRANSITION | LightEntityFeature.EFFECT
 
     def __init__(
         self, coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
     ) -> None:
         """Instantiate the zoned light."""
         super().__init__(coordinator, device)
-        self._device = device
-        coordinator.async_add_core_listener(device, self._update_callback)
+        self.async_on_remove(
+            coordinator.async_add_core_listener(
+                device, ATTR_DOWNLIGHT, self._update_callback
+            )
+        )
 
         self._attr_supported_color_modes = {ColorMode.COLOR_TEMP, ColorMode.HS}
         self._attr_name = "Downlight"
+        self._attr_effect_list = [EFFECT_OFF, *effect_names(ATTR_DOWNLIGHT)]
+        self._attr_effect = EFFECT_OFF
         self._attr_unique_id = f"{format_mac(device.mac_addr)}_downlight"
         self._attr_max_color_temp_kelvin = device.max_kelvin
         self._attr_min_color_temp_kelvin = device.min_kelvin
 
     @callback
-    def _update_callback(self) -> None:
-        """Handle coordinator updates."""
-        self._attr_is_on = self._device.downlight_is_on
-        self._attr_brightness = self._device.downlight_brightness
-        self._attr_hs_color = self._device.downlight_hs_color
-        self._attr_color_temp_kelvin = self._device.downlight_kelvin
-        _, sat = self._device.downlight_hs_color
-        if sat > 0:
-            self._attr_color_mode = ColorMode.HS
-        else:
-            self._attr_color_mode = ColorMode.COLOR_TEMP
-        self.async_write_ha_state()
+    def _update_callback(self, summary: LIFXCeilingZoneSummary) -> None:
+        """Handle a change to the downlight, writing the state if it changed."""
+        hs_color = summary.downlight_hs_color
+        self._async_write_changed_state(
+            is_on=summary.downlight_is_on,
+            brightness=summary.downlight_brightness,
+            hs_color=hs_color,
+            color_temp_kelvin=summary.downlight_color[HSBK_KELVIN],
+            effect=(
+                self.coordinator.effects.effect(self._device, ATTR_DOWNLIGHT)
+                or EFFECT_OFF
+            ),
+            color_mode=ColorMode.HS if hs_color[1] > 0 else ColorMode.COLOR_TEMP,
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the downlight."""
+        await self.coordinator.async_stop_effect(self._device, ATTR_DOWNLIGHT)
+        self._attr_effect = EFFECT_OFF
         duration = int(kwargs.get(ATTR_TRANSITION, 0))
         await self.coordinator.turn_downlight_off(self._device, duration)
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the downlight."""
-        duration = int(kwargs.get(ATTR_TRANSITION, 0))
-        color = hsbk_for_turn_on(self._device.downlight_color, **kwargs)
-        await self.coordinator.turn_downlight_on(self._device, color, duration)
+        """Turn on the downlight, starting or stopping an effect if one is given."""
+        effect = kwargs.get(ATTR_EFFECT)
+        await self.coordinator.async_stop_effect(
+            self._device, ATTR_DOWNLIGHT, restore=effect == EFFECT_OFF
+        )
+        if effect != EFFECT_OFF:
+            duration = int(kwargs.get(ATTR_TRANSITION, 0))
+            color = hsbk_for_turn_on(self._device.downlight_color, **kwargs)
+            await self.coordinator.turn_downlight_on(self._device, color, duration)
+        if effect not in (None, EFFECT_OFF):
+            self.coordinator.async_start_effect(self._device, ATTR_DOWNLIGHT, effect)
+        self._attr_effect = effect if effect is not None else EFFECT_OFF
         self.async_write_ha_state()
 
 
 class LIFXCeilingUplight(LIFXCeilingEntity, LightEntity):
     """Represents the LIFX Ceiling uplight zone."""
 
-    _attr_supported_features = LightEntityFeature.TRANSITION
+    _attr_supported_features = LightEntityFeature.TRANSITION | LightEntityFeature.EFFECT
 
     def __init__(
         self, coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
     ) -> None:
         """Instantiate the zoned light."""
         super().__init__(coordinator, device)
-        self._device = device
-        coordinator.async_add_core_listener(device, self._update_callback)
+        self.async_on_remove(
+            coordinator.async_add_core_listener(
+                device, ATTR_UPLIGHT, self._update_callback
+            )
+        )
 
         self._attr_supported_color_modes = {ColorMode.COLOR_TEMP, ColorMode.HS}
         self._attr_name = "Uplight"
+        self._attr_effect_list = [EFFECT_OFF, *effect_names(ATTR_UPLIGHT)]
+        self._attr_effect = EFFECT_OFF
         self._attr_unique_id = f"{format_mac(device.mac_addr)}_uplight"
         self._attr_max_color_temp_kelvin = device.max_kelvin
         self._attr_min_color_temp_kelvin = device.min_kelvin
 
     @callback
-    def _update_callback(self) -> None:
-        """Handle device updates."""
-        self._attr_is_on = self._device.uplight_is_on
-        self._attr_brightness = self._device.uplight_brightness
-        self._attr_hs_color = self._device.uplight_hs_color
-        self._attr_color_temp_kelvin = self._device.uplight_kelvin
-        _, sat = self._device.uplight_hs_color
-        if sat > 0:
-            self._attr_color_mode = ColorMode.HS
-        else:
-            self._attr_color_mode = ColorMode.COLOR_TEMP
-        self.async_write_ha_state()
+    def _update_callback(self, summary: LIFXCeilingZoneSummary) -> None:
+        """Handle a change to the uplight, writing the state if it changed."""
+        hs_color = summary.uplight_hs_color
+        self._async_write_changed_state(
+            is_on=summary.uplight_is_on,
+            brightness=summary.uplight_brightness,
+            hs_color=hs_color,
+            color_temp_kelvin=summary.uplight_color[HSBK_KELVIN],
+            effect=(
+                self.coordinator.effects.effect(self._device, ATTR_UPLIGHT)
+                or EFFECT_OFF
+            ),
+            color_mode=ColorMode.HS if hs_color[1] > 0 else ColorMode.COLOR_TEMP,
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the uplight."""
+        await self.coordinator.async_stop_effect(self._device, ATTR_UPLIGHT)
+        self._attr_effect = EFFECT_OFF
         duration = int(kwargs[ATTR_TRANSITION]) if ATTR_TRANSITION in kwargs else 0
         await self.coordinator.turn_uplight_off(self._device, duration)
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the uplight."""
-        duration = int(kwargs[ATTR_TRANSITION]) if ATTR_TRANSITION in kwargs else 0
-        color = hsbk_for_turn_on(self._device.uplight_color, **kwargs)
-        await self.coordinator.turn_uplight_on(self._device, color, duration)
+        """Turn on the uplight, starting or stopping an effect if one is given."""
+        effect = kwargs.get(ATTR_EFFECT)
+        await self.coordinator.async_stop_effect(
+            self._device, ATTR_UPLIGHT, restore=effect == EFFECT_OFF
+        )
+        if effect != EFFECT_OFF:
+            duration = int(kwargs[ATTR_TRANSITION]) if ATTR_TRANSITION in kwargs else 0
+            color = hsbk_for_turn_on(self._device.uplight_color, **kwargs)
+            await self.coordinator.turn_uplight_on(self._device, color, duration)
+        if effect not in (None, EFFECT_OFF):
+            self.coordinator.async_start_effect(self._device, ATTR_UPLIGHT, effect)
+        self._attr_effect = effect if effect is not None else EFFECT_OFF
         self.async_write_ha_state()
@@ -0,0 +1,97 @@
+"""Per-device command metrics for LIFX Ceiling."""
+
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+from typing import NamedTuple
+
+# Number of recent ack latencies kept for the percentile sensors
+LATENCY_WINDOW = 256
+
+# Number of recent command traces kept for diagnostics
+TRACE_WINDOW = 32
+
+# Bytes on the wire (36-byte header plus payload) for the requests we send
+MESSAGE_SIZES = {
+    "set64": 36 + 10 + 64 * 8,
+    "set64_packed": 36 + 10 + 64 * 8,
+    "copy_frame_buffer": 36 + 15,
+    "copy_frame_buffer_now": 36 + 15,
+    "set_power": 36 + 6,
+}
+DEFAULT_MESSAGE_SIZE = 36
+
+
+class LIFXCeilingCommandTrace(NamedTuple):
+    """Timing of one async_execute_lifx call."""
+
+    started: float  # Unix timestamp
+    methods: tuple[str, ...]
+    duration: float  # seconds
+    retries: int
+    timed_out: bool
+
+
+class LIFXCeilingMetrics:
+    """
+    Counters and recent ack latencies for the commands sent to one ceiling.
+
+    Counters only ever increase. Latencies and command traces live in
+    fixed-size windows so memory stays bounded however long the ceiling has
+    been running, and percentiles are computed from that window when read.
+    """
+
+    __slots__ = (
+        "_latencies",
+        "bytes_sent",
+        "commands",
+        "retries",
+        "skipped",
+        "timeouts",
+        "traces",
+    )
+
+    def __init__(self) -> None:
+        """Initialise empty metrics."""
+        self.commands = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.bytes_sent = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.traces: deque[LIFXCeilingCommandTrace] = deque(maxlen=TRACE_WINDOW)
+
+    def record_command(self) -> None:
+        """Count a call to async_execute_lifx."""
+        self.commands += 1
+
+    def record_skip(self) -> None:
+        """Count a write left out because the ceiling already showed it."""
+        self.skipped += 1
+
+    def record_send(self, method_name: str, *, retry: bool) -> None:
+        """Count a request leaving for the device."""
+        self.bytes_sent += MESSAGE_SIZES.get(method_name, DEFAULT_MESSAGE_SIZE)
+        if retry:
+            self.retries += 1
+
+    def record_ack(self, latency: float) -> None:
+        """Add the ack latency, in seconds, of a request sent once."""
+        self._latencies.append(latency)
+
+    def record_timeout(self) -> None:
+        """Count a command that failed after every attempt."""
+        self.timeouts += 1
+
+    def record_trace(self, trace: LIFXCeilingCommandTrace) -> None:
+        """Keep the timing of a finished command."""
+        self.traces.append(trace)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return a recent ack latency percentile in milliseconds (nearest rank)."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, ceil(percentile / 100 * len(ordered)))
+        return round(ordered[rank - 1] * 1000, 1)
@@ -0,0 +1,132 @@
+"""Per-device send pacing for LIFX Ceiling packets."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+from .const import SEND_BURST, SEND_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Send priorities, most urgent first
+PRIORITY_CONTROL = 0  # packets whose timing matters, never held back
+PRIORITY_COMMAND = 1  # acknowledged writes and their retries
+PRIORITY_STREAM = 2  # unacknowledged animation frames
+PRIORITY_POLL = 3  # state requests
+PRIORITIES = (PRIORITY_CONTROL, PRIORITY_COMMAND, PRIORITY_STREAM, PRIORITY_POLL)
+
+
+class LIFXCeilingRateLimiter:
+    """
+    Token bucket pacing the packets sent to one ceiling.
+
+    The bucket holds up to burst tokens and refills at rate tokens a second;
+    every packet takes one. A packet that finds the bucket empty, or packets
+    of its own or a more urgent priority already waiting, is queued and sent
+    as tokens come back, most urgent first and in order within a priority.
+
+    Control packets are sent at once and may overdraw the bucket, which
+    delays what follows instead. Streamed packets are superseded by the next
+    frame anyway, so at most burst of them wait; older ones are dropped.
+    """
+
+    __slots__ = (
+        "_handle",
+        "_queues",
+        "_tokens",
+        "_updated",
+        "burst",
+        "delayed",
+        "dropped",
+        "rate",
+    )
+
+    def __init__(self, rate: float = SEND_RATE, burst: int = SEND_BURST) -> None:
+        """Initialise a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self.delayed = 0
+        self.dropped = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._queues: tuple[deque[Callable[[], None] | asyncio.Future[None]], ...] = (
+            tuple(deque() for _ in PRIORITIES)
+        )
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        """Return the number of packets waiting for a token."""
+        return sum(map(len, self._queues))
+
+    def backlog(self, extra: int = 0) -> float:
+        """Return the seconds until the queue, plus extra packets, is sent."""
+        self._refill()
+        return max(0.0, (self.queued + extra - self._tokens) / self.rate)
+
+    def send(self, priority: int, callback: Callable[[], None]) -> None:
+        """Call callback, which sends one packet, as soon as it may be sent."""
+        if priority == PRIORITY_CONTROL or self._may_send(priority):
+            self._tokens -= 1
+            callback()
+            return
+
+        queue = self._queues[priority]
+        if priority == PRIORITY_STREAM and len(queue) >= self.burst:
+            queue.popleft()
+            self.dropped += 1
+        queue.append(callback)
+        self.delayed += 1
+        self._schedule()
+
+    async def acquire(self, priority: int) -> None:
+        """Wait until one packet of the given priority may be sent."""
+        if priority == PRIORITY_CONTROL or self._may_send(priority):
+            self._tokens -= 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(waiter)
+        self.delayed += 1
+        self._schedule()
+        await waiter
+
+    def _may_send(self, priority: int) -> bool:
+        """Return whether a packet can go now without jumping the queue."""
+        self._refill()
+        return self._tokens >= 1 and not any(self._queues[: priority + 1])
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        """Drain the queue once the next token is due."""
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(
+                max(0.0, (1 - self._tokens) / self.rate), self._drain
+            )
+
+    def _drain(self) -> None:
+        """Send queued packets, most urgent first, while tokens last."""
+        self._handle = None
+        self._refill()
+        for queue in self._queues:
+            while queue and self._tokens >= 1:
+                entry = queue.popleft()
+                if isinstance(entry, asyncio.Future):
+                    # A cancelled waiter sends nothing, so it takes no token.
+                    if entry.done():
+                        continue
+                    entry.set_result(None)
+                else:
+                    entry()
+                self._tokens -= 1
+        if any(self._queues):
+            self._schedule()
@@ -0,0 +1,63 @@
+"""Per-device round-trip time estimation for LIFX Ceiling requests."""
+
+from __future__ import annotations
+
+from .const import (
+    DEFAULT_ATTEMPTS,
+    MAX_RETRANSMIT_TIMEOUT,
+    MIN_RETRANSMIT_TIMEOUT,
+    OVERALL_TIMEOUT,
+)
+
+# Gains from RFC 6298 section 2
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_VARIANCE_FACTOR = 4
+
+
+class LIFXCeilingRTTEstimator:
+    """
+    Smoothed round-trip time and variance for one ceiling, TCP RTO style.
+
+    Until the first sample arrives the timeout matches the fixed per-attempt
+    split of OVERALL_TIMEOUT. Each timeout doubles the current value
+    (exponential backoff) until the next valid sample resets it.
+    """
+
+    __slots__ = ("_backoff", "rtt_variance", "samples", "smoothed_rtt")
+
+    def __init__(self) -> None:
+        """Initialise the estimator with no samples."""
+        self.smoothed_rtt: float | None = None
+        self.rtt_variance: float | None = None
+        self.samples = 0
+        self._backoff = 1
+
+    @property
+    def timeout(self) -> float:
+        """Return the retransmission timeout in seconds, including backoff."""
+        if self.smoothed_rtt is None or self.rtt_variance is None:
+            base = OVERALL_TIMEOUT / DEFAULT_ATTEMPTS
+        else:
+            base = self.smoothed_rtt + RTT_VARIANCE_FACTOR * self.rtt_variance
+        return min(
+            MAX_RETRANSMIT_TIMEOUT, max(MIN_RETRANSMIT_TIMEOUT, base) * self._backoff
+        )
+
+    def add_sample(self, rtt: float) -> None:
+        """Add a round-trip time measured on a request that was sent once."""
+        if self.smoothed_rtt is None or self.rtt_variance is None:
+            self.smoothed_rtt = rtt
+            self.rtt_variance = rtt / 2
+        else:
+            self.rtt_variance = (1 - RTT_BETA) * self.rtt_variance + RTT_BETA * abs(
+                self.smoothed_rtt - rtt
+            )
+            self.smoothed_rtt = (1 - RTT_ALPHA) * self.smoothed_rtt + RTT_ALPHA * rtt
+        self.samples += 1
+        self._backoff = 1
+
+    def backoff(self) -> None:
+        """Double the timeout after an attempt went unanswered."""
+        if self.timeout < MAX_RETRANSMIT_TIMEOUT:
+            self._backoff *= 2
@@ -0,0 +1,92 @@
+"""Preloaded LIFX Ceiling scenes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.exceptions import HomeAssistantError
+
+if TYPE_CHECKING:
+    from .api import LIFXCeiling
+    from .zones import LIFXCeilingZoneBuffer
+
+
+class LIFXCeilingScene:
+    """A scene's frame for one ceiling, with its set64 payloads already packed."""
+
+    __slots__ = ("colors", "name", "payloads")
+
+    def __init__(
+        self, name: str, device: LIFXCeiling, frame: LIFXCeilingZoneBuffer
+    ) -> None:
+        """Precompute the scene's colors and packets for a ceiling."""
+        self.name = name
+        self.colors = frame.colors()
+        self.payloads = device.pack_frame(frame)
+
+
+class LIFXCeilingSceneRegistry:
+    """
+    Scenes by name, each stored per ceiling ready to send.
+
+    Everything that depends on the scene's colors is worked out when it is
+    stored, so activating it only sends packets. Each ceiling can also keep
+    one scene preloaded in its off-screen framebuffer, which makes activating
+    that scene a single copy_frame_buffer.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._scenes: dict[str, dict[str, LIFXCeilingScene]] = {}
+        self._preloaded: dict[str, str] = {}
+
+    @property
+    def names(self) -> list[str]:
+        """Return the names of the stored scenes."""
+        return sorted(self._scenes)
+
+    def store(
+        self,
+        name: str,
+        device: LIFXCeiling,
+        frame: LIFXCeilingZoneBuffer,
+        *,
+        preload: bool = False,
+    ) -> LIFXCeilingScene:
+        """Store a scene for a ceiling, replacing its previous frame."""
+        scene = LIFXCeilingScene(name, device, frame)
+        self._scenes.setdefault(name, {})[device.mac_addr] = scene
+        if preload:
+            self._preloaded[device.mac_addr] = name
+        return scene
+
+    def get(self, name: str, device: LIFXCeiling) -> LIFXCeilingScene:
+        """Return a ceiling's frame for a scene."""
+        if (scene := self._scenes.get(name, {}).get(device.mac_addr)) is None:
+            msg = f"Scene {name!r} is not stored for {device.label}"
+            raise HomeAssistantError(msg)
+        return scene
+
+    def mac_addrs(self, name: str) -> list[str]:
+        """Return the MAC addresses of the ceilings a scene is stored for."""
+        if name not in self._scenes:
+            msg = f"Unknown scene {name!r}"
+            raise HomeAssistantError(msg)
+        return list(self._scenes[name])
+
+    def preloaded(self, device: LIFXCeiling) -> LIFXCeilingScene | None:
+        """Return the scene to keep in a ceiling's off-screen framebuffer."""
+        name = self._preloaded.get(device.mac_addr)
+        if name is None:
+            return None
+        return self._scenes[name].get(device.mac_addr)
+
+    def remove(self, name: str) -> None:
+        """Forget a scene on every ceiling."""
+        self._scenes.pop(name, None)
+        for mac_addr in [
+            mac_addr
+            for mac_addr, preloaded in self._preloaded.items()
+            if preloaded == name
+        ]:
+            del self._preloaded[mac_addr]
@@ -0,0 +1,147 @@
+"""LIFX Ceiling network diagnostic sensors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import format_mac
+
+from .entity import LIFXCeilingEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+    from .api import LIFXCeiling
+    from .coordinator import (
+        LIFXCeilingConfigEntry,
+        LIFXCeilingUpdateCoordinator,
+    )
+    from .metrics import LIFXCeilingMetrics
+
+# Metrics are read from memory only, so polling never touches the network.
+PARALLEL_UPDATES = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class LIFXCeilingSensorEntityDescription(SensorEntityDescription):
+    """Describes a LIFX Ceiling metrics sensor."""
+
+    value_fn: Callable[[LIFXCeilingMetrics], float | int | None]
+
+
+def _latency_description(percentile: int) -> LIFXCeilingSensorEntityDescription:
+    """Describe an ack latency percentile sensor."""
+    return LIFXCeilingSensorEntityDescription(
+        key=f"ack_latency_p{percentile}",
+        name=f"Ack latency p{percentile}",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.latency_percentile(percentile),
+    )
+
+
+SENSOR_DESCRIPTIONS: tuple[LIFXCeilingSensorEntityDescription, ...] = (
+    _latency_description(50),
+    _latency_description(95),
+    _latency_description(99),
+    LIFXCeilingSensorEntityDescription(
+        key="commands",
+        name="Commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.commands,
+    ),
+    LIFXCeilingSensorEntityDescription(
+        key="retries",
+        name="Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.retries,
+    ),
+    LIFXCeilingSensorEntityDescription(
+        key="timeouts",
+        name="Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.timeouts,
+    ),
+    LIFXCeilingSensorEntityDescription(
+        key="bytes_sent",
+        name="Bytes sent",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.bytes_sent,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: LIFXCeilingConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up LIFX Ceiling metrics sensors."""
+    coordinator: LIFXCeilingUpdateCoordinator = entry.runtime_data
+
+    @callback
+    def _add_ceiling_sensors(device: LIFXCeiling) -> None:
+        async_add_entities(
+            LIFXCeilingMetricsSensor(coordinator, device, description)
+            for description in SENSOR_DESCRIPTIONS
+        )
+
+    for device in coordinator.devices:
+        _add_ceiling_sensors(device)
+
+    entry.async_on_unload(
+        coordinator.async_add_discovery_listener(_add_ceiling_sensors)
+    )
+
+
+class LIFXCeilingMetricsSensor(LIFXCeilingEntity, SensorEntity):
+    """
+    A command metric for one LIFX Ceiling.
+
+    The metrics are updated on every command, but the state is only sampled
+    on Home Assistant's polling interval so bursts of commands do not flood
+    the state machine and recorder.
+    """
+
+    entity_description: LIFXCeilingSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: LIFXCeilingUpdateCoordinator,
+        device: LIFXCeiling,
+        description: LIFXCeilingSensorEntityDescription,
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator, device)
+        self.entity_description = description
+        self._attr_unique_id = f"{format_mac(device.mac_addr)}_{description.key}"
+
+    @property
+    def should_poll(self) -> bool:
+        """Sample the in-memory metrics on the polling interval."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current metric value."""
+        return self.entity_description.value_fn(self._device.metrics)
+
+    async def async_update(self) -> None:
+        """Nothing to fetch; the value is read from memory when written."""
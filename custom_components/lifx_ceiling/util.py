@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from functools import partial
+from itertools import count
 from typing import TYPE_CHECKING, Any
 
 import homeassistant.util.color as color_util
@@ -28,25 +30,39 @@ from .const import (
     LIFX_CEILING_PRODUCT_IDS,
     OVERALL_TIMEOUT,
 )
+from .metrics import LIFXCeilingCommandTrace
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from aiolifx.aiolifx import Light
     from aiolifx.message import Message
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .metrics import LIFXCeilingMetrics
+    from .ratelimit import LIFXCeilingRateLimiter
+    from .rtt import LIFXCeilingRTTEstimator
+
+
+def lifx_ceiling_coordinator(entry: ConfigEntry) -> LIFXUpdateCoordinator | None:
+    """Return the core LIFX coordinator of a config entry if it is a ceiling."""
+    coordinator = getattr(entry, "runtime_data", None)
+    if (
+        isinstance(coordinator, LIFXUpdateCoordinator)
+        and coordinator.is_matrix
+        and coordinator.device.product in LIFX_CEILING_PRODUCT_IDS
+    ):
+        return coordinator
+    return None
+
 
 def find_lifx_coordinators(hass: HomeAssistant) -> list[LIFXUpdateCoordinator]:
     """Find all LIFX coordinators in Home Assistant's device registry."""
     coordinators: list[LIFXUpdateCoordinator] = [
-        entry.runtime_data
+        coordinator
         for entry in hass.config_entries.async_loaded_entries(LIFX_DOMAIN)
-        if hasattr(entry, "runtime_data")
-        and isinstance(entry.runtime_data, LIFXUpdateCoordinator)
-        and entry.runtime_data.is_matrix
-        and entry.runtime_data.device.product in LIFX_CEILING_PRODUCT_IDS
+        if (coordinator := lifx_ceiling_coordinator(entry)) is not None
     ]
 
     return coordinators
@@ -68,6 +84,18 @@ def async_get_legacy_entries(hass: HomeAssistant) -> list[ConfigEntry]:
     ]
 
 
+def hsbk_from_service(
+    hue: float, saturation: float, brightness: float, kelvin: float
+) -> tuple[int, int, int, int]:
+    """Convert degrees, percentages and kelvin from a service call to HSBK."""
+    return (
+        round(hue / 360 * 65535) % 65536,
+        round(saturation / 100 * 65535),
+        round(brightness / 100 * 65535),
+        int(kelvin),
+    )
+
+
 def hsbk_for_turn_on(
     current: tuple[int, int, int, int], **kwargs: Any
 ) -> tuple[int, int, int, int]:
@@ -119,50 +147,355 @@ def hsbk_for_turn_on(
     return hue, saturation, brightness, kelvin
 
 
-async def async_execute_lifx(
-    methods: Callable | list[Callable],
-    attempts: int = DEFAULT_ATTEMPTS,
-    overall_timeout: int = OVERALL_TIMEOUT,
-) -> list[Message]:
-    """Execute LIFX methods with retries."""
-    loop = asyncio.get_running_loop()
-
-    if not isinstance(methods, list):
-        methods = [methods]
+def set64_rectangles(
+    current: Sequence[tuple[int, int, int, int] | None],
+    target: Sequence[tuple[int, int, int, int]],
+    width: int,
+) -> list[tuple[int, int, int, list[tuple[int, int, int, int]]]]:
+    """
+    Return the (x, y, width, colors) set64 rectangles covering changed zones.
+
+    A set64 packet always carries 64 colors, applied row by row from (x, y)
+    using the given width and clipped to the tile, so each rectangle is filled
+    with the target colors for every zone it touches. Rows are scanned top to
+    bottom and each rectangle grows downwards for as long as the column span of
+    the changed zones still fits into a single packet.
+    """
+    height = len(target) // width
+    changed_rows: dict[int, tuple[int, int]] = {}
+    for zone, color in enumerate(target):
+        if zone < len(current) and current[zone] == color:
+            continue
+        row, column = divmod(zone, width)
+        first, last = changed_rows.get(row, (column, column))
+        changed_rows[row] = (min(first, column), max(last, column))
+
+    rectangles: list[tuple[int, int, int, list[tuple[int, int, int, int]]]] = []
+    row = 0
+    while row < height:
+        if row not in changed_rows:
+            row += 1
+            continue
+
+        first, last = changed_rows[row]
+        rows = 1
+        while row + rows < height:
+            next_first, next_last = changed_rows.get(row + rows, (first, last))
+            span = max(last, next_last) - min(first, next_first) + 1
+            if span * (rows + 1) > 64:  # noqa: PLR2004
+                break
+            first, last = min(first, next_first), max(last, next_last)
+            rows += 1
+
+        span = last - first + 1
+        covered = min(64 // span, height - row)
+        colors = [
+            target[(row + index // span) * width + first + index % span]
+            for index in range(min(64, (height - row) * span))
+        ]
+        rectangles.append((first, row, span, colors))
+
+        # Rows below the band may be overwritten too; drop the ones fully covered.
+        for extra in range(row + rows, row + covered):
+            extra_first, extra_last = changed_rows.get(extra, (first, last))
+            if first <= extra_first and extra_last <= last:
+                changed_rows.pop(extra, None)
+        row += rows
+
+    return rectangles
+
+
+class LIFXCeilingSupersededError(Exception):
+    """A newer command for the same ceiling replaced this one before it landed."""
+
+
+class LIFXCeilingCommandGenerations:
+    """
+    Command generations for one ceiling.
+
+    Every async_execute_lifx call given the tracker belongs to the generation
+    current when it started. Starting a new generation cancels the futures of
+    older calls still in flight, so they stop retrying at once and raise
+    LIFXCeilingSupersededError, and the newest command is the one that lands.
+
+    A command cut short may have left the ceiling part way to its target, so
+    the ceiling is not settled from then until a later command completes.
+    """
+
+    __slots__ = ("_in_flight", "_settled", "current")
+
+    def __init__(self) -> None:
+        """Start at generation zero with nothing in flight."""
+        self.current = 0
+        self._in_flight: set[_LIFXRequests] = set()
+        self._settled = True
+
+    @property
+    def settled(self) -> bool:
+        """Return whether nothing is in flight and nothing was cut short since."""
+        return self._settled and not self._in_flight
+
+    def supersede(self) -> None:
+        """Start a new generation, cancelling every older command in flight."""
+        self.current += 1
+        if self._in_flight:
+            self._settled = False
+        for requests in self._in_flight:
+            requests.cancel()
+
+    def track(self, requests: _LIFXRequests) -> None:
+        """Add a command now in flight to the current generation."""
+        self._in_flight.add(requests)
+
+    def untrack(self, requests: _LIFXRequests, *, completed: bool) -> None:
+        """Forget a command that has returned or raised."""
+        self._in_flight.discard(requests)
+        if not completed:
+            self._settled = False
+        elif not self._in_flight:
+            self._settled = True
+
+
+class _LIFXRequests:
+    """Futures and send bookkeeping for one async_execute_lifx call."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        methods: list[Callable],
+        *,
+        ordered: bool,
+        rtt: LIFXCeilingRTTEstimator | None,
+        metrics: LIFXCeilingMetrics | None,
+        limiter: LIFXCeilingRateLimiter | None,
+        generations: LIFXCeilingCommandGenerations | None,
+    ) -> None:
+        """Create a pending future for every callable method."""
+        self.loop = asyncio.get_running_loop()
+        self.methods = [method for method in methods if callable(method)]
+        self.futures: list[asyncio.Future[Message]] = [
+            self.loop.create_future() for _ in self.methods
+        ]
+        self.ordered = ordered
+        self.rtt = rtt
+        self.metrics = metrics
+        self.limiter = limiter
+        self.generations = generations
+        self.superseded = False
+        self._acked_out_of_order: set[int] = set()
+        self._sent_at: dict[int, float] = {}
+        self._resent: set[int] = set()
+        self._retries = 0
+        self._started = self.loop.time()
+        self._started_at = time.time()
+        if metrics is not None:
+            metrics.record_command()
+        if generations is not None:
+            generations.track(self)
+
+    def cancel(self) -> None:
+        """Give up on every unanswered method; a newer command replaced them."""
+        for future in self.futures:
+            if future.cancel():
+                self.superseded = True
+
+    def finish(self) -> None:
+        """Stop tracking the call once it has returned or raised."""
+        if self.generations is not None:
+            self.generations.untrack(
+                self,
+                completed=all(
+                    future.done() and not future.cancelled() and future.result()
+                    for future in self.futures
+                ),
+            )
 
-    methods_with_futures: list[tuple[Callable, asyncio.Future]] = [
-        (method, loop.create_future()) for method in methods if callable(method)
-    ]
+    def send_pending(self) -> float:
+        """
+        Send every unanswered method, and in ordered mode all that follow.
+
+        Returns the seconds the rate limiter is expected to hold the last of
+        them back, which the caller adds to its timeout.
+        """
+        first_pending = next(
+            (index for index, future in enumerate(self.futures) if not future.done()),
+            len(self.futures),
+        )
+        # Everything after the first pending method is resent below anyway.
+        self._acked_out_of_order.clear()
+        sent = 0
+        for index, future in enumerate(self.futures):
+            if not future.done() or (self.ordered and index > first_pending):
+                self._send(index, ahead=sent)
+                sent += 1
+        return self._pacing(sent)
+
+    def results(self, overall_timeout: float) -> list[Message]:
+        """
+        Return the responses, or raise TimeoutError if any are missing.
+
+        Raises LIFXCeilingSupersededError instead if a newer command cancelled
+        the methods that were still unanswered.
+        """
+        results: list[Message] = []
+        failed: list[str] = []
+        for method, future in zip(self.methods, self.futures, strict=True):
+            if (
+                future.cancelled()
+                or not future.done()
+                or not (result := future.result())
+            ):
+                failed.append(str(getattr(method, "__name__", method)))
+            else:
+                results.append(result)
+
+        if self.metrics is not None:
+            self.metrics.record_trace(
+                LIFXCeilingCommandTrace(
+                    started=self._started_at,
+                    methods=tuple(_method_name(method) for method in self.methods),
+                    duration=self.loop.time() - self._started,
+                    retries=self._retries,
+                    timed_out=bool(failed) and not self.superseded,
+                )
+            )
+            if failed and not self.superseded:
+                self.metrics.record_timeout()
+
+        if self.superseded:
+            msg = f"{len(failed)} requests were superseded by a newer command."
+            raise LIFXCeilingSupersededError(msg)
+        if failed:
+            msg = f"{len(failed)} requests timed out after {overall_timeout} seconds."
+            raise TimeoutError(msg)
+
+        return results
+
+    def _send(self, index: int, ahead: int = 0) -> None:
+        """
+        Send a method, remembering when it was first sent.
+
+        The method's packet goes out once ahead earlier ones have, so its send
+        time includes the wait the rate limiter is expected to impose.
+        """
+        method = self.methods[index]
+        retry = index in self._sent_at
+        if retry:
+            self._resent.add(index)
+            self._retries += 1
+        else:
+            self._sent_at[index] = self.loop.time() + self._pacing(ahead + 1)
+        if self.metrics is not None:
+            self.metrics.record_send(_method_name(method), retry=retry)
+        method(callb=partial(self._callback, index=index))
 
-    def _callback(
-        bulb: Light, message: Message | None, future: asyncio.Future[Message]
-    ) -> None:
+    def _callback(self, bulb: Light, message: Message | None, index: int) -> None:
         """Handle the response from LIFX methods."""
-        if message and not future.done():
-            future.set_result(message)
+        future = self.futures[index]
+        if not message or future.done():
+            return
 
-    timeout_per_attempt = overall_timeout / attempts
+        if self.ordered and not all(earlier.done() for earlier in self.futures[:index]):
+            self._acked_out_of_order.add(index)
+            return
 
-    for _ in range(attempts):
-        for method, future in methods_with_futures:
-            if not future.done():
-                method(callb=partial(_callback, future=future))
+        future.set_result(message)
+        # Karn's algorithm: only requests sent exactly once give a usable RTT.
+        if index not in self._resent:
+            latency = self.loop.time() - self._sent_at[index]
+            if self.rtt is not None:
+                self.rtt.add_sample(latency)
+            if self.metrics is not None:
+                self.metrics.record_ack(latency)
+        for later in sorted(self._acked_out_of_order):
+            self._acked_out_of_order.discard(later)
+            self._send(later)
 
-        futures = [future for _, future in methods_with_futures]
-        _, pending = await asyncio.wait(futures, timeout=timeout_per_attempt)
-        if not pending:
-            break
+    def _pacing(self, packets: int) -> float:
+        """Return the seconds until packets more can leave the rate limiter."""
+        return 0.0 if self.limiter is None else self.limiter.backlog(packets)
 
-    results: list[Message] = []
-    failed: list[str] = []
-    for method, future in methods_with_futures:
-        if not future.done() or not (result := future.result()):
-            failed.append(str(getattr(method, "__name__", method)))
-        else:
-            results.append(result)
 
-    if failed:
-        msg = f"{len(failed)} requests timed out after {overall_timeout} seconds."
-        raise TimeoutError(msg)
+def _method_name(method: Callable) -> str:
+    """Return the name of a method, looking through functools.partial."""
+    return getattr(getattr(method, "func", method), "__name__", "")
 
-    return results
+
+async def async_execute_lifx(  # noqa: PLR0913
+    methods: Callable | list[Callable],
+    attempts: int = DEFAULT_ATTEMPTS,
+    overall_timeout: float = OVERALL_TIMEOUT,
+    *,
+    ordered: bool = False,
+    rtt: LIFXCeilingRTTEstimator | None = None,
+    metrics: LIFXCeilingMetrics | None = None,
+    limiter: LIFXCeilingRateLimiter | None = None,
+    generations: LIFXCeilingCommandGenerations | None = None,
+) -> list[Message]:
+    """
+    Execute LIFX methods with retries.
+
+    All methods are sent back-to-back and their acks awaited together. When
+    ordered is True the methods form a pipeline whose later packets depend on
+    earlier ones (e.g. set64 before copy_frame_buffer), so a retry resends
+    everything from the first unanswered method onwards to preserve ordering.
+    An ack that arrives while an earlier method is still unanswered does not
+    count, as the earlier packet may yet land after it; the method is resent
+    as soon as everything before it has been acknowledged.
+
+    Without an RTT estimator, overall_timeout is split evenly across attempts.
+    With one, each attempt waits for the device's retransmission timeout,
+    which backs off exponentially, and retries continue until overall_timeout
+    has elapsed. Acks for methods sent exactly once update the estimate.
+    Sends, retries, ack latencies and timeouts are recorded in metrics.
+    When the device's rate limiter will hold packets back, each attempt also
+    waits for as long as it expects them to be queued. With the device's
+    command generations, the call stops as soon as a newer command
+    supersedes it.
+    """
+    if not isinstance(methods, list):
+        methods = [methods]
+
+    requests = _LIFXRequests(
+        methods,
+        ordered=ordered,
+        rtt=rtt,
+        metrics=metrics,
+        limiter=limiter,
+        generations=generations,
+    )
+    try:
+        await _async_send_with_retries(requests, attempts, overall_timeout, rtt=rtt)
+    finally:
+        requests.finish()
+    return requests.results(overall_timeout)
+
+
+async def _async_send_with_retries(
+    requests: _LIFXRequests,
+    attempts: int,
+    overall_timeout: float,
+    *,
+    rtt: LIFXCeilingRTTEstimator | None,
+) -> None:
+    """Send the requests until all are answered, superseded or out of time."""
+    loop = requests.loop
+    deadline = loop.time() + overall_timeout
+
+    for attempt in count(1):
+        pacing = requests.send_pending()
+        timeout = (
+            overall_timeout / attempts + pacing
+            if rtt is None
+            else max(0.0, min(rtt.timeout + pacing, deadline - loop.time()))
+        )
+
+        _, pending = await asyncio.wait(requests.futures, timeout=timeout)
+        if not pending:
+            break
+        if rtt is None:
+            if attempt >= attempts:
+                break
+        elif loop.time() >= deadline:
+            break
+        else:
+            rtt.backoff()
@@ -0,0 +1,155 @@
+"""Contiguous HSBK zone buffer for LIFX Ceiling frames."""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING, overload
+
+from .const import HSBK_BRIGHTNESS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+HSBK_FIELDS = 4
+
+
+class LIFXCeilingZoneBuffer:
+    """
+    Zone colors stored as one flat uint16 array of hue, saturation, brightness, kelvin.
+
+    Whole-frame operations work on strided slices of the array instead of
+    building a new list of tuples per zone, and set64 payloads are sliced
+    straight out of the buffer.
+    """
+
+    __slots__ = ("_data",)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, data: array) -> None:
+        """Wrap an existing uint16 array holding four values per zone."""
+        self._data = data
+
+    @classmethod
+    def from_colors(
+        cls, colors: Iterable[tuple[int, int, int, int]]
+    ) -> LIFXCeilingZoneBuffer:
+        """Create a buffer from HSBK tuples."""
+        if isinstance(colors, LIFXCeilingZoneBuffer):
+            return colors.copy()
+        return cls(array("H", chain.from_iterable(colors)))
+
+    @classmethod
+    def filled(
+        cls, color: tuple[int, int, int, int], zones: int
+    ) -> LIFXCeilingZoneBuffer:
+        """Create a buffer with every zone set to the same color."""
+        return cls(array("H", color) * zones)
+
+    def copy(self) -> LIFXCeilingZoneBuffer:
+        """Return an independent copy of the buffer."""
+        return LIFXCeilingZoneBuffer(array("H", self._data))
+
+    def __len__(self) -> int:
+        """Return the number of zones."""
+        return len(self._data) // HSBK_FIELDS
+
+    @overload
+    def __getitem__(self, zone: int) -> tuple[int, int, int, int]: ...
+
+    @overload
+    def __getitem__(self, zone: slice) -> list[tuple[int, int, int, int]]: ...
+
+    def __getitem__(
+        self, zone: int | slice
+    ) -> tuple[int, int, int, int] | list[tuple[int, int, int, int]]:
+        """Return the HSBK tuple for a zone, or a list of tuples for a slice."""
+        if isinstance(zone, slice):
+            start, stop, step = zone.indices(len(self))
+            if step != 1:
+                return [self[index] for index in range(start, stop, step)]
+            return self.colors(start, stop)
+
+        if zone < 0:
+            zone += len(self)
+        offset = zone * HSBK_FIELDS
+        if not 0 <= offset < len(self._data):
+            msg = "zone index out of range"
+            raise IndexError(msg)
+        hue, saturation, brightness, kelvin = self._data[offset : offset + HSBK_FIELDS]
+        return hue, saturation, brightness, kelvin
+
+    def __setitem__(self, zone: int, color: tuple[int, int, int, int]) -> None:
+        """Set the HSBK tuple for a zone."""
+        if zone < 0:
+            zone += len(self)
+        offset = zone * HSBK_FIELDS
+        self._data[offset : offset + HSBK_FIELDS] = array("H", color)
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int]]:
+        """Iterate over the zones as HSBK tuples."""
+        return iter(self.colors())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another buffer or a sequence of HSBK tuples."""
+        if isinstance(other, LIFXCeilingZoneBuffer):
+            return self._data == other._data
+        if isinstance(other, list | tuple):
+            return self.colors() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"LIFXCeilingZoneBuffer({self.colors()!r})"
+
+    def _bounds(self, start: int, stop: int | None) -> tuple[int, int]:
+        """Return the array offsets for a zone range."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return start * HSBK_FIELDS, max(start, stop) * HSBK_FIELDS
+
+    def colors(
+        self, start: int = 0, stop: int | None = None
+    ) -> list[tuple[int, int, int, int]]:
+        """Return a zone range as a list of HSBK tuples for a set64 payload."""
+        first, last = self._bounds(start, stop)
+        values = iter(self._data[first:last])
+        return list(zip(values, values, values, values, strict=True))
+
+    def fill(
+        self, color: tuple[int, int, int, int], start: int = 0, stop: int | None = None
+    ) -> None:
+        """Set every zone in the range to the same color."""
+        first, last = self._bounds(start, stop)
+        self._data[first:last] = array("H", color) * ((last - first) // HSBK_FIELDS)
+
+    def write(
+        self, colors: Iterable[tuple[int, int, int, int]], start: int = 0
+    ) -> None:
+        """Overwrite consecutive zones, from start onwards, with HSBK tuples."""
+        values = array("H", chain.from_iterable(colors))
+        first = start * HSBK_FIELDS
+        self._data[first : first + len(values)] = values
+
+    def zero_brightness(self, start: int = 0, stop: int | None = None) -> None:
+        """Set the brightness of every zone in the range to zero."""
+        first, last = self._bounds(start, stop)
+        zones = (last - first) // HSBK_FIELDS
+        self._data[first + HSBK_BRIGHTNESS : last : HSBK_FIELDS] = array(
+            "H", bytes(2 * zones)
+        )
+
+    def max_brightness(self, start: int = 0, stop: int | None = None) -> int:
+        """Return the highest brightness in the range."""
+        first, last = self._bounds(start, stop)
+        return max(self._data[first + HSBK_BRIGHTNESS : last : HSBK_FIELDS], default=0)
+
+    def scale_brightness(
+        self, factor: float, start: int = 0, stop: int | None = None
+    ) -> None:
+        """Multiply the brightness of every zone in the range, clamped to 65535."""
+        first, last = self._bounds(start, stop)
+        brightness = slice(first + HSBK_BRIGHTNESS, last, HSBK_FIELDS)
+        self._data[brightness] = array(
+            "H", (min(65535, round(value * factor)) for value in self._data[brightness])
+        )
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 from aiolifx.aiolifx import Light
+from aiolifx.msgtypes import MSG_IDS, TileCopyFrameBuffer, TileSet64
 from aiolifx.products import products_dict
 
 from custom_components.lifx_ceiling import api
@@ -130,14 +131,14 @@ async def test_async_set64_rejects_wrong_number_of_colors() -> None:
 async def test_async_set64_splits_128_zone_updates(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """128-zone ceilings should send two framebuffer writes before copying."""
+    """128-zone ceilings should pipeline two writes, the copy and power on."""
     ceiling = _make_ceiling(product=201)
-    calls: list[Any] = []
+    calls: list[tuple[Any, dict[str, Any]]] = []
 
     async def _fake_async_execute_lifx(
-        methods: Any, *_args: Any, **_kwargs: Any
+        methods: Any, *_args: Any, **kwargs: Any
     ) -> list[Any]:
-        calls.append(methods)
+        calls.append((methods, kwargs))
         return []
 
     monkeypatch.setattr(api, "async_execute_lifx", _fake_async_execute_lifx)
@@ -145,14 +146,21 @@ async def test_async_set64_splits_128_zone_updates(
     colors = [(index, index, index, 3500) for index in range(128)]
     await ceiling.async_set64(colors=colors, duration=2, power_on=True)
 
-    assert len(calls) == 3
-
-    set64_calls = calls[0]
-    assert isinstance(set64_calls, list)
-    assert len(set64_calls) == 2
-
-    first_write, second_write = set64_calls
+    assert len(calls) == 1
+    methods, kwargs = calls[0]
+    assert kwargs == {
+        "ordered": True,
+        "rtt": ceiling.rtt,
+        "metrics": ceiling.metrics,
+        "limiter": ceiling.limiter,
+        "generations": ceiling.generations,
+    }
+    assert isinstance(methods, list)
+    assert len(methods) == 4
+
+    first_write, second_write, copy_call, power_call = methods
     assert isinstance(first_write, partial)
+    assert first_write.func is ceiling.set64
     assert first_write.keywords["y"] == 0
     assert first_write.keywords["width"] == 16
     assert first_write.keywords["colors"] == colors[:64]
@@ -162,11 +170,10 @@ async def test_async_set64_splits_128_zone_updates(
     assert second_write.keywords["width"] == 16
     assert second_write.keywords["colors"] == colors[64:]
 
-    copy_call = calls[1]
     assert isinstance(copy_call, partial)
+    assert copy_call.func is ceiling.copy_frame_buffer
     assert copy_call.keywords["duration"] == 0
 
-    power_call = calls[2]
     assert isinstance(power_call, partial)
     assert power_call.keywords["value"] == "on"
     assert power_call.keywords["duration"] == 2000
@@ -176,14 +183,16 @@ async def test_async_set64_splits_128_zone_updates(
 async def test_async_set64_writes_single_batch_for_64_zone_ceiling(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """64-zone ceilings should send one framebuffer write and copy with duration."""
+    """64-zone ceilings should pipeline one write and a copy with duration."""
     ceiling = _make_ceiling(product=176)
-    calls: list[Any] = []
+    # Without cached zone state the full frame has to be uploaded.
+    ceiling.chain = {}
+    calls: list[tuple[Any, dict[str, Any]]] = []
 
     async def _fake_async_execute_lifx(
-        methods: Any, *_args: Any, **_kwargs: Any
+        methods: Any, *_args: Any, **kwargs: Any
     ) -> list[Any]:
-        calls.append(methods)
+        calls.append((methods, kwargs))
         return []
 
     monkeypatch.setattr(api, "async_execute_lifx", _fake_async_execute_lifx)
@@ -191,18 +200,342 @@ async def test_async_set64_writes_single_batch_for_64_zone_ceiling(
     colors = [(index, index, index, 3500) for index in range(64)]
     await ceiling.async_set64(colors=colors, duration=7)
 
-    assert len(calls) == 2
-    set_call = calls[0]
+    assert len(calls) == 1
+    methods, kwargs = calls[0]
+    assert kwargs == {
+        "ordered": True,
+        "rtt": ceiling.rtt,
+        "metrics": ceiling.metrics,
+        "limiter": ceiling.limiter,
+        "generations": ceiling.generations,
+    }
+    assert len(methods) == 2
+
+    set_call, copy_call = methods
     assert isinstance(set_call, partial)
     assert set_call.keywords["y"] == 0
     assert set_call.keywords["width"] == 8
     assert set_call.keywords["colors"] == colors
 
-    copy_call = calls[1]
     assert isinstance(copy_call, partial)
     assert copy_call.keywords["duration"] == 7
 
 
+@pytest.mark.parametrize(
+    ("product", "uplight_x", "uplight_y"),
+    [(176, 7, 7), (201, 15, 7)],
+)
+@pytest.mark.asyncio
+async def test_async_set64_writes_single_changed_zone_as_one_packet(
+    monkeypatch: pytest.MonkeyPatch,
+    product: int,
+    uplight_x: int,
+    uplight_y: int,
+) -> None:
+    """Changing only the uplight should send one small set64 to the visible buffer."""
+    ceiling = _make_ceiling(product=product)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+
+    colors = [*ceiling.chain[0][ceiling.downlight_zones], (1, 2, 3, 4)]
+    await ceiling.async_set64(colors=colors, duration=3)
+
+    execute.assert_awaited_once()
+    methods = execute.await_args.args[0]
+    assert len(methods) == 1
+    (write,) = methods
+    assert write.func is ceiling.set64
+    assert write.keywords["fb_index"] == 0
+    assert write.keywords["x"] == uplight_x
+    assert write.keywords["y"] == uplight_y
+    assert write.keywords["width"] == 1
+    assert write.keywords["duration"] == 3
+    assert write.keywords["colors"] == [(1, 2, 3, 4)]
+
+
+@pytest.mark.asyncio
+async def test_async_set64_uses_full_frame_when_changes_need_several_packets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Scattered changes should fall back to the atomic framebuffer copy."""
+    ceiling = _make_ceiling(product=201)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+
+    colors = list(ceiling.chain[0])
+    colors[0] = (1, 1, 1, 1)
+    colors[15] = (1, 1, 1, 1)
+    colors[127] = (1, 1, 1, 1)
+    await ceiling.async_set64(colors=colors)
+
+    methods = execute.await_args.args[0]
+    assert [method.func for method in methods] == [
+        ceiling.set64,
+        ceiling.set64,
+        ceiling.copy_frame_buffer,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_set64_full_frame_ignores_the_cached_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A full frame should be sent even when nothing appears to have changed."""
+    ceiling = _make_ceiling(product=176)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+
+    await ceiling.async_set64(colors=list(ceiling.chain[0]), full_frame=True)
+
+    methods = execute.await_args.args[0]
+    assert [method.func for method in methods] == [
+        ceiling.set64,
+        ceiling.copy_frame_buffer,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_set64_skips_frames_the_ceiling_already_shows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Re-asserting the cached state should send nothing unless forced."""
+    ceiling = _make_ceiling(product=176)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+    colors = list(ceiling.chain[0])
+
+    assert await ceiling.async_set64(colors=colors) is False
+    assert await ceiling.async_set64(colors=colors, power_on=True) is False
+    execute.assert_not_awaited()
+    assert ceiling.metrics.skipped == 2
+
+    assert await ceiling.async_set64(colors=colors, force=True) is True
+    execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_set64_sends_the_cached_frame_when_it_may_be_stale(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A ceiling that is off, or had a command cut short, gets the frame again."""
+    ceiling = _make_ceiling(product=176, power_level=0)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+    colors = list(ceiling.chain[0])
+
+    assert await ceiling.async_set64(colors=colors, power_on=True) is True
+
+    requests = Mock()
+    ceiling.generations.track(requests)
+    ceiling.generations.supersede()
+    ceiling.generations.untrack(requests, completed=False)
+
+    assert await ceiling.async_set64(colors=colors) is True
+    assert execute.await_count == 2
+    assert ceiling.metrics.skipped == 0
+
+
+@pytest.mark.asyncio
+async def test_turning_a_light_off_twice_sends_nothing_the_second_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A ceiling already known to be off should not be sent another set_power."""
+    ceiling = _make_ceiling(
+        product=176, power_level=0, downlight_color=(1000, 2000, 0, 3500)
+    )
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+
+    assert await ceiling.turn_uplight_off(duration=2) is False
+    assert await ceiling.turn_downlight_off(duration=2) is False
+    execute.assert_not_awaited()
+
+    assert await ceiling.turn_downlight_off(duration=2, force=True) is True
+    execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_staged_frames_are_uploaded_once_and_shown_with_one_copy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Staging a resident frame sends nothing, and showing it is a single copy."""
+    ceiling = _make_ceiling(product=201, power_level=0)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+    colors = [(index, 65535, 30000, 3500) for index in range(128)]
+
+    with pytest.raises(LIFXCeilingError, match="No frame is staged"):
+        await ceiling.async_show_frame()
+
+    await ceiling.async_stage_frame(colors)
+    await ceiling.async_stage_frame(colors)
+    methods = execute.await_args.args[0]
+    assert execute.await_count == 1
+    assert [method.keywords["fb_index"] for method in methods] == [1, 1]
+
+    await ceiling.async_show_frame(duration=5, power_on=True)
+    copy, power = execute.await_args.args[0]
+    assert copy.func is ceiling.copy_frame_buffer
+    assert copy.keywords["src_fb_index"] == 1
+    assert copy.keywords["duration"] == 0
+    assert power.keywords == {"value": "on", "duration": 5000}
+    assert ceiling.chain[0] == colors
+    assert ceiling.power_level == 65535
+
+
+def test_packed_frames_match_aiolifx_packing() -> None:
+    """A set64 sent from a packed payload should match aiolifx's own message."""
+    ceiling = _make_ceiling(product=201)
+    ceiling.mac_addr = "d0:73:d5:01:02:03"
+    ceiling.source_id = 1234
+    colors = [(index, 2 * index, 3 * index, 3500) for index in range(128)]
+
+    payloads = ceiling.pack_frame(colors)
+    packed = api.LIFXCeilingPackedMessage(
+        ceiling.mac_addr,
+        ceiling.source_id,
+        7,
+        {"msg_type": MSG_IDS[TileSet64], "packed": payloads[1]},
+        ack_requested=True,
+    )
+    expected = TileSet64(
+        ceiling.mac_addr,
+        ceiling.source_id,
+        7,
+        {
+            "tile_index": 0,
+            "length": 1,
+            "fb_index": 1,
+            "x": 0,
+            "y": 4,
+            "width": 16,
+            "duration": 0,
+            "colors": colors[64:],
+        },
+        ack_requested=True,
+    )
+
+    assert len(payloads) == 2
+    assert packed.packed_message == expected.packed_message
+
+
+def test_set64_reuses_encoded_payloads_across_ceilings() -> None:
+    """Identical set64 requests share one payload and match aiolifx's packing."""
+    colors = [(index, 2 * index, 3 * index, 3500) for index in range(10)]
+    sent: list[bytes] = []
+    for mac_addr in ("d0:73:d5:01:02:03", "d0:73:d5:04:05:06"):
+        ceiling = _make_ceiling(product=201)
+        ceiling.mac_addr = mac_addr
+        del ceiling.set64
+        ceiling.set64_packed = Mock()
+        ceiling.set64(fb_index=0, x=3, y=2, duration=1.5, colors=colors)
+        (payload,), _ = ceiling.set64_packed.call_args
+        sent.append(payload)
+
+    expected = TileSet64(
+        "d0:73:d5:01:02:03",
+        1234,
+        7,
+        {
+            "tile_index": 0,
+            "length": 1,
+            "fb_index": 0,
+            "x": 3,
+            "y": 2,
+            "width": 16,
+            "duration": 1500,
+            "colors": colors + [(0, 0, 0, 3500)] * 54,
+        },
+    )
+
+    assert sent[0] is sent[1]
+    assert sent[0] == expected.get_payload()
+
+
+def test_foreign_framebuffer_writes_forget_staged_frames() -> None:
+    """Themes painting off-screen or copies into it invalidate what was staged."""
+    ceiling = _make_ceiling(product=201)
+    del ceiling.set64
+    del ceiling.copy_frame_buffer
+    ceiling.set64_packed = Mock()
+    ceiling.req_with_ack = Mock()
+    frame = [(0, 0, 65535, 3500)] * 128
+    ceiling.staged_frames.update({1: frame, 2: frame})
+
+    ceiling.set64(fb_index=0, colors=frame[:64])
+    ceiling.copy_frame_buffer(src_fb_index=1, dst_fb_index=0)
+    assert ceiling.staged_frames == {1: frame, 2: frame}
+
+    ceiling.set64(fb_index=1, colors=frame[:64])
+    assert ceiling.staged_frames == {2: frame}
+    ceiling.copy_frame_buffer(src_fb_index=0, dst_fb_index=2)
+    assert ceiling.staged_frames == {}
+    assert ceiling.req_with_ack.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_packed_frames_are_only_uploaded_when_not_staged(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Showing a packed frame already in framebuffer 1 should send only the copy."""
+    ceiling = _make_ceiling(product=176)
+    execute = AsyncMock()
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
+    colors = [(index, 65535, 30000, 3500) for index in range(64)]
+    payloads = ceiling.pack_frame(colors)
+
+    await ceiling.async_show_packed(colors, payloads, 2)
+    set64, copy = execute.await_args.args[0]
+    assert set64.func == ceiling.set64_packed
+    assert set64.args == (payloads[0],)
+    assert copy.keywords["duration"] == 2
+
+    await ceiling.async_stage_packed(colors, payloads)
+    await ceiling.async_show_packed(colors, payloads)
+    assert execute.await_count == 2
+    (copy,) = execute.await_args.args[0]
+    assert copy.func is ceiling.copy_frame_buffer
+    assert ceiling.chain[0] == colors
+
+
+def test_streamed_messages_match_aiolifx_packing() -> None:
+    """Streamed set64 and copy_frame_buffer packets should be byte-identical."""
+    ceiling = _make_ceiling(product=201)
+    ceiling.mac_addr = "d0:73:d5:01:02:03"
+    ceiling.source_id = 1234
+    ceiling.transport = Mock()
+    colors = [(index, 2 * index, 3 * index, 3500) for index in range(40)]
+    set64 = {"tile_index": 0, "length": 1, "fb_index": 1, "x": 0, "y": 4}
+    copy = {"tile_index": 0, "length": 1, "src_fb_index": 1, "dst_fb_index": 0}
+    copy |= {"src_x": 0, "src_y": 0, "dst_x": 0, "dst_y": 0, "width": 16}
+
+    ceiling._set64_no_ack(**set64, width=16, colors=colors, duration=250)
+    ceiling._copy_frame_buffer_no_ack(**copy, duration=250)
+
+    expected = [
+        TileSet64(
+            ceiling.mac_addr,
+            1234,
+            seq_num=0,
+            payload={
+                **set64,
+                "width": 16,
+                "duration": 250,
+                "colors": [*colors, *[(0, 0, 0, 3500)] * 24],
+            },
+        ).packed_message,
+        TileCopyFrameBuffer(
+            ceiling.mac_addr,
+            1234,
+            seq_num=0,
+            payload={**copy, "height": 8, "duration": 250},
+        ).packed_message,
+    ]
+    sent = [call.args[0] for call in ceiling.transport.sendto.call_args_list]
+    assert sent == expected
+    assert ceiling.metrics.bytes_sent == 36 + 10 + 64 * 8 + 36 + 15
+
+
 @pytest.mark.asyncio
 async def test_turn_uplight_on_preserves_existing_downlight_when_powered() -> None:
     """Turning the uplight on while powered should keep the current downlight state."""
@@ -217,6 +550,7 @@ async def test_turn_uplight_on_preserves_existing_downlight_when_powered() -> No
         colors=expected_colors,
         duration=5,
         power_on=False,
+        force=False,
     )
 
 
@@ -236,6 +570,7 @@ async def test_turn_uplight_on_zeroes_downlight_when_device_is_off() -> None:
         colors=[*expected_downlight, color],
         duration=5,
         power_on=True,
+        force=False,
     )
 
 
@@ -251,7 +586,9 @@ async def test_turn_uplight_off_dim_only_when_downlight_is_on() -> None:
         *ceiling.chain[0][ceiling.downlight_zones],
         (4000, 5000, 0, 6500),
     ]
-    ceiling.async_set64.assert_awaited_once_with(colors=expected_colors, duration=2)
+    ceiling.async_set64.assert_awaited_once_with(
+        colors=expected_colors, duration=2, force=False
+    )
 
 
 @pytest.mark.asyncio
@@ -274,6 +611,7 @@ async def test_turn_uplight_off_powers_device_down_when_downlight_is_off(
     assert isinstance(method, partial)
     assert method.keywords["value"] == "off"
     assert method.keywords["duration"] == 2000
+    assert ceiling.power_level == 0
 
 
 @pytest.mark.asyncio
@@ -289,6 +627,7 @@ async def test_turn_downlight_on_preserves_uplight_when_powered() -> None:
         colors=[color] * 63 + [ceiling.chain[0][ceiling.uplight_zone]],
         duration=6,
         power_on=False,
+        force=False,
     )
 
 
@@ -305,6 +644,7 @@ async def test_turn_downlight_on_zeroes_uplight_when_device_is_off() -> None:
         colors=[color] * 63 + [(4000, 5000, 0, 6500)],
         duration=6,
         power_on=True,
+        force=False,
     )
 
 
@@ -322,6 +662,7 @@ async def test_turn_downlight_off_dim_only_when_uplight_is_on() -> None:
     ceiling.async_set64.assert_awaited_once_with(
         colors=[*expected_downlight, ceiling.chain[0][ceiling.uplight_zone]],
         duration=4,
+        force=False,
     )
 
 
@@ -345,3 +686,82 @@ async def test_turn_downlight_off_powers_device_down_when_uplight_is_off(
     assert isinstance(method, partial)
     assert method.keywords["value"] == "off"
     assert method.keywords["duration"] == 4000
+
+
+@pytest.mark.asyncio
+async def test_async_set64_updates_cached_state_after_ack(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An acknowledged frame should be reflected in the cached zone state."""
+    ceiling = _make_ceiling(product=176, power_level=0)
+    monkeypatch.setattr(api, "async_execute_lifx", AsyncMock())
+
+    colors = [(index, index, index, 3500) for index in range(64)]
+    await ceiling.async_set64(colors=colors, power_on=True)
+
+    assert ceiling.chain[0] == colors
+    assert ceiling.chain[0] is not colors
+    assert ceiling.power_level == 65535
+
+
+@pytest.mark.asyncio
+async def test_async_set64_keeps_cached_state_when_write_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed write should leave the cached zone state untouched."""
+    ceiling = _make_ceiling(product=176, power_level=0)
+    previous = list(ceiling.chain[0])
+    monkeypatch.setattr(
+        api, "async_execute_lifx", AsyncMock(side_effect=TimeoutError("no ack"))
+    )
+
+    with pytest.raises(TimeoutError):
+        await ceiling.async_set64(colors=[(1, 1, 1, 1)] * 64, power_on=True)
+
+    assert ceiling.chain[0] == previous
+    assert ceiling.power_level == 0
+
+
+def test_zone_summary_is_reused_until_invalidated() -> None:
+    """Derived properties should share one summary until the zones are written."""
+    ceiling = _make_ceiling(product=201)
+
+    summary = ceiling.zone_summary
+    assert ceiling.downlight_brightness == 3000 >> 8
+    assert ceiling.zone_summary is summary
+
+    # aiolifx updates the chain in place; the core update invalidates it.
+    ceiling.chain[0][5] = (1000, 2000, 65535, 3500)
+    assert ceiling.zone_summary is summary
+    ceiling.invalidate_zone_summary()
+    assert ceiling.zone_summary is not summary
+    assert ceiling.downlight_brightness == 255
+    assert ceiling.downlight_color == (1000, 2000, 65535, 3500)
+
+    summary = ceiling.zone_summary
+    ceiling.power_level = 0
+    ceiling.invalidate_zone_summary()
+    assert ceiling.zone_summary is not summary
+    assert ceiling.downlight_is_on is False
+    assert ceiling.uplight_is_on is False
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_the_zone_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Acked frames and power changes should be reflected by the next read."""
+    ceiling = _make_ceiling(product=201, power_level=0)
+
+    async def _fake_async_execute_lifx(*_args: Any, **_kwargs: Any) -> list[Any]:
+        return []
+
+    monkeypatch.setattr(api, "async_execute_lifx", _fake_async_execute_lifx)
+
+    assert ceiling.downlight_is_on is False
+    await ceiling.async_set64(colors=[(1, 1, 65535, 3500)] * 128, power_on=True)
+    assert ceiling.downlight_is_on is True
+    assert ceiling.downlight_brightness == 255
+
+    await ceiling.async_power_off()
+    assert ceiling.downlight_is_on is False
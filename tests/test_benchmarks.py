@@ -0,0 +1,26 @@
+"""Smoke test of the benchmark suite."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks import runner
+from benchmarks.cases import all_cases
+
+
+def test_every_benchmark_case_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every case should get through calibration outside a running event loop."""
+    monkeypatch.setattr(runner, "MIN_ROUND_TIME", 0.01)
+    loop = asyncio.new_event_loop()
+    names = []
+    try:
+        for name, func in all_cases(loop):
+            runner.measure(func, rounds=1)
+            names.append(name)
+    finally:
+        loop.close()
+
+    assert len(names) == len(set(names))
+    assert any(name.startswith("effect_frame[") for name in names)
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from homeassistant.components.light import ATTR_TRANSITION
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
 from homeassistant.const import ATTR_DEVICE_ID
 from homeassistant.exceptions import HomeAssistantError
 
+from custom_components.lifx_ceiling import api
 from custom_components.lifx_ceiling import coordinator as coordinator_module
 from custom_components.lifx_ceiling.api import LIFXCeiling
 from custom_components.lifx_ceiling.const import (
@@ -17,6 +24,7 @@ from custom_components.lifx_ceiling.const import (
     ATTR_DOWNLIGHT_HUE,
     ATTR_DOWNLIGHT_KELVIN,
     ATTR_DOWNLIGHT_SATURATION,
+    ATTR_FORCE,
     ATTR_UPLIGHT_BRIGHTNESS,
     ATTR_UPLIGHT_HUE,
     ATTR_UPLIGHT_KELVIN,
@@ -24,6 +32,7 @@ from custom_components.lifx_ceiling.const import (
     DOMAIN,
 )
 from custom_components.lifx_ceiling.coordinator import LIFXCeilingUpdateCoordinator
+from custom_components.lifx_ceiling.util import async_execute_lifx
 
 
 def _make_config_entry() -> SimpleNamespace:
@@ -40,6 +49,7 @@ def _make_lifx_ceiling(*, mac_addr: str = "aa:bb:cc:dd:ee:ff") -> LIFXCeiling:
     device.mac_addr = mac_addr
     device.product = 176
     device.power_level = 0
+    device.chain = {0: []}
     device.async_set64 = AsyncMock()
     device.set_power = MagicMock()
     device.turn_uplight_on = AsyncMock()
@@ -49,6 +59,18 @@ def _make_lifx_ceiling(*, mac_addr: str = "aa:bb:cc:dd:ee:ff") -> LIFXCeiling:
     return device
 
 
+def _make_core_coordinator(device: object = None, **kwargs: object) -> SimpleNamespace:
+    """Create a minimal core LIFX coordinator stub."""
+    return SimpleNamespace(
+        device=device,
+        async_update_listeners=MagicMock(),
+        async_request_refresh=AsyncMock(),
+        async_refresh=AsyncMock(),
+        last_update_success=True,
+        **kwargs,
+    )
+
+
 @pytest.mark.asyncio
 async def test_async_update_discovers_new_ceiling_and_calls_callback(
     monkeypatch: pytest.MonkeyPatch,
@@ -57,7 +79,9 @@ async def test_async_update_discovers_new_ceiling_and_calls_callback(
     hass = MagicMock()
     coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
     core_device = SimpleNamespace(mac_addr="aa:bb")
-    core_coordinator = SimpleNamespace(device=core_device)
+    core_coordinator = SimpleNamespace(
+        device=core_device, config_entry=SimpleNamespace(entry_id="core-1")
+    )
     ceiling = _make_lifx_ceiling(mac_addr="aa:bb")
     discovered: list[LIFXCeiling] = []
 
@@ -71,13 +95,117 @@ async def test_async_update_discovers_new_ceiling_and_calls_callback(
         "cast",
         lambda device: ceiling,
     )
-    coordinator.set_discovery_callback(discovered.append)
+    coordinator.async_add_discovery_listener(discovered.append)
+    listened: list[LIFXCeiling] = []
+    removed: list[LIFXCeiling] = []
+    coordinator.async_add_discovery_listener(listened.append)
+    coordinator.async_add_discovery_listener(removed.append)()
 
     await coordinator.async_update()
 
     assert coordinator.devices == [ceiling]
     assert coordinator._ceiling_coordinators["aa:bb"] is core_coordinator
     assert discovered == [ceiling]
+    assert listened == [ceiling]
+    assert removed == []
+    assert coordinator.discovery_runs == 1
+    assert coordinator.last_discovery is not None
+    assert coordinator.last_discovery_duration >= 0
+
+
+def _make_lifx_entry(
+    state: ConfigEntryState, *, entry_id: str = "core-1", domain: str = "lifx"
+) -> SimpleNamespace:
+    """Create a core LIFX config entry stub."""
+    return SimpleNamespace(entry_id=entry_id, domain=domain, state=state)
+
+
+@pytest.mark.asyncio
+async def test_lifx_entry_events_add_and_remove_ceilings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Core LIFX entries loading and unloading should update the ceiling index."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    ceiling = _make_lifx_ceiling(mac_addr="aa:bb")
+    entry = _make_lifx_entry(ConfigEntryState.LOADED)
+    core_coordinator = SimpleNamespace(device=ceiling, config_entry=entry)
+    connected: dict[str, object] = {}
+    sent: list[str] = []
+
+    def _connect(hass: object, signal: str, target: object) -> MagicMock:
+        connected[signal] = target
+        return MagicMock()
+
+    monkeypatch.setattr(coordinator_module, "async_dispatcher_connect", _connect)
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_dispatcher_send",
+        lambda hass, signal: sent.append(signal),
+    )
+    monkeypatch.setattr(
+        coordinator_module,
+        "lifx_ceiling_coordinator",
+        lambda entry: core_coordinator,
+    )
+    monkeypatch.setattr(coordinator_module.LIFXCeiling, "cast", lambda device: device)
+    discovered: list[LIFXCeiling] = []
+    coordinator.async_add_discovery_listener(discovered.append)
+
+    coordinator.async_track_lifx_entries()
+    changed = connected[SIGNAL_CONFIG_ENTRY_CHANGED]
+
+    changed(
+        ConfigEntryChange.UPDATED,
+        _make_lifx_entry(ConfigEntryState.LOADED, domain="hue"),
+    )
+    assert coordinator.devices == []
+
+    changed(ConfigEntryChange.UPDATED, entry)
+    changed(ConfigEntryChange.UPDATED, entry)
+    assert coordinator.devices == [ceiling]
+    assert discovered == [ceiling]
+
+    cancel_verify = MagicMock()
+    coordinator._cancel_verify["aa:bb"] = cancel_verify
+    changed(
+        ConfigEntryChange.UPDATED,
+        _make_lifx_entry(ConfigEntryState.UNLOAD_IN_PROGRESS),
+    )
+
+    assert coordinator.devices == []
+    assert coordinator._ceiling_coordinators == {}
+    assert sent == ["lifx_ceiling_ceiling_removed_aa:bb"]
+    cancel_verify.assert_called_once_with()
+
+    changed(ConfigEntryChange.REMOVED, entry)
+    assert sent == ["lifx_ceiling_ceiling_removed_aa:bb"]
+
+
+@pytest.mark.asyncio
+async def test_async_update_forgets_entries_that_are_no_longer_loaded(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The safety-net scan should drop ceilings whose entries disappeared."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    ceiling = _make_lifx_ceiling(mac_addr="aa:bb")
+    coordinator._ceilings.add(ceiling)
+    coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(device=ceiling)
+    coordinator._entry_macs["core-1"] = "aa:bb"
+    sent: list[str] = []
+
+    monkeypatch.setattr(coordinator_module, "find_lifx_coordinators", lambda hass: [])
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_dispatcher_send",
+        lambda hass, signal: sent.append(signal),
+    )
+
+    await coordinator.async_update()
+
+    assert coordinator.devices == []
+    assert sent == ["lifx_ceiling_ceiling_removed_aa:bb"]
 
 
 @pytest.mark.asyncio
@@ -90,18 +218,80 @@ async def test_coordinator_accessors_and_listener_helpers() -> None:
     coordinator._ceilings.add(device)
     coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
 
-    def callback(device: object) -> None:
-        return None
-
-    assert coordinator.discovery_callback is None
-    assert coordinator.set_discovery_callback(callback) is None
-    assert coordinator.discovery_callback is callback
     assert coordinator.devices == [device]
     assert await coordinator._async_update_data() == [device]
 
-    listener = MagicMock()
-    coordinator.async_add_core_listener(device, listener)
-    core_coordinator.async_add_listener.assert_called_once_with(listener)
+    coordinator.async_add_core_listener(device, "downlight", MagicMock())
+    coordinator.async_add_core_listener(device, "uplight", MagicMock())
+    core_coordinator.async_add_listener.assert_called_once()
+
+
+def test_core_updates_reach_only_the_lights_that_changed() -> None:
+    """One core listener should pass each light the summary when it changes."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    remove_listener = MagicMock()
+    core_coordinator = _make_core_coordinator(
+        device, async_add_listener=MagicMock(return_value=remove_listener)
+    )
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    coordinator._entry_macs["core-1"] = "aa:bb"
+    downlight = MagicMock()
+    uplight = MagicMock()
+
+    coordinator.async_add_core_listener(device, "downlight", downlight)
+    remove_uplight = coordinator.async_add_core_listener(device, "uplight", uplight)
+    dispatch = core_coordinator.async_add_listener.call_args.args[0]
+    dispatch()
+    dispatch()
+
+    # Each core update recomputes the summary once for both lights.
+    summary = downlight.call_args.args[0]
+    downlight.assert_called_once_with(summary)
+    uplight.assert_called_once_with(summary)
+    assert summary.uplight_color == device.uplight_color
+
+    device.chain[0] = [*device.chain[0][:63], (100, 200, 900, 4000)]
+    dispatch()
+
+    assert downlight.call_count == 1
+    assert uplight.call_count == 2
+
+    remove_uplight()
+    device.chain[0] = [(0, 0, 500, 3500)] * 64
+    dispatch()
+
+    assert downlight.call_count == 2
+    assert uplight.call_count == 2
+    core_coordinator.async_add_listener.assert_called_once()
+
+    device.staged_frames[1] = device.chain[0]
+    core_coordinator.last_update_success = False
+    dispatch()
+
+    assert device.staged_frames == {}
+
+    coordinator._async_remove_lifx_entry("core-1")
+    remove_listener.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_removes_the_core_listeners() -> None:
+    """Unloading should not leave dispatchers on the core coordinators."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    remove_listener = MagicMock()
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(
+        device, async_add_listener=MagicMock(return_value=remove_listener)
+    )
+    coordinator.async_add_core_listener(device, "downlight", MagicMock())
+
+    await coordinator.async_shutdown()
+
+    remove_listener.assert_called_once_with()
+    assert coordinator._state_dispatchers == {}
 
 
 @pytest.mark.asyncio
@@ -115,7 +305,10 @@ async def test_async_update_ignores_existing_devices(
     coordinator._ceilings.add(existing)
     coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(device=existing)
 
-    core_coordinator = SimpleNamespace(device=SimpleNamespace(mac_addr="aa:bb"))
+    core_coordinator = SimpleNamespace(
+        device=SimpleNamespace(mac_addr="aa:bb"),
+        config_entry=SimpleNamespace(entry_id="core-1"),
+    )
     cast = MagicMock()
     monkeypatch.setattr(
         coordinator_module,
@@ -158,13 +351,14 @@ async def test_async_set_state_turns_device_off_when_both_brightness_values_are_
     hass = MagicMock()
     coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
     device = _make_lifx_ceiling(mac_addr="aa:bb")
-    coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(device=device)
+    device.power_level = 65535
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
     fake_registry = SimpleNamespace(
         async_get=lambda device_id: SimpleNamespace(identifiers={(DOMAIN, "aa:bb")})
     )
     execute = AsyncMock()
     monkeypatch.setattr(coordinator_module.dr, "async_get", lambda hass: fake_registry)
-    monkeypatch.setattr(coordinator_module, "async_execute_lifx", execute)
+    monkeypatch.setattr(api, "async_execute_lifx", execute)
 
     call_data = {
         ATTR_DEVICE_ID: ["device-1"],
@@ -179,6 +373,15 @@ async def test_async_set_state_turns_device_off_when_both_brightness_values_are_
     assert method.keywords["value"] == "off"
     assert method.keywords["duration"] == 3
     device.async_set64.assert_not_awaited()
+    assert device.power_level == 0
+
+    await coordinator.async_set_state(SimpleNamespace(data=call_data))
+    execute.assert_awaited_once()
+
+    await coordinator.async_set_state(
+        SimpleNamespace(data={**call_data, ATTR_FORCE: True})
+    )
+    assert execute.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -190,7 +393,7 @@ async def test_async_set_state_updates_zone_colors_for_matching_device(
     coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
     device = _make_lifx_ceiling(mac_addr="aa:bb")
     device.power_level = 65535
-    coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(device=device)
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
     fake_registry = SimpleNamespace(
         async_get=lambda device_id: SimpleNamespace(identifiers={(DOMAIN, "aa:bb")})
     )
@@ -216,6 +419,7 @@ async def test_async_set_state_updates_zone_colors_for_matching_device(
         colors=[expected_downlight] * 63 + [expected_uplight],
         duration=4,
         power_on=False,
+        force=False,
     )
 
 
@@ -227,7 +431,7 @@ async def test_async_set_state_defaults_transition_to_zero_when_omitted(
     hass = MagicMock()
     coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
     device = _make_lifx_ceiling(mac_addr="aa:bb")
-    coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(device=device)
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
     fake_registry = SimpleNamespace(
         async_get=lambda device_id: SimpleNamespace(identifiers={(DOMAIN, "aa:bb")})
     )
@@ -241,7 +445,354 @@ async def test_async_set_state_defaults_transition_to_zero_when_omitted(
         colors=[(0, 0, 65535, 3500)] * 63 + [(0, 0, 65535, 3500)],
         duration=0,
         power_on=True,
+        force=False,
+    )
+
+
+def _make_zoned_ceiling(power_level: int = 65535) -> LIFXCeiling:
+    """Create a 64-zone ceiling with cached zones for set_zones tests."""
+    device = _make_lifx_ceiling(mac_addr="aa:bb")
+    device.tile_device_width = 8
+    device.power_level = power_level
+    device.chain = {0: [(0, 0, 0, 3500)] * 63 + [(100, 200, 300, 4000)]}
+    return device
+
+
+@pytest.mark.asyncio
+async def test_async_set_zones_paints_gradient_and_keeps_uplight() -> None:
+    """A gradient should cover the downlight and leave the uplight color alone."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
+    coordinator._device_ceilings["device-1"] = device
+
+    await coordinator.async_set_zones(
+        SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: ["device-1"],
+                "stops": [
+                    {"hue": 0, "saturation": 100, "brightness": 100, "kelvin": 3500},
+                    {"hue": 240, "saturation": 100, "brightness": 100, "kelvin": 3500},
+                ],
+                "gradient": "linear",
+                ATTR_TRANSITION: 2,
+            }
+        )
+    )
+
+    kwargs = device.async_set64.await_args.kwargs
+    colors = kwargs["colors"]
+    assert colors[0] == (0, 65535, 65535, 3500)
+    assert colors[7] == (43690, 65535, 65535, 3500)
+    assert colors[56] == colors[0]
+    assert colors[63] == (100, 200, 300, 4000)
+    assert kwargs["duration"] == 2
+    assert kwargs["power_on"] is False
+
+
+@pytest.mark.asyncio
+async def test_async_set_zones_accepts_explicit_downlight_zones() -> None:
+    """Explicit downlight zones should be sent with the uplight dimmed when off."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling(power_level=0)
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
+    coordinator._device_ceilings["device-1"] = device
+
+    await coordinator.async_set_zones(
+        SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: ["device-1"],
+                "zones": [[180, 50, 100, 2700]] * 63,
+            }
+        )
+    )
+
+    kwargs = device.async_set64.await_args.kwargs
+    assert kwargs["colors"] == [(32768, 32768, 65535, 2700)] * 63 + [
+        (100, 200, 0, 4000)
+    ]
+    assert kwargs["duration"] == 0
+    assert kwargs["power_on"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_set_zones_leaves_ceilings_already_showing_the_zones_alone(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A no-op write should publish nothing and schedule no verification."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    device.async_set64 = AsyncMock(return_value=False)
+    core_coordinator = _make_core_coordinator(device)
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    coordinator._device_ceilings["device-1"] = device
+    call_later = MagicMock()
+    monkeypatch.setattr(coordinator_module, "async_call_later", call_later)
+
+    await coordinator.async_set_zones(
+        SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: ["device-1"],
+                "zones": [[0, 0, 0, 3500]] * 63,
+                "force": False,
+            }
+        )
+    )
+
+    assert device.async_set64.await_args.kwargs["force"] is False
+    core_coordinator.async_update_listeners.assert_not_called()
+    call_later.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_play_keyframes_stages_every_ceiling_before_playing() -> None:
+    """Keyframes are painted per ceiling and staged before playback starts."""
+    hass = MagicMock()
+    hass.async_create_background_task = lambda coro, name: asyncio.create_task(
+        coro, name=name
+    )
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    device.async_stage_frame = AsyncMock()
+    device.async_show_frame = AsyncMock()
+    core_coordinator = _make_core_coordinator(device)
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    coordinator._device_ceilings["device-1"] = device
+
+    await coordinator.async_play_keyframes(
+        SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: ["device-1"],
+                "keyframes": [
+                    {"zones": [[0, 0, 50, 2700]] * 63, ATTR_TRANSITION: 0},
+                    {"zones": [[30, 100, 100, 2700]] * 63, ATTR_TRANSITION: 600},
+                ],
+                "repeat": False,
+            }
+        )
+    )
+
+    frame, fb_index = device.async_stage_frame.await_args_list[0].args
+    assert fb_index == 1
+    assert frame[0] == (0, 0, 32768, 2700)
+    assert frame[63] == (100, 200, 300, 4000)
+    assert coordinator.effects.playing_keyframes(device)
+
+    await asyncio.sleep(0.01)
+    device.async_show_frame.assert_awaited_once_with(1, 0, power_on=False)
+    core_coordinator.async_update_listeners.assert_called()
+    await coordinator.async_shutdown()
+    assert not coordinator.effects.playing_keyframes(device)
+
+
+@pytest.mark.asyncio
+async def test_scenes_are_preloaded_and_activated_on_every_stored_ceiling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A stored scene is staged at once, activated without targets and re-staged."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    device.async_stage_packed = AsyncMock()
+    device.async_show_packed = AsyncMock()
+    core_coordinator = _make_core_coordinator(device)
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    coordinator._device_ceilings["device-1"] = device
+    scheduled: list[object] = []
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_call_later",
+        lambda _hass, _delay, action: scheduled.append(action) or MagicMock(),
+    )
+
+    await coordinator.async_store_scene(
+        SimpleNamespace(
+            data={"scene": "night", ATTR_DEVICE_ID: ["device-1"], "preload": True}
+        )
     )
+    scene = coordinator.scenes.get("night", device)
+    assert scene.colors == device.chain[0]
+    device.async_stage_packed.assert_awaited_once_with(scene.colors, scene.payloads)
+
+    await coordinator.async_activate_scene(
+        SimpleNamespace(data={"scene": "night", ATTR_TRANSITION: 3})
+    )
+    device.async_show_packed.assert_awaited_once_with(
+        scene.colors, scene.payloads, 3, power_on=False
+    )
+    core_coordinator.async_update_listeners.assert_called_once_with()
+
+    (verify,) = scheduled
+    await verify(None)
+    assert device.async_stage_packed.await_count == 2
+
+    with pytest.raises(HomeAssistantError, match="Unknown scene 'movie'"):
+        await coordinator.async_activate_scene(SimpleNamespace(data={"scene": "movie"}))
+
+
+@pytest.mark.asyncio
+async def test_synchronized_set_state_stages_everything_before_showing() -> None:
+    """With sync, every ceiling is staged before the first one is shown."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    calls: list[tuple[str, str]] = []
+    for index, mac_addr in enumerate(("aa:bb", "cc:dd")):
+        device = _make_zoned_ceiling(power_level=0)
+        device.mac_addr = mac_addr
+
+        async def _stage(_colors: object, *, mac_addr: str = mac_addr) -> None:
+            calls.append(("stage", mac_addr))
+
+        async def _show(
+            *_args: object,
+            device: LIFXCeiling = device,
+            offset: int = index,
+            **_kw: object,
+        ) -> None:
+            calls.append(("show", device.mac_addr))
+            device.show_timing = (10.0 + offset / 1000, 10.004 + offset / 1000)
+
+        device.async_stage_frame = _stage
+        device.async_show_frame = AsyncMock(side_effect=_show)
+        coordinator._ceiling_coordinators[mac_addr] = _make_core_coordinator(device)
+        coordinator._device_ceilings[f"device-{index}"] = device
+
+    report = await coordinator.async_set_state(
+        SimpleNamespace(
+            data={
+                ATTR_DEVICE_ID: ["device-0", "device-1"],
+                ATTR_TRANSITION: 2,
+                "sync": True,
+            }
+        )
+    )
+
+    assert [kind for kind, _ in calls] == ["stage", "stage", "show", "show"]
+    device.async_show_frame.assert_awaited_once_with(
+        1, 2, power_on=True, immediate=True
+    )
+    assert report is coordinator.last_sync
+    assert report["send_spread_ms"] == 1.0
+    assert report["start_spread_ms"] == 1.0
+    assert report["devices"]["device-1"] == {
+        "sent_ms": 1.0,
+        "ack_ms": 4.0,
+        "start_ms": 1.0,
+    }
+
+
+def test_sync_report_without_timings_is_empty() -> None:
+    """Ceilings that were never shown are left out of the report."""
+    device = _make_lifx_ceiling()
+    device.show_timing = None
+
+    assert coordinator_module._sync_report({"device-1": device}) == {
+        "send_spread_ms": None,
+        "start_spread_ms": None,
+        "devices": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_stopping_an_effect_can_restore_the_light() -> None:
+    """Stopping with restore should write back the zones from before the effect."""
+    hass = MagicMock()
+    hass.async_create_background_task = lambda coro, name: asyncio.create_task(
+        coro, name=name
+    )
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    device.stream_frame = MagicMock()
+    core_coordinator = _make_core_coordinator(device)
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+
+    coordinator.async_start_effect(device, "uplight", "breathe")
+    await asyncio.sleep(0.01)
+    assert coordinator.effects.effect(device, "uplight") == "breathe"
+    device.chain[0][63] = (100, 200, 0, 4000)
+
+    await coordinator.async_stop_effect(device, "uplight", restore=True)
+
+    assert coordinator.effects.runs == []
+    kwargs = device.async_set64.await_args.kwargs
+    assert kwargs["full_frame"] is True
+    assert kwargs["colors"][63] == (100, 200, 300, 4000)
+    core_coordinator.async_update_listeners.assert_called_once_with()
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_reports_failures_without_stalling_other_devices(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog,
+) -> None:
+    """A failing ceiling should not prevent the other targets from being updated."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    failing = _make_lifx_ceiling(mac_addr="aa:bb")
+    failing.async_set64 = AsyncMock(side_effect=TimeoutError("no ack"))
+    working = _make_lifx_ceiling(mac_addr="cc:dd")
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(failing)
+    coordinator._ceiling_coordinators["cc:dd"] = _make_core_coordinator(working)
+    identifiers = {"device-1": "aa:bb", "device-2": "cc:dd"}
+    fake_registry = SimpleNamespace(
+        async_get=lambda device_id: SimpleNamespace(
+            identifiers={(DOMAIN, identifiers[device_id])}
+        )
+    )
+    monkeypatch.setattr(coordinator_module.dr, "async_get", lambda hass: fake_registry)
+
+    with pytest.raises(HomeAssistantError, match="1 of 2 LIFX Ceiling devices"):
+        await coordinator.async_set_state(
+            SimpleNamespace(data={ATTR_DEVICE_ID: ["device-1", "device-2"]})
+        )
+
+    failing.async_set64.assert_awaited_once()
+    working.async_set64.assert_awaited_once()
+    assert "Failed to set state for device ID device-1: no ack" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_limits_concurrent_device_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Service handler should never write to more ceilings than the cap at once."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    coordinator.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+
+    async def _slow_set64(**_kwargs: object) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    for index in range(5):
+        device = _make_lifx_ceiling(mac_addr=f"mac-{index}")
+        device.async_set64 = AsyncMock(side_effect=_slow_set64)
+        coordinator._ceiling_coordinators[f"mac-{index}"] = _make_core_coordinator(
+            device
+        )
+    fake_registry = SimpleNamespace(
+        async_get=lambda device_id: SimpleNamespace(
+            identifiers={(DOMAIN, device_id.replace("device", "mac"))}
+        )
+    )
+    monkeypatch.setattr(coordinator_module.dr, "async_get", lambda hass: fake_registry)
+
+    await coordinator.async_set_state(
+        SimpleNamespace(data={ATTR_DEVICE_ID: [f"device-{i}" for i in range(5)]})
+    )
+
+    assert peak == 2
+    for core in coordinator._ceiling_coordinators.values():
+        core.device.async_set64.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -262,6 +813,48 @@ async def test_async_set_state_ignores_unknown_device_ids(
     assert "Device ID missing not found in the device registry" in caplog.text
 
 
+def test_resolve_device_caches_until_the_registry_entry_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Device IDs should be resolved once and forgotten on registry updates."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_lifx_ceiling(mac_addr="aa:bb")
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator(device)
+    lookups: list[str] = []
+
+    def _lookup(device_id: str) -> SimpleNamespace:
+        lookups.append(device_id)
+        return SimpleNamespace(identifiers={(DOMAIN, "aa:bb")})
+
+    fake_registry = SimpleNamespace(async_get=_lookup)
+    monkeypatch.setattr(coordinator_module.dr, "async_get", lambda hass: fake_registry)
+
+    assert coordinator._async_resolve_device("device-1") is device
+    assert coordinator._async_resolve_device("device-1") is device
+    assert lookups == ["device-1"]
+
+    coordinator.async_track_device_registry()
+    event_type, listener = hass.bus.async_listen.call_args.args
+    event_filter = hass.bus.async_listen.call_args.kwargs["event_filter"]
+    assert event_type == coordinator_module.dr.EVENT_DEVICE_REGISTRY_UPDATED
+    assert not event_filter({"action": "update", "device_id": "device-2"})
+    assert not event_filter({"action": "create", "device_id": "device-2"})
+    assert event_filter({"action": "update", "device_id": "device-1"})
+    listener(SimpleNamespace(data={"action": "update", "device_id": "device-1"}))
+
+    assert coordinator._async_resolve_device("device-1") is device
+    assert lookups == ["device-1", "device-1"]
+
+    coordinator._entry_macs["core-1"] = "aa:bb"
+    monkeypatch.setattr(
+        coordinator_module, "async_dispatcher_send", lambda hass, signal: None
+    )
+    coordinator._async_remove_lifx_entry("core-1")
+
+    assert coordinator._device_ceilings == {}
+
+
 @pytest.mark.asyncio
 async def test_async_set_state_warns_when_called_without_device_id(caplog) -> None:
     """Service handler should ignore calls missing device ids."""
@@ -298,15 +891,23 @@ async def test_async_set_state_warns_for_invalid_matched_coordinator(
 
 
 @pytest.mark.asyncio
-async def test_turn_helpers_refresh_after_device_calls() -> None:
-    """Zone turn helper methods should request refresh after device updates."""
+async def test_turn_helpers_publish_state_and_defer_verification(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Zone helpers should notify listeners at once and debounce the re-read."""
     hass = MagicMock()
     coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
     device = _make_lifx_ceiling(mac_addr="aa:bb")
-    refresh = AsyncMock()
-    coordinator._ceiling_coordinators["aa:bb"] = SimpleNamespace(
-        async_request_refresh=refresh
-    )
+    core_coordinator = _make_core_coordinator()
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    scheduled: list[tuple[float, object, MagicMock]] = []
+
+    def _fake_call_later(hass: object, delay: float, action: object) -> MagicMock:
+        cancel = MagicMock()
+        scheduled.append((delay, action, cancel))
+        return cancel
+
+    monkeypatch.setattr(coordinator_module, "async_call_later", _fake_call_later)
 
     await coordinator.turn_uplight_on(device, (1, 2, 3, 4), 5)
     await coordinator.turn_uplight_off(device, 6)
@@ -317,4 +918,158 @@ async def test_turn_helpers_refresh_after_device_calls() -> None:
     device.turn_uplight_off.assert_awaited_once_with(6)
     device.turn_downlight_on.assert_awaited_once_with((7, 8, 9, 10), 11)
     device.turn_downlight_off.assert_awaited_once_with(12)
-    assert refresh.await_args_list == [call(), call(), call(), call()]
+    assert core_coordinator.async_update_listeners.call_count == 4
+    core_coordinator.async_refresh.assert_not_awaited()
+
+    assert [delay for delay, _, _ in scheduled] == [
+        coordinator_module.STATE_VERIFY_DELAY + duration for duration in (5, 6, 11, 12)
+    ]
+    assert [cancel.call_count for _, _, cancel in scheduled] == [1, 1, 1, 0]
+
+    _, verify, _ = scheduled[-1]
+    await verify(None)
+    core_coordinator.async_refresh.assert_awaited_once_with()
+    assert coordinator._cancel_verify == {}
+
+
+@pytest.mark.asyncio
+async def test_verification_forgets_staged_frames_the_ceiling_does_not_show(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A re-read showing another frame should force the scene to be re-uploaded."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_zoned_ceiling()
+    core_coordinator = _make_core_coordinator(device)
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    scene = [(0, 0, 65535, 3500)] * 64
+    device.chain[0] = list(scene)
+    device.staged_frames[1] = scene
+    scheduled: list[object] = []
+    preloaded: list[dict[int, object]] = []
+
+    async def _preload(device: LIFXCeiling) -> None:
+        preloaded.append(dict(device.staged_frames))
+
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_call_later",
+        lambda hass, delay, action: scheduled.append(action),
+    )
+    monkeypatch.setattr(coordinator, "_async_preload_scene", _preload)
+
+    coordinator._async_state_written(device, 0)
+    await scheduled[-1](None)
+    assert preloaded == [{1: scene}]
+
+    # The ceiling was power cycled; the next poll reads a blank frame. Like
+    # the core debouncer, async_request_refresh only schedules that poll.
+    polls: list[asyncio.Task[None]] = []
+
+    async def _poll() -> None:
+        device.chain[0] = [(0, 0, 0, 3500)] * 64
+
+    async def _request_refresh() -> None:
+        polls.append(asyncio.get_running_loop().create_task(_poll()))
+
+    core_coordinator.async_request_refresh = AsyncMock(side_effect=_request_refresh)
+    core_coordinator.async_refresh = AsyncMock(side_effect=_poll)
+    coordinator._async_state_written(device, 0)
+    await scheduled[-1](None)
+    await asyncio.gather(*polls)
+    assert preloaded[-1] == {}
+
+
+@pytest.mark.asyncio
+async def test_turn_helpers_coalesce_bursts_to_the_latest_command() -> None:
+    """Commands queued behind an in-flight write should collapse to the newest."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_lifx_ceiling(mac_addr="aa:bb")
+    core_coordinator = _make_core_coordinator()
+    coordinator._ceiling_coordinators["aa:bb"] = core_coordinator
+    release = asyncio.Event()
+    sent: list[tuple[int, int, int, int]] = []
+
+    async def _turn_downlight_on(color: tuple[int, int, int, int], _duration: int):
+        sent.append(color)
+        if len(sent) == 1:
+            await release.wait()
+
+    device.turn_downlight_on = AsyncMock(side_effect=_turn_downlight_on)
+
+    first = asyncio.create_task(coordinator.turn_downlight_on(device, (1, 1, 1, 1)))
+    await asyncio.sleep(0)
+    burst = [
+        asyncio.create_task(coordinator.turn_downlight_on(device, (n, n, n, n)))
+        for n in range(2, 6)
+    ]
+    uplight = asyncio.create_task(coordinator.turn_uplight_off(device, 0))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *burst, uplight)
+
+    assert sent == [(1, 1, 1, 1), (5, 5, 5, 5)]
+    device.turn_uplight_off.assert_awaited_once_with(0)
+    assert core_coordinator.async_update_listeners.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_turn_helpers_propagate_errors_to_coalesced_callers() -> None:
+    """Every caller folded into a failing write should see the failure."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_lifx_ceiling(mac_addr="aa:bb")
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator()
+    release = asyncio.Event()
+
+    async def _turn_uplight_on(color: tuple[int, int, int, int], _duration: int):
+        if color == (1, 1, 1, 1):
+            await release.wait()
+            return
+        msg = "no ack"
+        raise TimeoutError(msg)
+
+    device.turn_uplight_on = AsyncMock(side_effect=_turn_uplight_on)
+
+    first = asyncio.create_task(coordinator.turn_uplight_on(device, (1, 1, 1, 1)))
+    await asyncio.sleep(0)
+    stale = asyncio.create_task(coordinator.turn_uplight_on(device, (2, 2, 2, 2)))
+    latest = asyncio.create_task(coordinator.turn_uplight_on(device, (3, 3, 3, 3)))
+    await asyncio.sleep(0)
+    release.set()
+
+    await first
+    with pytest.raises(TimeoutError, match="no ack"):
+        await stale
+    with pytest.raises(TimeoutError, match="no ack"):
+        await latest
+    assert device.turn_uplight_on.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_turn_helpers_supersede_the_write_in_flight() -> None:
+    """A newer command for the same light should stop the in-flight write."""
+    hass = MagicMock()
+    coordinator = LIFXCeilingUpdateCoordinator(hass, _make_config_entry())
+    device = _make_lifx_ceiling(mac_addr="aa:bb")
+    coordinator._ceiling_coordinators["aa:bb"] = _make_core_coordinator()
+    sent: list[tuple[int, int, int, int]] = []
+
+    async def _turn_downlight_on(color: tuple[int, int, int, int], _duration: int):
+        sent.append(color)
+        if len(sent) == 1:
+            # Never acknowledged, so only superseding it ends the write early.
+            await async_execute_lifx(
+                Mock(), attempts=5, overall_timeout=5, generations=device.generations
+            )
+
+    device.turn_downlight_on = AsyncMock(side_effect=_turn_downlight_on)
+
+    first = asyncio.create_task(coordinator.turn_downlight_on(device, (1, 1, 1, 1)))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.turn_downlight_on(device, (2, 2, 2, 2)))
+    await asyncio.wait_for(asyncio.gather(first, second), 0.1)
+
+    assert sent == [(1, 1, 1, 1), (2, 2, 2, 2)]
+    assert device.generations.current == 1
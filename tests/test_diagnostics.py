@@ -0,0 +1,75 @@
+"""Tests for LIFX Ceiling diagnostics."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+
+from custom_components.lifx_ceiling.api import LIFXCeiling
+from custom_components.lifx_ceiling.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.lifx_ceiling.metrics import LIFXCeilingCommandTrace
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics() -> None:
+    """Diagnostics should redact identity and compact the zone dump."""
+    ceiling = LIFXCeiling(
+        asyncio.get_running_loop(), "d0:73:d5:00:00:01", "192.168.1.10"
+    )
+    ceiling.label = "Kitchen"
+    ceiling.product = 201
+    ceiling.tile_device_width = 16
+    ceiling.power_level = 65535
+    ceiling.chain[0] = [(0, 0, 0, 3500)] * 127 + [(100, 200, 300, 4000)]
+    ceiling.rtt.add_sample(0.02)
+    ceiling.metrics.record_command()
+    ceiling.metrics.record_send("set64", retry=False)
+    ceiling.metrics.record_ack(0.02)
+    ceiling.metrics.record_trace(
+        LIFXCeilingCommandTrace(0.0, ("set64",), 0.0205, 0, timed_out=False)
+    )
+    coordinator = SimpleNamespace(
+        devices=[ceiling],
+        discovery_runs=3,
+        last_discovery=datetime(2025, 1, 1, tzinfo=UTC),
+        last_discovery_duration=0.0042,
+        last_sync={"send_spread_ms": 0.2, "start_spread_ms": 1.1, "devices": {}},
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(
+        None, SimpleNamespace(runtime_data=coordinator)
+    )
+
+    assert diagnostics["discovery"] == {
+        "runs": 3,
+        "last_run": "2025-01-01T00:00:00+00:00",
+        "last_duration_ms": 4.2,
+    }
+    assert diagnostics["last_sync"]["start_spread_ms"] == 1.1
+    (data,) = diagnostics["ceilings"]
+    assert data["mac"] == data["ip_address"] == data["label"] == REDACTED
+    assert data["geometry"] == {
+        "total_zones": 128,
+        "uplight_zone": 127,
+        "tile_width": 16,
+    }
+    assert data["zones"] == [[127, [0, 0, 0, 3500]], [1, [100, 200, 300, 4000]]]
+    assert data["network"]["commands"] == 1
+    assert data["network"]["ack_latency_ms"]["p50"] == 20.0
+    assert data["network"]["smoothed_rtt_ms"] == 20.0
+    assert data["network"]["paced_packets"] == 0
+    assert data["recent_commands"] == [
+        {
+            "started": "1970-01-01T00:00:00+00:00",
+            "methods": ["set64"],
+            "duration_ms": 20.5,
+            "retries": 0,
+            "timed_out": False,
+        }
+    ]
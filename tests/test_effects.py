@@ -0,0 +1,263 @@
+"""Tests for the host-rendered LIFX Ceiling effects."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.lifx_ceiling import effects
+from custom_components.lifx_ceiling.effects import (
+    LIFXCeilingBreatheEffect,
+    LIFXCeilingEffectEngine,
+    LIFXCeilingFlameEffect,
+    LIFXCeilingKeyframePlayback,
+    effect_names,
+)
+from custom_components.lifx_ceiling.zones import LIFXCeilingZoneBuffer
+
+DOWNLIGHT = (1000, 0, 40000, 3500)
+UPLIGHT = (20000, 65535, 30000, 4000)
+
+
+class FakeCeiling:
+    """Test double exposing what the effects engine uses of a ceiling."""
+
+    def __init__(self, mac_addr: str = "aa:bb:cc:dd:ee:ff") -> None:
+        """Create a 128-zone ceiling with its downlight and uplight on."""
+        self.mac_addr = mac_addr
+        self.label = mac_addr
+        self.uplight_zone = 127
+        self.tile_device_width = 16
+        self.chain = {0: [DOWNLIGHT] * 127 + [UPLIGHT]}
+        self.stream_frame = Mock(side_effect=self._store)
+        self.async_set64 = AsyncMock(side_effect=self._async_store)
+        self.power_level = 65535
+        self.async_stage_frame = AsyncMock()
+        self.async_show_frame = AsyncMock()
+        self.forget_staged_frames = Mock()
+
+    def zone_buffer(self) -> LIFXCeilingZoneBuffer:
+        """Return a copy of the cached zones."""
+        return LIFXCeilingZoneBuffer.from_colors(self.chain[0])
+
+    def _store(self, colors: LIFXCeilingZoneBuffer, *_args: Any) -> None:
+        self.chain[0] = colors.colors()
+
+    async def _async_store(self, colors: LIFXCeilingZoneBuffer, **_kwargs: Any) -> None:
+        self.chain[0] = colors.colors()
+
+
+def _engine() -> LIFXCeilingEffectEngine:
+    """Return an engine whose background tasks are plain asyncio tasks."""
+    hass = SimpleNamespace(
+        async_create_background_task=lambda coro, name: asyncio.create_task(
+            coro, name=name
+        )
+    )
+    return LIFXCeilingEffectEngine(hass)  # type: ignore[arg-type]
+
+
+def test_effects_are_offered_to_their_own_light() -> None:
+    """Downlight and uplight effects should be listed separately."""
+    assert effect_names("downlight") == ["flame", "aurora"]
+    assert effect_names("uplight") == ["breathe"]
+
+
+def test_effects_only_draw_their_own_zones() -> None:
+    """A downlight effect must leave the uplight alone, and the other way round."""
+    device = FakeCeiling()
+    base = device.zone_buffer()
+
+    frame = base.copy()
+    LIFXCeilingFlameEffect(device, base, 0.0).render(frame, 1.5)  # type: ignore[arg-type]
+    assert frame[127] == UPLIGHT
+    assert frame[0] != DOWNLIGHT
+    assert max(color[2] for color in frame[:127]) <= DOWNLIGHT[2]
+
+    frame = base.copy()
+    LIFXCeilingBreatheEffect(device, base, 0.0).render(frame, 1.0)  # type: ignore[arg-type]
+    assert frame[:127] == [DOWNLIGHT] * 127
+    hue, saturation, brightness, kelvin = frame[127]
+    assert (hue, saturation, kelvin) == (UPLIGHT[0], UPLIGHT[1], UPLIGHT[3])
+    assert 0 < brightness < UPLIGHT[2]
+
+
+def test_effect_frames_depend_only_on_elapsed_time() -> None:
+    """Rendering the same moment twice should give the same frame."""
+    device = FakeCeiling()
+    effect = LIFXCeilingFlameEffect(device, device.zone_buffer(), 0.0)  # type: ignore[arg-type]
+    first, second = device.zone_buffer(), device.zone_buffer()
+
+    effect.render(first, 2.25)
+    effect.render(second, 2.25)
+
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_engine_streams_frames_between_acknowledged_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The first frame is acknowledged and the ones after it are streamed."""
+    monkeypatch.setattr(LIFXCeilingBreatheEffect, "fps", 50)
+    engine = _engine()
+    device = FakeCeiling()
+
+    engine.async_start(device, "uplight", "breathe")  # type: ignore[arg-type]
+    await asyncio.sleep(0.2)
+
+    device.async_set64.assert_awaited_once()
+    assert device.async_set64.await_args.kwargs["full_frame"] is True
+    assert device.stream_frame.call_count >= 3
+    assert engine.effect(device, "uplight") == "breathe"  # type: ignore[arg-type]
+
+    effect = engine.async_stop(device, "uplight")  # type: ignore[arg-type]
+    assert effect is not None
+    frame = device.zone_buffer()
+    effect.restore(frame)
+    assert frame[127] == UPLIGHT
+    await asyncio.sleep(0.05)
+    assert engine._task is None
+
+
+@pytest.mark.asyncio
+async def test_engine_drops_frames_while_the_ceiling_is_behind(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No frames are sent while an acknowledged frame is still outstanding."""
+    monkeypatch.setattr(LIFXCeilingBreatheEffect, "fps", 50)
+    engine = _engine()
+    device = FakeCeiling()
+    acked = asyncio.Event()
+
+    async def _async_wait_for_ack(**_kwargs: Any) -> None:
+        await acked.wait()
+
+    device.async_set64.side_effect = _async_wait_for_ack
+
+    engine.async_start(device, "uplight", "breathe")  # type: ignore[arg-type]
+    await asyncio.sleep(0.15)
+
+    (run,) = engine.runs
+    device.stream_frame.assert_not_called()
+    assert run.dropped >= 3
+
+    acked.set()
+    await asyncio.sleep(0.1)
+    assert device.stream_frame.call_count >= 1
+    engine.async_stop_all()
+
+
+@pytest.mark.asyncio
+async def test_engine_animates_many_ceilings_from_one_task(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every ceiling should get frames from the same scheduler task."""
+    monkeypatch.setattr(LIFXCeilingFlameEffect, "fps", 40)
+    engine = _engine()
+    devices = [FakeCeiling(f"aa:bb:cc:dd:ee:{index:02x}") for index in range(20)]
+
+    for device in devices:
+        engine.async_start(device, "downlight", "flame")  # type: ignore[arg-type]
+    task = engine._task
+    await asyncio.sleep(0.2)
+
+    assert engine._task is task
+    assert all(device.stream_frame.call_count >= 2 for device in devices)
+    engine.async_stop_all()
+    await asyncio.sleep(0)
+    assert task is not None
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_engine_rejects_effects_for_the_wrong_light() -> None:
+    """Unknown effects, or effects for the other light, should be refused."""
+    engine = _engine()
+    device = FakeCeiling()
+
+    with pytest.raises(HomeAssistantError, match="Unknown uplight effect 'flame'"):
+        engine.async_start(device, "uplight", "flame")  # type: ignore[arg-type]
+    with pytest.raises(HomeAssistantError, match="Unknown downlight effect 'disco'"):
+        engine.async_start(device, "downlight", "disco")  # type: ignore[arg-type]
+    assert engine.runs == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_keyframes_stay_in_their_framebuffers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With a framebuffer per keyframe, every keyframe always goes back to its own."""
+    monkeypatch.setattr(effects, "KEYFRAME_MIN_HOLD", 0.01)
+    device = FakeCeiling()
+    first, second = device.zone_buffer(), device.zone_buffer()
+    second[0] = UPLIGHT
+    shown: list[int] = []
+    playback = LIFXCeilingKeyframePlayback(
+        device,  # type: ignore[arg-type]
+        [(first, 0), (second, 0)],
+        repeat=True,
+        framebuffers=3,
+        on_keyframe=lambda _device, duration: shown.append(duration),
+    )
+
+    await playback.async_stage()
+    task = asyncio.create_task(playback.async_play())
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    assert playback.shown >= 4
+    assert len(shown) == playback.shown
+    staged = [call.args for call in device.async_stage_frame.await_args_list]
+    assert {(id(frame), fb_index) for frame, fb_index in staged} == {
+        (id(first), 1),
+        (id(second), 2),
+    }
+    shown_from = [call.args[0] for call in device.async_show_frame.await_args_list]
+    assert shown_from[:4] == [1, 2, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_each_playback_uploads_its_keyframes_again() -> None:
+    """Frames staged before a playback starts should not be trusted by it."""
+    engine = _engine()
+    device = FakeCeiling()
+    forgotten: list[int] = []
+    device.async_stage_frame.side_effect = lambda *_args: forgotten.append(
+        device.forget_staged_frames.call_count
+    )
+
+    for _ in range(2):
+        await engine.async_play_keyframes(
+            device,  # type: ignore[arg-type]
+            [(device.zone_buffer(), 10)],
+            repeat=True,
+        )
+    engine.async_stop_all()
+
+    assert forgotten == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_keyframes_and_effects_replace_each_other() -> None:
+    """Starting keyframes stops effects on the ceiling, and the other way round."""
+    engine = _engine()
+    device = FakeCeiling()
+
+    engine.async_start(device, "uplight", "breathe")  # type: ignore[arg-type]
+    await engine.async_play_keyframes(
+        device,  # type: ignore[arg-type]
+        [(device.zone_buffer(), 10)],
+        repeat=True,
+    )
+    assert engine.runs == []
+    assert engine.playing_keyframes(device)  # type: ignore[arg-type]
+
+    engine.async_start(device, "uplight", "breathe")  # type: ignore[arg-type]
+    assert not engine.playing_keyframes(device)  # type: ignore[arg-type]
+    engine.async_stop_all()
@@ -0,0 +1,309 @@
+"""End-to-end tests of the LIFX Ceiling write path against the UDP emulator."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.emulator import (
+    BLACK,
+    TILE_COPY_FRAME_BUFFER,
+    TILE_SET64,
+    LIFXCeilingEmulator,
+)
+from custom_components.lifx_ceiling import effects
+from custom_components.lifx_ceiling.const import DEFAULT_ATTEMPTS, OVERALL_TIMEOUT
+from custom_components.lifx_ceiling.zones import LIFXCeilingZoneBuffer
+
+if TYPE_CHECKING:
+    from custom_components.lifx_ceiling.api import LIFXCeiling
+
+
+async def _connect(emulator: LIFXCeilingEmulator) -> LIFXCeiling:
+    """Start the emulator and return a ceiling connected to it."""
+    await emulator.async_start()
+    ceiling = await emulator.async_connect()
+    # Keep aiolifx's own per-packet resend short so lossy tests stay fast.
+    ceiling.timeout = 0.05
+    return ceiling
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("product", "zones"), [(176, 64), (177, 64), (201, 128)])
+async def test_connect_reads_every_zone(product: int, zones: int) -> None:
+    """Connecting should populate the chain from get64 responses."""
+    emulator = LIFXCeilingEmulator(product)
+    emulator.framebuffers[0] = [(index, 0, 1000, 3500) for index in range(zones)]
+    ceiling = await _connect(emulator)
+    try:
+        assert ceiling.chain[0] == emulator.zones
+        assert ceiling.total_zones == zones
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("product", "copies"), [(176, 0), (202, 1)])
+async def test_full_frame_is_applied(product: int, copies: int) -> None:
+    """A full frame should land in the visible framebuffer and power the ceiling."""
+    emulator = LIFXCeilingEmulator(product)
+    ceiling = await _connect(emulator)
+    colors = [(index * 300, 65535, 20000, 3500) for index in range(ceiling.total_zones)]
+    try:
+        await ceiling.async_set64(colors, power_on=True)
+
+        assert emulator.zones == colors
+        assert emulator.power_level == 65535
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == copies
+        assert ceiling.chain[0] == colors
+        assert ceiling.power_level == 65535
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_single_zone_change_writes_visible_framebuffer() -> None:
+    """Changing only the uplight should send one set64 straight to fb 0."""
+    emulator = LIFXCeilingEmulator(201)
+    emulator.power_level = 65535
+    ceiling = await _connect(emulator)
+    colors = [BLACK] * 127 + [(1000, 2000, 3000, 4000)]
+    try:
+        await ceiling.turn_uplight_on((1000, 2000, 3000, 4000))
+
+        assert emulator.zones == colors
+        assert emulator.received[TILE_SET64] == 1
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == 0
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_reasserting_the_current_state_sends_nothing() -> None:
+    """Repeating a write the ceiling acked should cost no packets unless forced."""
+    emulator = LIFXCeilingEmulator(201)
+    emulator.power_level = 65535
+    ceiling = await _connect(emulator)
+    color = (1000, 2000, 3000, 4000)
+    try:
+        await ceiling.turn_uplight_on(color)
+        await ceiling.turn_uplight_on(color)
+        await ceiling.turn_downlight_off()
+
+        assert emulator.received[TILE_SET64] == 1
+        assert ceiling.metrics.skipped == 2
+
+        await ceiling.turn_uplight_on(color, force=True)
+        assert emulator.received[TILE_SET64] == 3
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_lossy_link_still_converges() -> None:
+    """Dropped requests should be resent until the frame is applied."""
+    emulator = LIFXCeilingEmulator(201, loss=0.3, seed=7)
+    ceiling = await _connect(emulator)
+    colors = [(index, 65535, 30000, 3500) for index in range(128)]
+    try:
+        await ceiling.async_set64(colors)
+
+        assert emulator.dropped > 0
+        assert emulator.zones == colors
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_paced_frames_are_not_resent() -> None:
+    """Packets held back by the rate limiter are waited for, not retried."""
+    emulator = LIFXCeilingEmulator(201)
+    ceiling = await _connect(emulator)
+    ceiling.limiter.rate = 100
+    ceiling.limiter.burst = 2
+    frames = [[(hue, 65535, 30000, 3500)] * 128 for hue in (0, 20000, 40000)]
+    try:
+        start = time.perf_counter()
+        for frame in frames:
+            await ceiling.async_set64(frame)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.06
+        assert ceiling.limiter.delayed > 0
+        assert ceiling.metrics.retries == 0
+        assert emulator.received[TILE_SET64] == 6
+        assert emulator.zones == frames[2]
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_latency_delays_acknowledgements() -> None:
+    """Configured latency should apply to every round trip."""
+    emulator = LIFXCeilingEmulator(176, latency=0.02, jitter=0.005, seed=1)
+    ceiling = await _connect(emulator)
+    try:
+        start = time.perf_counter()
+        await ceiling.turn_downlight_off(force=True)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.015
+        assert max(color[2] for color in emulator.zones[:63]) == 0
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("product", "set64s", "copies"), [(176, 1, 0), (201, 2, 1)])
+async def test_streamed_frame_is_applied_without_acks(
+    product: int, set64s: int, copies: int
+) -> None:
+    """A streamed frame should land once, and an unchanged one not be sent."""
+    emulator = LIFXCeilingEmulator(product)
+    ceiling = await _connect(emulator)
+    colors = [(index * 300, 65535, 20000, 3500) for index in range(ceiling.total_zones)]
+    try:
+        ceiling.stream_frame(colors, 0.2)
+        ceiling.stream_frame(colors, 0.2)
+        await asyncio.sleep(0.05)
+
+        assert emulator.zones == colors
+        assert emulator.received[TILE_SET64] == set64s
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == copies
+        assert ceiling.message == {}
+        assert ceiling.chain[0] == colors
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_keyframes_are_shown_with_framebuffer_copies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each keyframe is uploaded off-screen ahead of its copy to the visible one."""
+    monkeypatch.setattr(effects, "KEYFRAME_MIN_HOLD", 0.01)
+    emulator = LIFXCeilingEmulator(201)
+    ceiling = await _connect(emulator)
+    keyframes = [
+        LIFXCeilingZoneBuffer.from_colors(
+            [(step * 1000 + index, 65535, 20000, 3500) for index in range(128)]
+        )
+        for step in range(3)
+    ]
+    try:
+        playback = effects.LIFXCeilingKeyframePlayback(
+            ceiling, [(frame, 0) for frame in keyframes]
+        )
+        await playback.async_stage()
+        assert emulator.framebuffers[1] == keyframes[0].colors()
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == 0
+
+        await playback.async_play()
+
+        assert playback.shown == 3
+        assert emulator.zones == keyframes[2].colors()
+        assert emulator.power_level == 65535
+        assert emulator.received[TILE_SET64] == 6
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == 3
+        assert ceiling.chain[0] == keyframes[2].colors()
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_preloaded_scene_is_shown_with_a_single_copy() -> None:
+    """A packed frame staged ahead of time is shown by one copy_frame_buffer."""
+    emulator = LIFXCeilingEmulator(201)
+    ceiling = await _connect(emulator)
+    colors = [(index * 500, 65535, 20000, 3500) for index in range(128)]
+    payloads = ceiling.pack_frame(colors)
+    try:
+        await ceiling.async_stage_packed(colors, payloads)
+        assert emulator.framebuffers[1] == colors
+        assert emulator.received[TILE_SET64] == 2
+
+        await ceiling.async_show_packed(colors, payloads, power_on=True)
+
+        assert emulator.zones == colors
+        assert emulator.power_level == 65535
+        assert emulator.received[TILE_SET64] == 2
+        assert emulator.received[TILE_COPY_FRAME_BUFFER] == 1
+    finally:
+        ceiling.cleanup()
+        emulator.close()
+
+
+@pytest.mark.asyncio
+async def test_staged_frames_start_together_on_several_ceilings() -> None:
+    """Immediate copies go out back to back and record their send and ack times."""
+    emulators = [LIFXCeilingEmulator(201) for _ in range(3)]
+    ceilings = [await _connect(emulator) for emulator in emulators]
+    colors = [(index * 500, 65535, 20000, 3500) for index in range(128)]
+    try:
+        for ceiling in ceilings:
+            await ceiling.async_stage_frame(colors)
+
+        await asyncio.gather(
+            *(
+                ceiling.async_show_frame(1, 0, power_on=True, immediate=True)
+                for ceiling in ceilings
+            )
+        )
+
+        sent = [ceiling.show_timing[0] for ceiling in ceilings]
+        assert max(sent) - min(sent) < 0.01
+        for ceiling, emulator in zip(ceilings, emulators, strict=True):
+            assert emulator.zones == colors
+            assert emulator.power_level == 65535
+            assert emulator.received[TILE_COPY_FRAME_BUFFER] == 1
+            assert ceiling.show_timing[1] >= ceiling.show_timing[0]
+            assert ceiling.chain[0] == colors
+    finally:
+        for ceiling, emulator in zip(ceilings, emulators, strict=True):
+            ceiling.cleanup()
+            emulator.close()
+
+
+def test_unknown_product_is_rejected() -> None:
+    """Only ceiling products can be emulated."""
+    with pytest.raises(ValueError, match="not a LIFX Ceiling"):
+        LIFXCeilingEmulator(1)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeouts_retry_quickly_on_a_healthy_link() -> None:
+    """Once the RTT is learned, a lost packet should be resent well inside 1 s."""
+    emulator = LIFXCeilingEmulator(201, latency=0.002, seed=3)
+    await emulator.async_start()
+    ceiling = await emulator.async_connect()
+    frames = [[(hue, 65535, 30000, 3500)] * 128 for hue in range(0, 60000, 6000)]
+    try:
+        for frame in frames[:5]:
+            await ceiling.async_set64(frame)
+        assert ceiling.rtt.samples > 0
+
+        emulator.loss = 0.3
+        start = time.perf_counter()
+        for frame in frames[5:]:
+            await ceiling.async_set64(frame)
+        elapsed = time.perf_counter() - start
+
+        assert emulator.dropped > 0
+        assert emulator.zones == frames[-1]
+        # A single retry on the fixed split would already take this long.
+        assert elapsed < OVERALL_TIMEOUT / DEFAULT_ATTEMPTS
+    finally:
+        ceiling.cleanup()
+        emulator.close()
@@ -0,0 +1,99 @@
+"""Tests for gradient rendering across the zone layout."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.lifx_ceiling.gradient import (
+    gradient_positions,
+    gradient_stops,
+    render_gradient,
+)
+
+RED = (0, 65535, 65535, 3500)
+BLUE = (43690, 65535, 65535, 3500)
+
+
+def test_linear_positions_run_across_the_layout() -> None:
+    """A 0° linear gradient should run from the left column to the right one."""
+    positions = gradient_positions("linear", 8, 64)
+
+    assert positions[0] == positions[56] == 0.0
+    assert positions[7] == positions[63] == 1.0
+    assert positions[1] == pytest.approx(1 / 7)
+
+    vertical = gradient_positions("linear", 16, 128, 90)
+    assert vertical[0] == pytest.approx(0.0)
+    assert vertical[15] == pytest.approx(0.0)
+    assert vertical[127] == pytest.approx(1.0)
+
+
+def test_radial_positions_grow_from_the_centre() -> None:
+    """Radial positions should be smallest in the middle and 1 in the corners."""
+    positions = gradient_positions("radial", 8, 64)
+
+    assert positions[27] == positions[36] == min(positions)
+    assert positions[0] == positions[63] == 1.0
+
+
+def test_angular_positions_sweep_clockwise() -> None:
+    """Angular positions should sweep clockwise from the start angle."""
+    positions = gradient_positions("angular", 8, 64)
+
+    assert positions[39] == pytest.approx(0.0, abs=0.1)  # right of centre
+    assert positions[59] == pytest.approx(0.25, abs=0.1)  # below centre
+    assert positions[32] == pytest.approx(0.5, abs=0.1)  # left of centre
+    assert positions[4] == pytest.approx(0.75, abs=0.1)  # above centre
+
+
+def test_unknown_gradient_is_rejected() -> None:
+    """Only the known gradient shapes can be rendered."""
+    with pytest.raises(ValueError, match="Unknown gradient"):
+        gradient_positions("spiral", 8, 64)
+
+
+def test_render_gradient_interpolates_every_channel() -> None:
+    """Zones between stops should be interpolated and clamped outside them."""
+    stops = [(0.25, (0, 0, 0, 2500)), (0.75, (0, 65535, 65535, 6500))]
+
+    frame = render_gradient(stops, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+    assert frame == [
+        (0, 0, 0, 2500),
+        (0, 0, 0, 2500),
+        (0, 32768, 32768, 4500),
+        (0, 65535, 65535, 6500),
+        (0, 65535, 65535, 6500),
+    ]
+
+
+def test_render_gradient_wraps_hue_the_short_way() -> None:
+    """Hue should cross 0° rather than sweep through the rest of the wheel."""
+    stops = [(0.0, (63715, 65535, 65535, 3500)), (1.0, (1820, 65535, 65535, 3500))]
+
+    hues = [color[0] for color in render_gradient(stops, [0.0, 0.5, 1.0])]
+
+    assert hues == [63715, 0, 1820]
+
+
+def test_gradient_stops_convert_and_space_evenly() -> None:
+    """Stops without positions should be spaced evenly and sorted."""
+    stops = gradient_stops(
+        [
+            {"hue": 0, "saturation": 100, "brightness": 100, "kelvin": 3500},
+            {"hue": 240, "saturation": 100, "brightness": 100, "kelvin": 3500},
+            {
+                "position": 10,
+                "hue": 120,
+                "saturation": 0,
+                "brightness": 50,
+                "kelvin": 2700,
+            },
+        ]
+    )
+
+    assert stops == [
+        (0.0, RED),
+        (0.1, (21845, 0, 32768, 2700)),
+        (0.5, BLUE),
+    ]
@@ -6,12 +6,20 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import voluptuous as vol
+from homeassistant.core import SupportsResponse
 
 import custom_components.lifx_ceiling as integration
 from custom_components.lifx_ceiling.const import (
     DISCOVERY_INTERVAL,
     DOMAIN,
     NAME,
+    SERVICE_LIFX_CEILING_ACTIVATE_SCENE,
+    SERVICE_LIFX_CEILING_PLAY_KEYFRAMES,
+    SERVICE_LIFX_CEILING_REMOVE_SCENE,
+    SERVICE_LIFX_CEILING_SET_STATE,
+    SERVICE_LIFX_CEILING_SET_ZONES,
+    SERVICE_LIFX_CEILING_STORE_SCENE,
 )
 
 
@@ -74,7 +82,17 @@ async def test_async_setup_entry_registers_services_and_periodic_updates(
             self.config_entry = config_entry
             self.stop_discovery = None
             self.async_update = AsyncMock()
-            self.async_set_state = AsyncMock()
+            self.async_set_state = AsyncMock(return_value=None)
+            self.async_set_zones = AsyncMock(return_value={"start_spread_ms": 1.5})
+            self.async_play_keyframes = AsyncMock()
+            self.async_store_scene = AsyncMock()
+            self.async_activate_scene = AsyncMock()
+            self.async_remove_scene = MagicMock()
+            self.stop_tracking = MagicMock()
+            self.async_track_lifx_entries = MagicMock(return_value=self.stop_tracking)
+            self.async_track_device_registry = MagicMock(
+                return_value=self.stop_tracking
+            )
 
     stop_discovery = MagicMock()
     tracked: dict[str, object] = {}
@@ -100,26 +118,61 @@ async def test_async_setup_entry_registers_services_and_periodic_updates(
         config_entries=SimpleNamespace(async_forward_entry_setups=AsyncMock()),
         services=SimpleNamespace(async_register=MagicMock()),
     )
-    entry = SimpleNamespace(runtime_data=None)
+    entry = SimpleNamespace(runtime_data=None, async_on_unload=MagicMock())
 
     assert await integration.async_setup_entry(hass, entry) is True
 
     coordinator = entry.runtime_data
     assert isinstance(coordinator, FakeCoordinator)
     coordinator.async_update.assert_awaited_once_with()
+    assert entry.async_on_unload.call_count == 2
+    entry.async_on_unload.assert_called_with(coordinator.stop_tracking)
     hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
         entry,
         integration.PLATFORMS,
     )
-    hass.services.async_register.assert_called_once()
+    handlers = {
+        call.args[1]: call.args[2:]
+        for call in hass.services.async_register.call_args_list
+    }
+    assert set(handlers) == {
+        SERVICE_LIFX_CEILING_SET_STATE,
+        SERVICE_LIFX_CEILING_SET_ZONES,
+        SERVICE_LIFX_CEILING_PLAY_KEYFRAMES,
+        SERVICE_LIFX_CEILING_STORE_SCENE,
+        SERVICE_LIFX_CEILING_ACTIVATE_SCENE,
+        SERVICE_LIFX_CEILING_REMOVE_SCENE,
+    }
+    assert handlers[SERVICE_LIFX_CEILING_SET_ZONES][1] is integration.SET_ZONES_SCHEMA
+    responses = {
+        call.args[1]: call.kwargs.get("supports_response")
+        for call in hass.services.async_register.call_args_list
+    }
+    assert responses[SERVICE_LIFX_CEILING_SET_STATE] is SupportsResponse.OPTIONAL
+    assert responses[SERVICE_LIFX_CEILING_SET_ZONES] is SupportsResponse.OPTIONAL
+    assert (
+        handlers[SERVICE_LIFX_CEILING_PLAY_KEYFRAMES][1]
+        is integration.PLAY_KEYFRAMES_SCHEMA
+    )
     assert coordinator.stop_discovery is stop_discovery
     assert tracked["hass"] is hass
     assert tracked["interval"] == DISCOVERY_INTERVAL
 
-    handler = hass.services.async_register.call_args.args[2]
     call = SimpleNamespace(data={"example": "value"})
-    await handler(call)
+    assert await handlers[SERVICE_LIFX_CEILING_SET_STATE][0](call) == {}
     coordinator.async_set_state.assert_awaited_once_with(call)
+    assert await handlers[SERVICE_LIFX_CEILING_SET_ZONES][0](call) == {
+        "start_spread_ms": 1.5
+    }
+    coordinator.async_set_zones.assert_awaited_once_with(call)
+    await handlers[SERVICE_LIFX_CEILING_PLAY_KEYFRAMES][0](call)
+    coordinator.async_play_keyframes.assert_awaited_once_with(call)
+    await handlers[SERVICE_LIFX_CEILING_STORE_SCENE][0](call)
+    coordinator.async_store_scene.assert_awaited_once_with(call)
+    await handlers[SERVICE_LIFX_CEILING_ACTIVATE_SCENE][0](call)
+    coordinator.async_activate_scene.assert_awaited_once_with(call)
+    await handlers[SERVICE_LIFX_CEILING_REMOVE_SCENE][0](call)
+    coordinator.async_remove_scene.assert_called_once_with(call)
 
     periodic_update = tracked["action"]
     now = object()
@@ -146,3 +199,77 @@ async def test_async_unload_entry_stops_discovery_and_unloads_platforms() -> Non
         entry,
         integration.PLATFORMS,
     )
+
+
+def test_set_zones_schema_requires_stops_or_zones() -> None:
+    """The set_zones schema should take stops or zones, but not both."""
+    data = integration.SET_ZONES_SCHEMA(
+        {"device_id": "device-1", "stops": [{"hue": 10}, {"hue": 350}]}
+    )
+
+    assert data["device_id"] == ["device-1"]
+    assert data["gradient"] == "linear"
+    assert data["stops"][0] == {
+        "hue": 10.0,
+        "saturation": 0.0,
+        "brightness": 100.0,
+        "kelvin": 3500,
+    }
+
+    with pytest.raises(vol.Invalid):
+        integration.SET_ZONES_SCHEMA({"device_id": "device-1"})
+    with pytest.raises(vol.Invalid):
+        integration.SET_ZONES_SCHEMA(
+            {
+                "device_id": "device-1",
+                "stops": [{"hue": 10}],
+                "zones": [[0, 0, 100, 3500]],
+            }
+        )
+    with pytest.raises(vol.Invalid):
+        integration.SET_ZONES_SCHEMA(
+            {"device_id": "device-1", "zones": [[0, 0, 100, 9999]]}
+        )
+
+
+def test_play_keyframes_schema_validates_every_keyframe() -> None:
+    """Each keyframe is a set_zones pattern with its own longer transition."""
+    data = integration.PLAY_KEYFRAMES_SCHEMA(
+        {
+            "device_id": "device-1",
+            "keyframes": [
+                {"stops": [{"hue": 20, "brightness": 5}]},
+                {"zones": [[40, 60, 100, 3000]], "transition": 1800},
+            ],
+        }
+    )
+
+    assert data["repeat"] is False
+    first, second = data["keyframes"]
+    assert first["transition"] == 0
+    assert first["gradient"] == "linear"
+    assert second["transition"] == 1800
+
+    with pytest.raises(vol.Invalid):
+        integration.PLAY_KEYFRAMES_SCHEMA({"device_id": "device-1", "keyframes": []})
+    with pytest.raises(vol.Invalid):
+        integration.PLAY_KEYFRAMES_SCHEMA(
+            {"device_id": "device-1", "keyframes": [{"transition": 5}]}
+        )
+
+
+def test_scene_schemas_default_to_preloading_and_every_stored_ceiling() -> None:
+    """Scenes can be stored from the current zones and activated without targets."""
+    stored = integration.STORE_SCENE_SCHEMA(
+        {"scene": "night_light", "device_id": "device-1"}
+    )
+    activated = integration.ACTIVATE_SCENE_SCHEMA({"scene": "night_light"})
+
+    assert stored["preload"] is True
+    assert "stops" not in stored
+    assert "zones" not in stored
+    assert "device_id" not in activated
+    assert activated["transition"] == 0
+
+    with pytest.raises(vol.Invalid):
+        integration.STORE_SCENE_SCHEMA({"scene": "night_light"})
@@ -10,10 +10,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS_PCT,
+    ATTR_EFFECT,
     ATTR_TRANSITION,
+    EFFECT_OFF,
     ColorMode,
 )
 
+from custom_components.lifx_ceiling import entity as entity_module
 from custom_components.lifx_ceiling.light import (
     LIFXCeilingDownlight,
     LIFXCeilingUplight,
@@ -23,7 +26,7 @@ from custom_components.lifx_ceiling.light import (
 
 @dataclass
 class FakeCeilingDevice:
-    """Test double for a LIFX ceiling device."""
+    """Test double for a LIFX ceiling device, also standing in for its zone summary."""
 
     mac_addr: str = "AA:BB:CC:DD:EE:FF"
     label: str = "Kitchen"
@@ -50,22 +53,25 @@ class FakeCoordinator:
     def __init__(self, devices: list[FakeCeilingDevice]) -> None:
         """Initialise the fake coordinator."""
         self.devices = devices
-        self.listeners: list[tuple[FakeCeilingDevice, object]] = []
+        self.listeners: list[tuple[FakeCeilingDevice, str, object]] = []
         self.data = None
         self.last_update_success = True
         self.name = "LIFX Ceiling"
-        self.set_discovery_callback = MagicMock(
-            side_effect=self._set_discovery_callback
-        )
         self.turn_downlight_on = AsyncMock()
         self.turn_downlight_off = AsyncMock()
         self.turn_uplight_on = AsyncMock()
         self.turn_uplight_off = AsyncMock()
-        self.discovery_callback = None
-
-    def async_add_listener(self, update_callback: object) -> Callable[[], None]:
+        self.effects = MagicMock()
+        self.effects.effect.return_value = None
+        self.async_start_effect = MagicMock()
+        self.async_stop_effect = AsyncMock()
+        self.discovery_listeners: list[object] = []
+
+    def async_add_listener(
+        self, update_callback: object, context: object = None
+    ) -> Callable[[], None]:
         """Provide the minimal interface CoordinatorEntity expects."""
-        del update_callback
+        del update_callback, context
 
         def _remove_listener() -> None:
             return None
@@ -73,14 +79,16 @@ class FakeCoordinator:
         return _remove_listener
 
     def async_add_core_listener(
-        self, device: FakeCeilingDevice, callback: object
-    ) -> None:
+        self, device: FakeCeilingDevice, light: str, callback: object
+    ) -> Callable[[], None]:
         """Record listeners registered by light entities."""
-        self.listeners.append((device, callback))
+        self.listeners.append((device, light, callback))
+        return MagicMock()
 
-    def _set_discovery_callback(self, callback: object) -> None:
-        """Store the discovery callback registered during setup."""
-        self.discovery_callback = callback
+    def async_add_discovery_listener(self, listener: object) -> Callable[[], None]:
+        """Store the discovery listener registered during setup."""
+        self.discovery_listeners.append(listener)
+        return MagicMock()
 
 
 @pytest.mark.asyncio
@@ -88,7 +96,7 @@ async def test_async_setup_entry_adds_both_zone_entities() -> None:
     """Setup should create both zone entities for each discovered ceiling."""
     device = FakeCeilingDevice()
     coordinator = FakeCoordinator([device])
-    entry = SimpleNamespace(runtime_data=coordinator)
+    entry = SimpleNamespace(runtime_data=coordinator, async_on_unload=MagicMock())
     entities = []
 
     def _async_add_entities(new_entities: list[object]) -> None:
@@ -103,7 +111,37 @@ async def test_async_setup_entry_adds_both_zone_entities() -> None:
     assert len(entities) == 2
     assert isinstance(entities[0], LIFXCeilingDownlight)
     assert isinstance(entities[1], LIFXCeilingUplight)
-    assert coordinator.discovery_callback is not None
+    assert len(coordinator.discovery_listeners) == 1
+    entry.async_on_unload.assert_called_once()
+
+    coordinator.discovery_listeners[0](FakeCeilingDevice())
+    assert len(entities) == 4
+
+
+@pytest.mark.asyncio
+async def test_entity_removes_itself_when_ceiling_is_removed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Entities should be removed once their ceiling's core entry unloads."""
+    coordinator = FakeCoordinator([FakeCeilingDevice()])
+    entity = LIFXCeilingUplight(coordinator, coordinator.devices[0])
+    entity.hass = MagicMock()
+    connected: dict[str, object] = {}
+
+    def _connect(hass: object, signal: str, target: object) -> MagicMock:
+        connected[signal] = target
+        return MagicMock()
+
+    monkeypatch.setattr(entity_module, "async_dispatcher_connect", _connect)
+    entity.async_remove = MagicMock()
+
+    await entity.async_added_to_hass()
+    connected["lifx_ceiling_ceiling_removed_AA:BB:CC:DD:EE:FF"]()
+
+    entity.async_remove.assert_called_once_with()
+    entity.hass.async_create_task.assert_called_once_with(
+        entity.async_remove.return_value
+    )
 
 
 def test_downlight_update_callback_sets_hs_mode() -> None:
@@ -112,7 +150,7 @@ def test_downlight_update_callback_sets_hs_mode() -> None:
     entity = LIFXCeilingDownlight(coordinator, coordinator.devices[0])
     entity.async_write_ha_state = MagicMock()
 
-    entity._update_callback()
+    entity._update_callback(coordinator.devices[0])
 
     assert entity.is_on is True
     assert entity.brightness == 120
@@ -128,7 +166,7 @@ def test_downlight_update_callback_sets_color_temp_mode() -> None:
     entity = LIFXCeilingDownlight(coordinator, coordinator.devices[0])
     entity.async_write_ha_state = MagicMock()
 
-    entity._update_callback()
+    entity._update_callback(coordinator.devices[0])
 
     assert entity.color_mode is ColorMode.COLOR_TEMP
     entity.async_write_ha_state.assert_called_once()
@@ -140,7 +178,7 @@ def test_uplight_update_callback_sets_color_temp_mode() -> None:
     entity = LIFXCeilingUplight(coordinator, coordinator.devices[0])
     entity.async_write_ha_state = MagicMock()
 
-    entity._update_callback()
+    entity._update_callback(coordinator.devices[0])
 
     assert entity.is_on is True
     assert entity.brightness == 180
@@ -156,22 +194,56 @@ def test_uplight_update_callback_sets_hs_mode() -> None:
     entity = LIFXCeilingUplight(coordinator, coordinator.devices[0])
     entity.async_write_ha_state = MagicMock()
 
-    entity._update_callback()
+    entity._update_callback(coordinator.devices[0])
 
     assert entity.color_mode is ColorMode.HS
     entity.async_write_ha_state.assert_called_once()
 
 
+def test_update_callbacks_write_state_only_when_it_changed() -> None:
+    """Polls that find the light as it was should not write its state again."""
+    device = FakeCeilingDevice()
+    coordinator = FakeCoordinator([device])
+    downlight = LIFXCeilingDownlight(coordinator, device)
+    uplight = LIFXCeilingUplight(coordinator, device)
+    downlight.async_write_ha_state = MagicMock()
+    uplight.async_write_ha_state = MagicMock()
+
+    downlight._update_callback(device)
+    uplight._update_callback(device)
+    downlight._update_callback(device)
+    uplight._update_callback(device)
+
+    assert downlight.async_write_ha_state.call_count == 1
+    assert uplight.async_write_ha_state.call_count == 1
+
+    device.uplight_brightness = 90
+    downlight._update_callback(device)
+    uplight._update_callback(device)
+
+    assert downlight.async_write_ha_state.call_count == 1
+    assert uplight.async_write_ha_state.call_count == 2
+    assert uplight.brightness == 90
+
+    coordinator.effects.effect.return_value = "flame"
+    downlight._update_callback(device)
+
+    assert downlight.async_write_ha_state.call_count == 2
+    assert downlight.effect == "flame"
+
+
 @pytest.mark.asyncio
 async def test_downlight_turn_off_defaults_transition_to_zero() -> None:
     """Turning off the downlight without a transition should use zero seconds."""
     device = FakeCeilingDevice()
     coordinator = FakeCoordinator([device])
     entity = LIFXCeilingDownlight(coordinator, device)
+    entity.async_write_ha_state = MagicMock()
 
     await entity.async_turn_off()
 
     coordinator.turn_downlight_off.assert_awaited_once_with(device, 0)
+    entity.async_write_ha_state.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -222,3 +294,64 @@ async def test_uplight_turn_on_defaults_transition_to_zero() -> None:
         0,
     )
     entity.async_write_ha_state.assert_called_once()
+
+
+def test_effect_lists_match_each_light() -> None:
+    """Each light should only offer the effects rendered on its own zones."""
+    coordinator = FakeCoordinator([FakeCeilingDevice()])
+    downlight = LIFXCeilingDownlight(coordinator, coordinator.devices[0])
+    uplight = LIFXCeilingUplight(coordinator, coordinator.devices[0])
+
+    assert downlight.effect_list == [EFFECT_OFF, "flame", "aurora"]
+    assert uplight.effect_list == [EFFECT_OFF, "breathe"]
+    assert downlight.effect == EFFECT_OFF
+
+
+@pytest.mark.asyncio
+async def test_downlight_turn_on_with_effect_starts_it_after_turning_on() -> None:
+    """An effect should start from the light's turned-on state."""
+    device = FakeCeilingDevice()
+    coordinator = FakeCoordinator([device])
+    entity = LIFXCeilingDownlight(coordinator, device)
+    entity.async_write_ha_state = MagicMock()
+
+    await entity.async_turn_on(**{ATTR_EFFECT: "flame"})
+
+    coordinator.async_stop_effect.assert_awaited_once_with(
+        device, "downlight", restore=False
+    )
+    coordinator.turn_downlight_on.assert_awaited_once()
+    coordinator.async_start_effect.assert_called_once_with(device, "downlight", "flame")
+    assert entity.effect == "flame"
+
+
+@pytest.mark.asyncio
+async def test_uplight_effect_off_restores_without_writing_a_color() -> None:
+    """Choosing the off effect should only stop and restore the running effect."""
+    device = FakeCeilingDevice()
+    coordinator = FakeCoordinator([device])
+    entity = LIFXCeilingUplight(coordinator, device)
+    entity.async_write_ha_state = MagicMock()
+
+    await entity.async_turn_on(**{ATTR_EFFECT: EFFECT_OFF})
+
+    coordinator.async_stop_effect.assert_awaited_once_with(
+        device, "uplight", restore=True
+    )
+    coordinator.turn_uplight_on.assert_not_awaited()
+    coordinator.async_start_effect.assert_not_called()
+    assert entity.effect == EFFECT_OFF
+
+
+@pytest.mark.asyncio
+async def test_turn_off_stops_a_running_effect() -> None:
+    """Turning a light off should stop its effect before writing."""
+    device = FakeCeilingDevice()
+    coordinator = FakeCoordinator([device])
+    entity = LIFXCeilingUplight(coordinator, device)
+    entity.async_write_ha_state = MagicMock()
+
+    await entity.async_turn_off()
+
+    coordinator.async_stop_effect.assert_awaited_once_with(device, "uplight")
+    coordinator.turn_uplight_off.assert_awaited_once_with(device, 0)
@@ -0,0 +1,52 @@
+"""Tests for per-device command metrics."""
+
+from __future__ import annotations
+
+from custom_components.lifx_ceiling.metrics import (
+    LATENCY_WINDOW,
+    MESSAGE_SIZES,
+    LIFXCeilingMetrics,
+)
+
+
+def test_latency_percentiles_use_nearest_rank() -> None:
+    """Percentiles should be reported in milliseconds from recent acks."""
+    metrics = LIFXCeilingMetrics()
+    assert metrics.latency_percentile(50) is None
+
+    for latency_ms in range(1, 101):
+        metrics.record_ack(latency_ms / 1000)
+
+    assert metrics.latency_percentile(50) == 50.0
+    assert metrics.latency_percentile(95) == 95.0
+    assert metrics.latency_percentile(99) == 99.0
+
+
+def test_latency_window_is_bounded() -> None:
+    """Only the most recent latencies should be kept."""
+    metrics = LIFXCeilingMetrics()
+    for _ in range(LATENCY_WINDOW):
+        metrics.record_ack(1.0)
+    for _ in range(LATENCY_WINDOW):
+        metrics.record_ack(0.01)
+
+    assert len(metrics._latencies) == LATENCY_WINDOW
+    assert metrics.latency_percentile(99) == 10.0
+
+
+def test_sends_count_bytes_and_retries() -> None:
+    """Sends should add wire bytes, and resends should count as retries."""
+    metrics = LIFXCeilingMetrics()
+
+    metrics.record_send("set64", retry=False)
+    metrics.record_send("copy_frame_buffer", retry=True)
+    metrics.record_command()
+    metrics.record_timeout()
+
+    assert (
+        metrics.bytes_sent
+        == MESSAGE_SIZES["set64"] + MESSAGE_SIZES["copy_frame_buffer"]
+    )
+    assert metrics.retries == 1
+    assert metrics.commands == 1
+    assert metrics.timeouts == 1
@@ -0,0 +1,84 @@
+"""Tests for the per-device send rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.lifx_ceiling.ratelimit import (
+    PRIORITY_COMMAND,
+    PRIORITY_CONTROL,
+    PRIORITY_POLL,
+    PRIORITY_STREAM,
+    LIFXCeilingRateLimiter,
+)
+
+
+@pytest.mark.asyncio
+async def test_bursts_go_at_once_and_the_rest_are_paced_by_priority() -> None:
+    """A full bucket sends at once; queued packets leave most urgent first."""
+    limiter = LIFXCeilingRateLimiter(rate=100, burst=2)
+    sent: list[str] = []
+
+    limiter.send(PRIORITY_COMMAND, lambda: sent.append("first"))
+    limiter.send(PRIORITY_COMMAND, lambda: sent.append("second"))
+    limiter.send(PRIORITY_POLL, lambda: sent.append("poll"))
+    limiter.send(PRIORITY_STREAM, lambda: sent.append("stream"))
+    limiter.send(PRIORITY_COMMAND, lambda: sent.append("third"))
+
+    assert sent == ["first", "second"]
+    assert limiter.queued == 3
+    assert limiter.backlog() == pytest.approx(0.03, abs=0.005)
+
+    await asyncio.sleep(0.05)
+
+    assert sent == ["first", "second", "third", "stream", "poll"]
+    assert limiter.delayed == 3
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_control_packets_are_never_held_back() -> None:
+    """Control packets overdraw the bucket, delaying what follows."""
+    limiter = LIFXCeilingRateLimiter(rate=100, burst=1)
+    sent: list[str] = []
+
+    limiter.send(PRIORITY_CONTROL, lambda: sent.append("sync-1"))
+    limiter.send(PRIORITY_CONTROL, lambda: sent.append("sync-2"))
+    await limiter.acquire(PRIORITY_CONTROL)
+    limiter.send(PRIORITY_COMMAND, lambda: sent.append("command"))
+
+    assert sent == ["sync-1", "sync-2"]
+    assert limiter.backlog() > 0.02
+    await asyncio.sleep(0.05)
+    assert sent == ["sync-1", "sync-2", "command"]
+
+
+@pytest.mark.asyncio
+async def test_only_the_latest_streamed_packets_wait() -> None:
+    """Streamed packets beyond the burst size drop the oldest queued ones."""
+    limiter = LIFXCeilingRateLimiter(rate=100, burst=2)
+    sent: list[int] = []
+
+    for frame in range(6):
+        limiter.send(PRIORITY_STREAM, lambda frame=frame: sent.append(frame))
+
+    assert limiter.dropped == 2
+    await asyncio.sleep(0.04)
+    assert sent == [0, 1, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_do_not_use_a_token() -> None:
+    """A request cancelled while queued leaves its token to the next one."""
+    limiter = LIFXCeilingRateLimiter(rate=20, burst=1)
+    await limiter.acquire(PRIORITY_COMMAND)
+
+    cancelled = asyncio.create_task(limiter.acquire(PRIORITY_COMMAND))
+    waiting = asyncio.create_task(limiter.acquire(PRIORITY_COMMAND))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 0.09)
+    assert limiter.queued == 0
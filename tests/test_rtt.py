@@ -0,0 +1,59 @@
+"""Tests for the per-device round-trip time estimator."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.lifx_ceiling.const import (
+    DEFAULT_ATTEMPTS,
+    MAX_RETRANSMIT_TIMEOUT,
+    MIN_RETRANSMIT_TIMEOUT,
+    OVERALL_TIMEOUT,
+)
+from custom_components.lifx_ceiling.rtt import LIFXCeilingRTTEstimator
+
+
+def test_timeout_defaults_to_fixed_attempt_split() -> None:
+    """Without samples the timeout should match the fixed per-attempt window."""
+    estimator = LIFXCeilingRTTEstimator()
+
+    assert estimator.timeout == pytest.approx(OVERALL_TIMEOUT / DEFAULT_ATTEMPTS)
+
+
+def test_samples_update_smoothed_rtt_and_variance() -> None:
+    """Samples should follow the RFC 6298 smoothing rules."""
+    estimator = LIFXCeilingRTTEstimator()
+
+    estimator.add_sample(0.1)
+    assert estimator.smoothed_rtt == pytest.approx(0.1)
+    assert estimator.rtt_variance == pytest.approx(0.05)
+    assert estimator.timeout == pytest.approx(0.3)
+
+    estimator.add_sample(0.2)
+    assert estimator.rtt_variance == pytest.approx(0.75 * 0.05 + 0.25 * 0.1)
+    assert estimator.smoothed_rtt == pytest.approx(0.875 * 0.1 + 0.125 * 0.2)
+    assert estimator.samples == 2
+
+
+def test_timeout_is_clamped() -> None:
+    """Very fast devices should still get the minimum timeout."""
+    estimator = LIFXCeilingRTTEstimator()
+    for _ in range(20):
+        estimator.add_sample(0.001)
+
+    assert estimator.timeout == MIN_RETRANSMIT_TIMEOUT
+
+
+def test_backoff_doubles_until_cap_and_resets_on_sample() -> None:
+    """Timeouts should back off exponentially and reset on the next sample."""
+    estimator = LIFXCeilingRTTEstimator()
+    estimator.add_sample(0.1)
+
+    estimator.backoff()
+    assert estimator.timeout == pytest.approx(0.6)
+    for _ in range(10):
+        estimator.backoff()
+    assert estimator.timeout == MAX_RETRANSMIT_TIMEOUT
+
+    estimator.add_sample(0.1)
+    assert estimator.timeout < MAX_RETRANSMIT_TIMEOUT
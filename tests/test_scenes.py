@@ -0,0 +1,52 @@
+"""Tests for the preloaded LIFX Ceiling scene registry."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.lifx_ceiling.scenes import LIFXCeilingSceneRegistry
+from custom_components.lifx_ceiling.zones import LIFXCeilingZoneBuffer
+
+
+def _device(mac_addr: str) -> Mock:
+    """Return a ceiling double that packs frames into one payload."""
+    device = Mock(mac_addr=mac_addr, label=mac_addr)
+    device.pack_frame.side_effect = lambda frame: [bytes(len(frame))]
+    return device
+
+
+def test_scenes_are_precomputed_per_ceiling() -> None:
+    """Storing a scene packs its frame once for each ceiling."""
+    registry = LIFXCeilingSceneRegistry()
+    first, second = _device("aa"), _device("bb")
+    frame = LIFXCeilingZoneBuffer.filled((1, 2, 3, 3500), 64)
+
+    registry.store("movie", first, frame)
+    registry.store("movie", second, frame, preload=True)
+
+    scene = registry.get("movie", first)
+    assert scene.colors == [(1, 2, 3, 3500)] * 64
+    assert scene.payloads == [bytes(64)]
+    first.pack_frame.assert_called_once_with(frame)
+    assert registry.names == ["movie"]
+    assert registry.mac_addrs("movie") == ["aa", "bb"]
+    assert registry.preloaded(first) is None
+    assert registry.preloaded(second) is registry.get("movie", second)
+
+
+def test_unknown_scenes_are_reported() -> None:
+    """Unknown scenes, or scenes stored for other ceilings, raise errors."""
+    registry = LIFXCeilingSceneRegistry()
+    device = _device("aa")
+    registry.store("movie", device, LIFXCeilingZoneBuffer.filled((0, 0, 0, 0), 64))
+
+    with pytest.raises(HomeAssistantError, match="Unknown scene 'cleaning'"):
+        registry.mac_addrs("cleaning")
+    with pytest.raises(HomeAssistantError, match="not stored for bb"):
+        registry.get("movie", _device("bb"))
+
+    registry.remove("movie")
+    assert registry.names == []
@@ -0,0 +1,86 @@
+"""Tests for the LIFX Ceiling metrics sensors."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.const import EntityCategory
+
+from custom_components.lifx_ceiling.metrics import LIFXCeilingMetrics
+from custom_components.lifx_ceiling.sensor import (
+    SENSOR_DESCRIPTIONS,
+    LIFXCeilingMetricsSensor,
+    async_setup_entry,
+)
+
+
+def _make_device() -> SimpleNamespace:
+    """Create a device stub carrying metrics."""
+    return SimpleNamespace(
+        mac_addr="AA:BB:CC:DD:EE:FF",
+        label="Kitchen",
+        group="Kitchen",
+        host_firmware_version="1.0",
+        model="Ceiling",
+        metrics=LIFXCeilingMetrics(),
+    )
+
+
+def _make_coordinator(devices: list[SimpleNamespace]) -> SimpleNamespace:
+    """Create a coordinator stub with a discovery listener registry."""
+    coordinator = SimpleNamespace(
+        devices=devices,
+        listeners=[],
+        last_update_success=True,
+    )
+    remove = MagicMock()
+
+    def _add_listener(listener: object) -> MagicMock:
+        coordinator.listeners.append(listener)
+        return remove
+
+    coordinator.async_add_discovery_listener = _add_listener
+    coordinator.remove_listener = remove
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_adds_sensors_for_each_ceiling() -> None:
+    """Setup should add every metric sensor now and for later discoveries."""
+    coordinator = _make_coordinator([_make_device()])
+    entry = SimpleNamespace(runtime_data=coordinator, async_on_unload=MagicMock())
+    entities: list[LIFXCeilingMetricsSensor] = []
+
+    await async_setup_entry(
+        hass=MagicMock(), entry=entry, async_add_entities=entities.extend
+    )
+
+    assert len(entities) == len(SENSOR_DESCRIPTIONS)
+    entry.async_on_unload.assert_called_once_with(coordinator.remove_listener)
+
+    coordinator.listeners[0](_make_device())
+    assert len(entities) == 2 * len(SENSOR_DESCRIPTIONS)
+
+
+def test_sensors_read_device_metrics() -> None:
+    """Sensor values should come straight from the device metrics."""
+    device = _make_device()
+    coordinator = _make_coordinator([device])
+    sensors = {
+        description.key: LIFXCeilingMetricsSensor(coordinator, device, description)
+        for description in SENSOR_DESCRIPTIONS
+    }
+    device.metrics.record_command()
+    device.metrics.record_send("set64", retry=True)
+    device.metrics.record_ack(0.02)
+
+    assert sensors["commands"].native_value == 1
+    assert sensors["retries"].native_value == 1
+    assert sensors["timeouts"].native_value == 0
+    assert sensors["bytes_sent"].native_value == 558
+    assert sensors["ack_latency_p95"].native_value == 20.0
+    assert sensors["ack_latency_p50"].unique_id == "aa:bb:cc:dd:ee:ff_ack_latency_p50"
+    assert sensors["retries"].entity_category is EntityCategory.DIAGNOSTIC
+    assert sensors["retries"].should_poll is True
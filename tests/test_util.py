@@ -21,6 +21,7 @@ from custom_components.lifx_ceiling.util import (
     find_lifx_coordinators,
     has_single_config_entry,
     hsbk_for_turn_on,
+    set64_rectangles,
 )
 
 
@@ -147,3 +148,53 @@ def test_async_get_legacy_entries_filters_out_singleton_entry() -> None:
     )
 
     assert async_get_legacy_entries(hass) == [legacy_entry]
+
+
+def _apply_set64_rectangles(
+    current: list[tuple[int, int, int, int]],
+    rectangles: list[tuple[int, int, int, list[tuple[int, int, int, int]]]],
+    width: int,
+) -> list[tuple[int, int, int, int]]:
+    """Apply set64 rectangles the way the device does, including padding."""
+    result = list(current)
+    height = len(current) // width
+    for x, y, rect_width, colors in rectangles:
+        padded = colors + [(0, 0, 0, 3500)] * (64 - len(colors))
+        for index, color in enumerate(padded):
+            row = y + index // rect_width
+            if row < height:
+                result[row * width + x + index % rect_width] = color
+    return result
+
+
+@pytest.mark.parametrize("width", [8, 16])
+def test_set64_rectangles_reproduce_target_frame(width: int) -> None:
+    """Applying the rectangles to the current frame should yield the target."""
+    zones = width * 8
+    current = [(0, 0, 100, 3500)] * zones
+    target = list(current)
+    for zone in (0, 5, width + 3, 3 * width, 3 * width + width - 1, zones - 1):
+        target[zone] = (zone, 65535, 200, 3500)
+
+    rectangles = set64_rectangles(current, target, width)
+
+    assert _apply_set64_rectangles(current, rectangles, width) == target
+
+
+def test_set64_rectangles_single_zone_is_one_narrow_rectangle() -> None:
+    """A single changed zone should produce a one-zone-wide rectangle."""
+    current = [(0, 0, 100, 3500)] * 128
+    target = [*current[:127], (1, 2, 3, 4)]
+
+    assert set64_rectangles(current, target, 16) == [(15, 7, 1, [(1, 2, 3, 4)])]
+
+
+def test_set64_rectangles_full_frame_matches_batches() -> None:
+    """A fully changed 128-zone frame should need the same two packets as before."""
+    current = [(0, 0, 0, 3500)] * 128
+    target = [(1, 1, 1, 3500)] * 128
+
+    rectangles = set64_rectangles(current, target, 16)
+
+    assert [rectangle[:3] for rectangle in rectangles] == [(0, 0, 16), (0, 4, 16)]
+    assert set64_rectangles(current, current, 16) == []
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from custom_components.lifx_ceiling.util import async_execute_lifx
+from custom_components.lifx_ceiling.metrics import MESSAGE_SIZES, LIFXCeilingMetrics
+from custom_components.lifx_ceiling.rtt import LIFXCeilingRTTEstimator
+from custom_components.lifx_ceiling.util import (
+    LIFXCeilingCommandGenerations,
+    LIFXCeilingSupersededError,
+    async_execute_lifx,
+)
 
 
 @pytest.mark.asyncio
@@ -31,3 +38,210 @@ async def test_async_execute_lifx_raises_timeout_for_unanswered_methods() -> Non
         await async_execute_lifx(method, attempts=1, overall_timeout=0)
 
     method.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_resends_only_missing_methods() -> None:
+    """Unordered retries should only resend methods that were not answered."""
+    calls: list[str] = []
+
+    def _answered(*, callb):
+        calls.append("answered")
+        callb(None, object())
+
+    def _lossy(*, callb):
+        calls.append("lossy")
+        if calls.count("lossy") > 1:
+            callb(None, object())
+
+    results = await async_execute_lifx(
+        [_answered, _lossy], attempts=2, overall_timeout=0.02
+    )
+
+    assert len(results) == 2
+    assert calls == ["answered", "lossy", "lossy"]
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_ordered_resends_from_first_missing_method() -> None:
+    """Ordered retries should resend the lost method and everything after it."""
+    calls: list[str] = []
+
+    def _make_method(name: str, *, lose_first: bool = False):
+        def _method(*, callb):
+            calls.append(name)
+            if not lose_first or calls.count(name) > 1:
+                callb(None, object())
+
+        return _method
+
+    results = await async_execute_lifx(
+        [
+            _make_method("first"),
+            _make_method("second", lose_first=True),
+            _make_method("copy"),
+        ],
+        attempts=2,
+        overall_timeout=0.02,
+        ordered=True,
+    )
+
+    assert len(results) == 3
+    assert calls == ["first", "second", "copy", "second", "copy"]
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_ordered_ignores_acks_ahead_of_pending() -> None:
+    """An ack overtaking an unanswered earlier method should trigger a resend."""
+    calls: list[str] = []
+    pending_callbacks: list = []
+
+    def _delayed(*, callb):
+        calls.append("set64")
+        pending_callbacks.append(callb)
+
+    def _copy(*, callb):
+        calls.append("copy")
+        callb(None, object())
+
+    async def _late_ack() -> None:
+        pending_callbacks[0](None, object())
+
+    task = asyncio.get_running_loop().create_task(_late_ack())
+    results = await async_execute_lifx(
+        [_delayed, _copy], attempts=1, overall_timeout=0.05, ordered=True
+    )
+    await task
+
+    assert len(results) == 2
+    assert calls == ["set64", "copy", "copy"]
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_samples_rtt_for_first_transmissions() -> None:
+    """Acks for methods sent once should feed the device RTT estimator."""
+    estimator = LIFXCeilingRTTEstimator()
+
+    def _method(*, callb):
+        callb(None, object())
+
+    await async_execute_lifx([_method, _method], rtt=estimator)
+
+    assert estimator.samples == 2
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_uses_rtt_timeout_and_skips_resent_samples() -> None:
+    """A lost packet should be retried after the RTO, not the fixed window."""
+    estimator = LIFXCeilingRTTEstimator()
+    for _ in range(8):
+        estimator.add_sample(0.001)
+    calls: list[float] = []
+    loop = asyncio.get_running_loop()
+
+    def _lossy(*, callb):
+        calls.append(loop.time())
+        if len(calls) > 1:
+            callb(None, object())
+
+    await async_execute_lifx(_lossy, rtt=estimator)
+
+    assert len(calls) == 2
+    assert calls[1] - calls[0] < 0.5
+    assert estimator.samples == 8
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_with_rtt_retries_until_overall_timeout() -> None:
+    """With an estimator, retries should continue with backoff until the deadline."""
+    estimator = LIFXCeilingRTTEstimator()
+    for _ in range(8):
+        estimator.add_sample(0.001)
+    method = Mock()
+
+    with pytest.raises(TimeoutError):
+        await async_execute_lifx(method, overall_timeout=0.5, rtt=estimator)
+
+    # 0.05 + 0.1 + 0.2 seconds, then the remaining 0.15 seconds.
+    assert method.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_records_metrics() -> None:
+    """Sends, retries, ack latencies and timeouts should be recorded."""
+    metrics = LIFXCeilingMetrics()
+    calls: list[str] = []
+
+    def set64(*, callb):
+        calls.append("set64")
+        if len(calls) > 1:
+            callb(None, object())
+
+    await async_execute_lifx(set64, attempts=2, overall_timeout=0.02, metrics=metrics)
+
+    assert metrics.commands == 1
+    assert metrics.retries == 1
+    assert metrics.bytes_sent == 2 * MESSAGE_SIZES["set64"]
+    # The only ack was for a resent request, so it gives no latency sample.
+    assert metrics.latency_percentile(50) is None
+
+    with pytest.raises(TimeoutError):
+        await async_execute_lifx(Mock(), attempts=1, overall_timeout=0, metrics=metrics)
+
+    assert metrics.commands == 2
+    assert metrics.timeouts == 1
+    assert [trace.retries for trace in metrics.traces] == [1, 0]
+    assert [trace.timed_out for trace in metrics.traces] == [False, True]
+    assert metrics.traces[0].methods == ("set64",)
+
+
+@pytest.mark.asyncio
+async def test_async_execute_lifx_stops_retrying_when_superseded() -> None:
+    """A newer command should cancel the pending requests and their retries."""
+    generations = LIFXCeilingCommandGenerations()
+    metrics = LIFXCeilingMetrics()
+    method = Mock()
+
+    task = asyncio.create_task(
+        async_execute_lifx(
+            method,
+            attempts=5,
+            overall_timeout=5,
+            metrics=metrics,
+            generations=generations,
+        )
+    )
+    await asyncio.sleep(0)
+    generations.supersede()
+
+    with pytest.raises(LIFXCeilingSupersededError, match="1 requests were superseded"):
+        await asyncio.wait_for(task, 0.1)
+
+    method.assert_called_once()
+    assert generations.current == 1
+    assert metrics.timeouts == 0
+    assert metrics.traces[0].timed_out is False
+
+
+@pytest.mark.asyncio
+async def test_command_generations_settle_once_a_later_command_completes() -> None:
+    """A superseded command leaves the ceiling unsettled until the next one lands."""
+    generations = LIFXCeilingCommandGenerations()
+    task = asyncio.create_task(
+        async_execute_lifx(
+            Mock(), attempts=5, overall_timeout=5, generations=generations
+        )
+    )
+    await asyncio.sleep(0)
+    assert generations.settled is False
+
+    generations.supersede()
+    with pytest.raises(LIFXCeilingSupersededError):
+        await task
+    assert generations.settled is False
+
+    def _method(*, callb):
+        callb(None, object())
+
+    await async_execute_lifx(_method, overall_timeout=0.01, generations=generations)
+    assert generations.settled is True
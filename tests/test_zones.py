@@ -0,0 +1,77 @@
+"""Tests for the LIFX Ceiling zone buffer."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.lifx_ceiling.zones import LIFXCeilingZoneBuffer
+
+
+def test_zone_buffer_round_trips_hsbk_tuples() -> None:
+    """A buffer should expose the same zones it was created from."""
+    colors = [(index, index + 1, index + 2, 3500) for index in range(128)]
+
+    frame = LIFXCeilingZoneBuffer.from_colors(colors)
+
+    assert len(frame) == 128
+    assert frame[0] == (0, 1, 2, 3500)
+    assert frame[-1] == (127, 128, 129, 3500)
+    assert frame[:2] == colors[:2]
+    assert frame.colors(64, 128) == colors[64:]
+    assert list(frame) == colors
+    assert frame == colors
+    assert frame == LIFXCeilingZoneBuffer.from_colors(colors)
+
+    with pytest.raises(IndexError):
+        frame[128]
+
+
+def test_zone_buffer_copies_are_independent() -> None:
+    """Creating a buffer from another buffer should not share storage."""
+    frame = LIFXCeilingZoneBuffer.filled((1, 2, 3, 4), 64)
+
+    other = LIFXCeilingZoneBuffer.from_colors(frame)
+    other[0] = (9, 9, 9, 9)
+
+    assert frame[0] == (1, 2, 3, 4)
+    assert other[0] == (9, 9, 9, 9)
+
+
+def test_zone_buffer_fill_and_zero_brightness_apply_to_ranges() -> None:
+    """Range operations should only touch the requested zones."""
+    frame = LIFXCeilingZoneBuffer.filled((100, 200, 300, 3500), 64)
+
+    frame.fill((1, 2, 3, 4), start=10, stop=12)
+    frame.zero_brightness(stop=63)
+
+    assert frame[9] == (100, 200, 0, 3500)
+    assert frame[10] == (1, 2, 0, 4)
+    assert frame[12] == (100, 200, 0, 3500)
+    assert frame[63] == (100, 200, 300, 3500)
+    assert frame.max_brightness(stop=63) == 0
+    assert frame.max_brightness() == 300
+
+
+def test_zone_buffer_scale_brightness_clamps_to_uint16() -> None:
+    """Scaling brightness should round and clamp to the valid HSBK range."""
+    frame = LIFXCeilingZoneBuffer.from_colors([(0, 0, 1000, 3500), (0, 0, 40000, 3500)])
+
+    frame.scale_brightness(0.5)
+    assert frame.colors() == [(0, 0, 500, 3500), (0, 0, 20000, 3500)]
+
+    frame.scale_brightness(4)
+    assert frame.colors() == [(0, 0, 2000, 3500), (0, 0, 65535, 3500)]
+
+
+def test_zone_buffer_write_overwrites_consecutive_zones() -> None:
+    """Writing colors should replace only the zones from start onwards."""
+    frame = LIFXCeilingZoneBuffer.filled((0, 0, 0, 3500), 4)
+
+    frame.write([(1, 2, 3, 4), (5, 6, 7, 8)], start=1)
+
+    assert frame.colors() == [
+        (0, 0, 0, 3500),
+        (1, 2, 3, 4),
+        (5, 6, 7, 8),
+        (0, 0, 0, 3500),
+    ]